@@ -0,0 +1,127 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import re
+import time
+from typing import List
+
+from src.block_classifier import classify_block
+from utils.logger import get_logger
+
+#create logger
+logger = get_logger("benchmark_block_classifier")
+
+
+def legacy_is_financial_header(text: str) -> bool:
+    text_upper = text.upper()
+    header_patterns = [
+        'CONSOLIDATED STATEMENT OF COMPREHENSIVE INCOME',
+        'STATEMENT OF COMPREHENSIVE INCOME',
+        'STATEMENT OF PROFIT OR LOSS AND OTHER COMPREHENSIVE INCOME',
+        'STATEMENT OF PROFIT OR LOSS',
+        'CONSOLIDATED STATEMENT OF PROFIT OR LOSS',
+        'STATEMENT OF FINANCIAL POSITION',
+        'CONSOLIDATED STATEMENT OF FINANCIAL POSITION',
+        'STATEMENT OF CASH FLOWS',
+        'CONSOLIDATED STATEMENT OF CASH FLOWS',
+        'BALANCE SHEET',
+        'INCOME STATEMENT',
+        'NOTE', 'NOTES TO THE FINANCIAL STATEMENTS',
+        'NOTES TO THE CONSOLIDATED FINANCIAL STATEMENTS'
+    ]
+    return any(pattern in text_upper for pattern in header_patterns)
+
+
+def legacy_is_financial_table_row(text: str) -> bool:
+    pattern = r'^[A-Za-z\s&,().-]+\s+[\d,\(\)\-\s.]+[\d,\(\)\-\s.]*$'
+    return bool(re.match(pattern, text)) and any(char.isdigit() for char in text)
+
+
+def legacy_contains_financial_data(text: str) -> bool:
+    financial_keywords = [
+        'revenue', 'income', 'expense', 'profit', 'loss', 'assets', 'liabilities',
+        'cash', 'dividend', 'interest', 'tax', 'total', 'net', 'gross'
+    ]
+    text_lower = text.lower()
+    has_keyword = any(keyword in text_lower for keyword in financial_keywords)
+    has_numbers = bool(re.search(r'\d+[,.]?\d*', text))
+    return has_keyword and has_numbers
+
+
+def legacy_classify_block(text: str) -> str:
+    if legacy_is_financial_header(text):
+        return 'header'
+    elif legacy_is_financial_table_row(text):
+        return 'table_row'
+    elif legacy_contains_financial_data(text):
+        return 'financial_data'
+    return 'paragraph'
+
+
+LABELS = [
+    "Revenue", "Other income", "Employee benefits expense", "Finance costs",
+    "Total assets", "Trade and other payables", "Net cash from operating activities",
+    "Income tax expense", "Dividends paid", "Property, plant & equipment (net)",
+]
+WORDS = [
+    "the", "company", "directors", "report", "group", "audit", "year", "ended",
+    "accordance", "standards", "proﬁt", "ﬁnancial", "Ümit", "statement", "assetstatement", "²⁰²⁴",
+]
+HEADINGS = [
+    "Consolidated Statement of Financial Position", "STATEMENT OF CASH FLOWS",
+    "Notes to the financial statements", "Balance Sheet as at 30 June 2024",
+    "Statement of ﬁnancial position",
+]
+
+
+def make_block(rng: random.Random) -> str:
+    kind = rng.random()
+    if kind < 0.05:
+        return rng.choice(HEADINGS)
+    if kind < 0.45:
+        values = " ".join(rng.choice(["{:,}", "({:,})", "{:,}.5"]).format(rng.randint(1, 99999)) for _ in range(rng.randint(1, 4)))
+        return f"{rng.choice(LABELS)} {values}"
+    if kind < 0.6:
+        return f"{rng.choice(LABELS)} increased by {rng.randint(1, 40)}% compared to {rng.randint(2019, 2024)}"
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 60)))
+
+
+def make_blocks(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    return [make_block(rng) for _ in range(count)]
+
+
+def time_labels(classify, blocks: List[str]):
+    st = time.perf_counter()
+    labels = [classify(block) for block in blocks]
+    return labels, time.perf_counter() - st
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the compiled block classifier against the legacy checks")
+    parser.add_argument("--blocks", type=int, default=200_000, help="number of text blocks (~40 per page)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    blocks = make_blocks(args.blocks, args.seed)
+
+    legacy_labels, legacy_time = time_labels(legacy_classify_block, blocks)
+    compiled_labels, compiled_time = time_labels(classify_block, blocks)
+
+    mismatches = [(block, legacy, compiled) for block, legacy, compiled in zip(blocks, legacy_labels, compiled_labels) if legacy != compiled]
+    if mismatches:
+        for block, legacy, compiled in mismatches[:10]:
+            logger.error(f"Label mismatch: legacy={legacy} compiled={compiled} | {block[:80]}")
+        sys.exit(1)
+
+    logger.info(f"Blocks: {len(blocks)} | labels identical")
+    logger.info(f"Legacy:   {legacy_time:.3f}s ({legacy_time / len(blocks) * 1e6:.2f}us/block)")
+    logger.info(f"Compiled: {compiled_time:.3f}s ({compiled_time / len(blocks) * 1e6:.2f}us/block)")
+    logger.info(f"Speedup:  {legacy_time / compiled_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
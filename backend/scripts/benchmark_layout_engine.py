@@ -0,0 +1,94 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import time
+from typing import List
+
+from src.layout_engine import grid_text, layout_lines
+from src.page_model import WordColumns
+from utils.logger import get_logger
+
+#create logger
+logger = get_logger("benchmark_layout_engine")
+
+LABELS = [
+    "Revenue", "Other income", "Employee benefits expense", "Finance costs",
+    "Total assets", "Trade and other payables", "Net cash from operating activities",
+    "Income tax expense", "Dividends paid", "Property, plant & equipment",
+]
+CHAR_WIDTH = 5.0
+LINE_HEIGHT = 12.0
+COLUMNS = (400.0, 480.0)
+
+
+def make_statement_page(rng: random.Random, page_num: int, rows: int) -> WordColumns:
+    texts: List[str] = []
+    bboxes: List[List[float]] = []
+
+    def add(text: str, x0: float, y: float):
+        # small vertical jitter, as in real PDFs
+        y += rng.uniform(-1.0, 1.0)
+        texts.append(text)
+        bboxes.append([x0, y, x0 + CHAR_WIDTH * len(text), y + LINE_HEIGHT - 2])
+
+    def add_right(text: str, x1: float, y: float):
+        add(text, x1 - CHAR_WIDTH * len(text), y)
+
+    add("Statement", 50, 40)
+    add("of", 102, 40)
+    add("profit", 117, 40)
+    add("or", 150, 40)
+    add("loss", 163, 40)
+    add("Note", 330, 70)
+    add_right("2024", COLUMNS[0], 70)
+    add_right("2023", COLUMNS[1], 70)
+
+    for row in range(rows):
+        y = 90 + row * LINE_HEIGHT * 1.5
+        x = 50.0
+        for word in rng.choice(LABELS).split(" "):
+            add(word, x, y)
+            x += CHAR_WIDTH * (len(word) + 1)
+        if rng.random() < 0.3:
+            add(str(rng.randint(1, 30)), 335, y)
+        for column in COLUMNS:
+            add_right(rng.choice(["{:,}", "({:,})", "{:,}.5"]).format(rng.randint(1, 99999)), column, y)
+
+    return WordColumns.from_texts(page_num, texts, bboxes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark line/cell clustering and grid building")
+    parser.add_argument("--words", type=int, default=100_000, help="approximate words per document")
+    parser.add_argument("--rows", type=int, default=40, help="statement rows per page")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    pages = []
+    total = 0
+    while total < args.words:
+        page = make_statement_page(rng, len(pages), args.rows)
+        pages.append(page)
+        total += len(page)
+
+    st = time.perf_counter()
+    lines = sum(len(layout_lines(page)) for page in pages)
+    layout_time = time.perf_counter() - st
+
+    st = time.perf_counter()
+    text = grid_text(pages)
+    grid_time = time.perf_counter() - st
+
+    raw_chars = sum(len(page.text) for page in pages)
+    logger.info(f"Pages: {len(pages)} | words: {total} | lines: {lines}")
+    logger.info(f"Line/cell clustering: {layout_time * 1000:.1f}ms ({layout_time / total * 1e6:.2f}us/word)")
+    logger.info(f"Grid text:            {grid_time * 1000:.1f}ms ({len(text)} chars vs {raw_chars} raw)")
+    logger.info("Sample rows:\n" + "\n".join(text.splitlines()[:6]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from llama_cpp import Llama
+
+from src.config import MODELS
+from src.llm_extractor import LLMExtractor
+from src.prompt_cache import PrefixStateCache
+from utils.logger import get_logger
+
+#create logger
+logger = get_logger("benchmark_prompt_prefix")
+
+SECTION_TYPES = ["profit_loss", "balance_sheet", "cash_flow"]
+SAMPLE_ROWS = [
+    "Revenue | 3 | 233.3 | 175.9",
+    "Other income | 4 | 12.1 | 9.8",
+    "Employee benefits expense | | (88.4) | (71.2)",
+    "Finance costs | 5 | (6.3) | (5.9)",
+    "Profit before income tax | | 52.7 | 40.1",
+    "Income tax expense | 6 | (15.8) | (12.0)",
+]
+
+
+def time_to_first_token(llm: Llama, prompt: str) -> float:
+    st = time.perf_counter()
+    for _ in llm(prompt, max_tokens=1, temperature=0.0, stream=True):
+        break
+    return time.perf_counter() - st
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time-to-first-token with and without saved prompt prefix states")
+    parser.add_argument("--runs", type=int, default=3, help="calls per statement type and mode")
+    parser.add_argument("--rows", type=int, default=30, help="statement rows in the prompt text")
+    args = parser.parse_args()
+
+    settings = MODELS["mistral"]
+    llm = Llama(
+        model_path=settings["model_path"],
+        n_ctx=settings["n_ctx"],
+        n_gpu_layers=settings["n_gpu_layers"],
+        n_threads=4,
+        verbose=False
+    )
+
+    # prompts are built the same way as in the extractor, without loading its model
+    extractor = LLMExtractor.__new__(LLMExtractor)
+    metadata = {"currency": "AUD", "rounding": "millions"}
+    text = "\n".join(SAMPLE_ROWS[i % len(SAMPLE_ROWS)] for i in range(args.rows))
+    cache = PrefixStateCache(llm, Path(settings["model_path"]).name)
+
+    cold, warm = [], []
+    for section_type in SECTION_TYPES:
+        prefix = extractor.extraction_prompt_prefix(section_type)
+        prompt = prefix + extractor.extraction_prompt_suffix(text, metadata)
+
+        for _ in range(args.runs):
+            llm.reset()
+            cold.append(time_to_first_token(llm, prompt))
+
+        cache.restore(prefix)
+        for _ in range(args.runs):
+            st = time.perf_counter()
+            cache.restore(prefix)
+            restore_time = time.perf_counter() - st
+            warm.append(restore_time + time_to_first_token(llm, prompt))
+
+    logger.info(f"Prompt: {len(llm.tokenize(prompt.encode('utf-8')))} tokens, prefix {len(llm.tokenize(prefix.encode('utf-8')))} tokens")
+    logger.info(f"TTFT without prefix state: median {statistics.median(cold) * 1000:.0f}ms")
+    logger.info(f"TTFT with prefix state:    median {statistics.median(warm) * 1000:.0f}ms (restore included)")
+    logger.info(f"Prefix cache: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
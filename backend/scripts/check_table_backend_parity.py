@@ -0,0 +1,100 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
+from pathlib import Path
+from typing import List
+
+import fitz
+from transformers import AutoImageProcessor, AutoModelForObjectDetection
+
+from src.config import MODELS
+from src.page_engine import render_page_array
+from src.table_backends import BACKENDS, TorchTableBackend, build_table_backend, compare_detections, detect_tables_with
+from utils.logger import get_logger
+
+#create logger
+logger = get_logger("check_table_backend_parity")
+
+
+def load_model():
+    settings = MODELS["table_transformer"]
+    processor = AutoImageProcessor.from_pretrained(settings["name"], cache_dir=settings["cache_dir"])
+    model = AutoModelForObjectDetection.from_pretrained(settings["name"], cache_dir=settings["cache_dir"])
+    model.eval()
+    return processor, model
+
+
+def render_sample_pages(pdf_paths: List[Path], max_pages: int) -> List[tuple]:
+    pages = []
+    for pdf_path in pdf_paths:
+        with fitz.open(pdf_path) as doc:
+            for page_num in range(min(max_pages, len(doc))):
+                pages.append((pdf_path.name, page_num, render_page_array(doc[page_num])))
+    return pages
+
+
+def timed_detect(backend, processor, id2label, image, threshold):
+    st = time.perf_counter()
+    tables = detect_tables_with(backend, processor, id2label, [image], threshold)[0]
+    return tables, time.perf_counter() - st
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare a CPU table backend against the fp32 torch path")
+    parser.add_argument("pdfs", nargs="+", type=Path)
+    parser.add_argument("--backend", choices=[b for b in BACKENDS if b != "torch"], default="int8")
+    parser.add_argument("--max-pages", type=int, default=10)
+    parser.add_argument("--iou", type=float, default=0.9)
+    parser.add_argument("--score-tolerance", type=float, default=0.05)
+    args = parser.parse_args()
+
+    settings = {**MODELS["table_transformer"], "device": "cpu", "backend": args.backend}
+    threshold = settings.get("threshold", 0.7)
+
+    processor, reference_model = load_model()
+    _, candidate_model = load_model()
+    id2label = reference_model.config.id2label
+
+    reference = TorchTableBackend(reference_model, "cpu")
+    candidate = build_table_backend(candidate_model, settings)
+    if candidate.name != args.backend:
+        logger.error(f"Backend '{args.backend}' could not be set up")
+        sys.exit(1)
+
+    pages = render_sample_pages(args.pdfs, args.max_pages)
+    if not pages:
+        logger.error("No pages to compare")
+        sys.exit(1)
+
+    # warm-up so one-off initialisation is not counted as page latency
+    timed_detect(reference, processor, id2label, pages[0][2], threshold)
+    timed_detect(candidate, processor, id2label, pages[0][2], threshold)
+
+    failures = 0
+    reference_time = 0.0
+    candidate_time = 0.0
+    for name, page_num, image in pages:
+        expected, ref_elapsed = timed_detect(reference, processor, id2label, image, threshold)
+        actual, cand_elapsed = timed_detect(candidate, processor, id2label, image, threshold)
+        reference_time += ref_elapsed
+        candidate_time += cand_elapsed
+
+        report = compare_detections(expected, actual, args.iou, args.score_tolerance)
+        if not report["parity"]:
+            failures += 1
+        logger.info(f"{name} p{page_num}: {report} fp32={ref_elapsed * 1000:.0f}ms {args.backend}={cand_elapsed * 1000:.0f}ms")
+
+    logger.info(
+        f"{len(pages)} pages, {failures} without parity; "
+        f"fp32 {reference_time / len(pages) * 1000:.0f} ms/page, "
+        f"{args.backend} {candidate_time / len(pages) * 1000:.0f} ms/page "
+        f"({reference_time / candidate_time:.2f}x)"
+    )
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,22 @@
-from .config import get_settings
-from .models import (
-    FinancialStatement,
-    LineItem,
-    ExtractionResult,
-    ProcessingStatus
-)
-from .database import db
-from .pipeline import get_pipeline, get_pipeline_sync
-from utils.logger import get_logger
+import importlib
 
 __version__ = "1.0.0"
 
+# Exports are imported on first access. Page and OCR worker processes import
+# modules from this package, and must not connect to the database or load
+# the ML models just because the package was imported.
+_EXPORTS = {
+    'get_settings': '.config',
+    'FinancialStatement': '.models',
+    'LineItem': '.models',
+    'ExtractionResult': '.models',
+    'ProcessingStatus': '.models',
+    'db': '.database',
+    'get_pipeline': '.pipeline',
+    'get_pipeline_sync': '.pipeline',
+    'get_logger': 'utils.logger'
+}
+
 __all__ = [
     'get_settings',
     'FinancialStatement',
@@ -21,4 +27,13 @@ __all__ = [
     'get_pipeline',
     'get_pipeline_sync',
     'logger'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__ if module.startswith('.') else None), name)
+    globals()[name] = value
+    return value
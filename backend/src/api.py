@@ -18,6 +18,8 @@ from .config import (
     get_settings
 )
 from .pipeline import get_pipeline
+from .model_registry import get_model_registry
+from .page_scheduler import current_page_scheduler
 from .database import db
 from .models import ExtractionResult, ProcessingStatus, UploadResponse, StatusResponse, DocumentSummary, HealthResponse, ErrorResponse 
 from utils.logger import get_logger
@@ -313,6 +315,20 @@ async def clear_results():
         logger.error(f"Clear results error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to clear results: {str(e)}")
 
+@app.delete("/cache")
+async def clear_cache(file_hash: Optional[str] = None, pipeline = Depends(get_pipeline_instance)):
+    try:
+        cleared_count = pipeline.invalidate_cache(file_hash)
+
+        return {
+            "message": f"Cache cleared successfully. Removed {cleared_count} cached results.",
+            "cleared_count": cleared_count
+        }
+
+    except Exception as e:
+        logger.error(f"Clear cache error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to clear cache: {str(e)}")
+
 @app.get("/upload-queue")
 async def get_upload_queue():
     try:
@@ -479,11 +495,12 @@ async def health_check():
             pipeline = await get_pipeline_instance()
             pipeline_ready = True
             
-            models_loaded = (
+            # models load on first use; a cold server is ready as long as
+            # every registered model can still load
+            models_loaded = bool(
                 pipeline.pdf_processor and 
-                pipeline.pdf_processor.models_loaded and
                 pipeline.llm_extractor and 
-                pipeline.llm_extractor.model_loaded
+                get_model_registry().ready()
             )
         except Exception as e:
             logger.warning(f"Pipeline health check failed: {e}")
@@ -503,13 +520,17 @@ async def health_check():
             models_loaded
         ) else "unhealthy"
         
+        scheduler = current_page_scheduler()
+
         return HealthResponse(
             status=overall_status,
             timestamp=datetime.utcnow().isoformat(),
             database=db_health,
             models_loaded=models_loaded,
             pipeline_ready=pipeline_ready,
-            system_info=system_info
+            system_info=system_info,
+            models=get_model_registry().health(),
+            page_scheduler=scheduler.stats() if scheduler is not None else {}
         )
         
     except Exception as e:
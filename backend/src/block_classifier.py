@@ -0,0 +1,85 @@
+import re
+from typing import Dict, Iterable
+
+FINANCIAL_HEADERS = (
+    'CONSOLIDATED STATEMENT OF COMPREHENSIVE INCOME',
+    'STATEMENT OF COMPREHENSIVE INCOME',
+    'STATEMENT OF PROFIT OR LOSS AND OTHER COMPREHENSIVE INCOME',
+    'STATEMENT OF PROFIT OR LOSS',
+    'CONSOLIDATED STATEMENT OF PROFIT OR LOSS',
+    'STATEMENT OF FINANCIAL POSITION',
+    'CONSOLIDATED STATEMENT OF FINANCIAL POSITION',
+    'STATEMENT OF CASH FLOWS',
+    'CONSOLIDATED STATEMENT OF CASH FLOWS',
+    'BALANCE SHEET',
+    'INCOME STATEMENT',
+    'NOTE', 'NOTES TO THE FINANCIAL STATEMENTS',
+    'NOTES TO THE CONSOLIDATED FINANCIAL STATEMENTS'
+)
+
+FINANCIAL_KEYWORDS = (
+    'revenue', 'income', 'expense', 'profit', 'loss', 'assets', 'liabilities',
+    'cash', 'dividend', 'interest', 'tax', 'total', 'net', 'gross'
+)
+
+HEADER = 'header'
+TABLE_ROW = 'table_row'
+FINANCIAL_DATA = 'financial_data'
+PARAGRAPH = 'paragraph'
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """Build a prefix-factored alternation that matches if any word occurs.
+
+    Only presence matters, so a word that extends a shorter one is dropped
+    ('NOTE' already covers the NOTES headings). The regex engine then walks
+    the shared prefixes once per position instead of retrying every word.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        if '' in node:
+            return ''
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+
+    return build(trie)
+
+
+_HEADER_RE = re.compile(trie_pattern(FINANCIAL_HEADERS))
+_KEYWORD_RE = re.compile(trie_pattern(FINANCIAL_KEYWORDS))
+_DIGIT_RE = re.compile(r'\d')
+# same language as the original '[...]+[...]*$' tail without the nested quantifier
+_TABLE_ROW_RE = re.compile(r'^[A-Za-z\s&,().-]+\s+[\d,\(\)\-\s.]+$')
+
+
+def classify_block(text: str) -> str:
+    # Case folding stays on str.upper()/lower() rather than re.IGNORECASE so
+    # ligatures such as 'ﬁ' expand exactly as they did in the per-keyword checks.
+    if _HEADER_RE.search(text.upper()):
+        return HEADER
+    # rows and financial data both need a digit, so most prose stops here
+    if _DIGIT_RE.search(text) is None:
+        return PARAGRAPH
+    if _TABLE_ROW_RE.match(text):
+        return TABLE_ROW
+    if _KEYWORD_RE.search(text.lower()):
+        return FINANCIAL_DATA
+    return PARAGRAPH
+
+
+def is_financial_header(text: str) -> bool:
+    return _HEADER_RE.search(text.upper()) is not None
+
+
+def is_financial_table_row(text: str) -> bool:
+    return _TABLE_ROW_RE.match(text) is not None and any(char.isdigit() for char in text)
+
+
+def contains_financial_data(text: str) -> bool:
+    return _KEYWORD_RE.search(text.lower()) is not None and _DIGIT_RE.search(text) is not None
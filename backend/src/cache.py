@@ -0,0 +1,260 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import EXTRACTION_SETTINGS, MODELS, PROMPT_VERSION, RESULT_CACHE
+from .models import ExtractionResult
+from utils.logger import get_logger
+
+logger = get_logger("cache")
+
+
+def file_sha256(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DiskLRUCache:
+    """Byte-value cache stored as one file per key, evicted by total size.
+
+    Recency is tracked in memory and mirrored to file mtimes so the order
+    survives restarts. The lock guards only the in-memory index; files are
+    read, written and deleted outside it. Callers may keep a small value
+    per entry in the index (``meta``); it lives in memory only and is
+    dropped with the entry.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int, suffix: str = ".bin"):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[str, int]" = OrderedDict()
+        self.meta: Dict[str, Any] = {}
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def _load_index(self):
+        files = []
+        for path in self.cache_dir.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+                files.append((stat.st_mtime, path.name[:-len(self.suffix)], stat.st_size))
+            except OSError:
+                continue
+
+        for _, key, size in sorted(files):
+            self.entries[key] = size
+            self.total_bytes += size
+
+    def __contains__(self, key: str) -> bool:
+        with self.lock:
+            return key in self.entries
+
+    def get_meta(self, key: str) -> Any:
+        with self.lock:
+            return self.meta.get(key)
+
+    def set_meta(self, key: str, value: Any):
+        with self.lock:
+            if key in self.entries:
+                self.meta[key] = value
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            # evicted or replaced by another thread since the index was checked
+            with self.lock:
+                self.misses += 1
+                if not path.exists():
+                    self._forget(key)
+            return None
+
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+            self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes, meta: Any = None) -> bool:
+        if len(data) > self.max_bytes:
+            logger.warning(f"Cache entry {key} ({len(data)} bytes) exceeds the cache size limit, not stored")
+            return False
+
+        path = self._path(key)
+        # one temp file per writer, so concurrent puts of a key do not collide
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {key}: {str(e)}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes -= self.entries.pop(key)
+            self.entries[key] = len(data)
+            self.total_bytes += len(data)
+            if meta is not None:
+                self.meta[key] = meta
+            else:
+                self.meta.pop(key, None)
+            evicted = self._evict()
+
+        self._unlink(evicted)
+        return True
+
+    def _evict(self) -> List[str]:
+        evicted = []
+        while self.total_bytes > self.max_bytes and self.entries:
+            oldest = next(iter(self.entries))
+            self._forget(oldest)
+            evicted.append(oldest)
+            logger.info(f"Evicted cache entry {oldest}")
+        return evicted
+
+    def _forget(self, key: str):
+        # index only; the caller deletes the file once the lock is released
+        self.total_bytes -= self.entries.pop(key, 0)
+        self.meta.pop(key, None)
+
+    def _unlink(self, keys: List[str]):
+        for key in keys:
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+    def invalidate(self, key: Optional[str] = None) -> int:
+        with self.lock:
+            if key is not None:
+                keys = [key] if key in self.entries else []
+            else:
+                keys = list(self.entries)
+            for cached_key in keys:
+                self._forget(cached_key)
+        self._unlink(keys)
+        return len(keys)
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        with self.lock:
+            keys = [key for key in self.entries if key.startswith(prefix)]
+            for key in keys:
+                self._forget(key)
+        self._unlink(keys)
+        return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "size_mb": round(self.total_bytes / (1024 * 1024), 2),
+                "max_size_mb": round(self.max_bytes / (1024 * 1024), 2),
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+class ResultCache:
+    """Caches the ExtractionResult by PDF content hash.
+
+    Only the result is stored, as JSON; a hit needs nothing else. Keys also
+    include the model and prompt versions and the extraction settings that
+    shape prompts, so changing any of them makes old entries unreachable and
+    they age out through LRU eviction.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.store = DiskLRUCache(cache_dir, max_bytes, suffix=".json")
+        self.version = self.pipeline_version()
+
+    @staticmethod
+    def pipeline_version() -> str:
+        parts = [
+            Path(MODELS["mistral"]["model_path"]).name,
+            MODELS["table_transformer"]["name"],
+            MODELS["table_transformer"].get("backend", "torch"),
+            PROMPT_VERSION,
+            f"grid={EXTRACTION_SETTINGS.get('layout_grid', False)}",
+            f"crop={EXTRACTION_SETTINGS.get('crop_sections', False)}",
+            f"stream={EXTRACTION_SETTINGS.get('stream_sections', False)}"
+        ]
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()[:12]
+
+    def key_for(self, file_hash: str) -> str:
+        return f"{file_hash}_{self.version}"
+
+    @staticmethod
+    def cacheable(result: ExtractionResult, sections_found: int) -> bool:
+        # a partial result, e.g. one statement lost to a transient LLM error,
+        # would be served for every later upload of the same file
+        if result.status != "completed" or result.errors:
+            return False
+        return len(result.statements) >= max(1, sections_found)
+
+    def get(self, file_hash: str) -> Optional[ExtractionResult]:
+        data = self.store.get(self.key_for(file_hash))
+        if data is None:
+            return None
+
+        try:
+            return ExtractionResult.model_validate_json(data)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry for {file_hash}: {str(e)}")
+            self.store.invalidate(self.key_for(file_hash))
+            return None
+
+    def put(self, file_hash: str, result: ExtractionResult) -> bool:
+        try:
+            payload = result.model_dump_json().encode("utf-8")
+        except Exception as e:
+            logger.warning(f"Failed to serialize cache entry for {file_hash}: {str(e)}")
+            return False
+        return self.store.put(self.key_for(file_hash), payload)
+
+    def invalidate(self, file_hash: Optional[str] = None) -> int:
+        if file_hash is None:
+            return self.store.invalidate()
+        return self.store.invalidate_prefix(f"{file_hash}_")
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.store.stats(), "version": self.version}
+
+
+result_cache = None
+result_cache_lock = threading.Lock()
+
+def get_result_cache() -> Optional[ResultCache]:
+    global result_cache
+    if not RESULT_CACHE["enabled"]:
+        return None
+    with result_cache_lock:
+        if result_cache is None:
+            result_cache = ResultCache(
+                Path(RESULT_CACHE["dir"]),
+                max_bytes=RESULT_CACHE["max_size_mb"] * 1024 * 1024
+            )
+        return result_cache
@@ -15,9 +15,10 @@ MODELS_DIR = BASE_DIR / "models"
 UPLOAD_DIR = DATA_DIR / "uploads"
 OUTPUT_DIR = DATA_DIR / "outputs"
 LOGS_DIR = DATA_DIR / "logs"
+CACHE_DIR = DATA_DIR / "cache"
 
 # create dirs 
-for dir_path in [DATA_DIR, MODELS_DIR, UPLOAD_DIR, OUTPUT_DIR, LOGS_DIR]:
+for dir_path in [DATA_DIR, MODELS_DIR, UPLOAD_DIR, OUTPUT_DIR, LOGS_DIR, CACHE_DIR]:
     try:
         dir_path.mkdir(parents=True, exist_ok=True)
         logger.info(f"Directory structure is created.")
@@ -49,7 +50,26 @@ MODELS = {
     "table_transformer": {
         "name": "microsoft/table-transformer-detection",
         "cache_dir": str(MODELS_DIR),
-        "device": "cuda" if USE_GPU else "cpu"
+        "device": "cuda" if USE_GPU else "cpu",
+        "threshold": 0.7,
+        "batching": True,
+        "max_batch_size": int(os.getenv("TABLE_MAX_BATCH_SIZE", 8)),
+        "max_wait_ms": float(os.getenv("TABLE_MAX_WAIT_MS", 20)),
+        # "torch" (fp32 eager), "int8" (dynamic quantization) or "onnx" (ONNX Runtime); CPU only
+        "backend": os.getenv("TABLE_BACKEND", "torch"),
+        "onnx_path": str(MODELS_DIR / "table-transformer-detection.onnx"),
+        # ONNX Runtime session threads; torch's process-wide count is set from it at startup
+        "cpu_threads": int(os.getenv("TABLE_CPU_THREADS", 0)) or None,
+        # pages render at the detector's resize target (read from the image
+        # processor when loaded), not at a fixed 2x
+        "render": {
+            "shortest_edge": 800,
+            "longest_edge": 1333,
+            "max_scale": 4.0,
+            "grayscale": os.getenv("TABLE_RENDER_GRAYSCALE", "false").lower() == "true",
+            "clip_to_content": os.getenv("TABLE_RENDER_CLIP", "false").lower() == "true",
+            "clip_margin": 18.0,
+        },
     },
     "mistral": {
         "model_path": str(MODELS_DIR / "mistral-7b-instruct-v0.3.q4_k_m.gguf"),
@@ -57,10 +77,20 @@ MODELS = {
         "n_gpu_layers": -1 if USE_GPU else 0,
         "temperature": 0.1,  
         "top_p": 0.9,
-        "repeat_penalty": 1.1
+        "repeat_penalty": 1.1,
+        # llama.cpp state after each statement type's fixed prompt prefix
+        "prefix_cache": {
+            "enabled": os.getenv("PROMPT_PREFIX_CACHE", "true").lower() == "true",
+            "persist": os.getenv("PROMPT_PREFIX_CACHE_PERSIST", "false").lower() == "true",
+            "dir": str(CACHE_DIR / "prompt_states"),
+            "max_size_mb": int(os.getenv("PROMPT_PREFIX_CACHE_MAX_MB", 2048)),
+        },
     }
 }
 
+# bump when extraction prompts change so cached results are not reused
+PROMPT_VERSION = "4"
+
 FINANCIAL_CONFIG = {
     "max_context_length": 8192,  
     "enable_mock_mode": False,   
@@ -91,6 +121,31 @@ ROUNDING_PATTERNS = {
     ]
 }
 
+SECTION_PATTERNS = {
+    'comprehensive_income': [
+        r'CONSOLIDATED\s+STATEMENT\s+OF\s+COMPREHENSIVE\s+INCOME',
+        r'STATEMENT\s+OF\s+COMPREHENSIVE\s+INCOME',
+        r'STATEMENT\s+OF\s+PROFIT\s+OR\s+LOSS\s+AND\s+OTHER\s+COMPREHENSIVE\s+INCOME'
+    ],
+    'profit_loss': [
+        r'CONSOLIDATED\s+STATEMENT\s+OF\s+PROFIT\s+(?:OR\s+LOSS|AND\s+LOSS)',
+        r'STATEMENT\s+OF\s+PROFIT\s+(?:OR\s+LOSS|AND\s+LOSS)',
+        r'INCOME\s+STATEMENT',
+        r'PROFIT\s+(?:OR\s+LOSS|AND\s+LOSS)\s+STATEMENT'
+    ],
+    'balance_sheet': [
+        r'CONSOLIDATED\s+STATEMENT\s+OF\s+FINANCIAL\s+POSITION',
+        r'STATEMENT\s+OF\s+FINANCIAL\s+POSITION',
+        r'BALANCE\s+SHEET',
+        r'STATEMENT\s+OF\s+ASSETS?\s+AND\s+LIABILITIES'
+    ],
+    'cash_flow': [
+        r'CONSOLIDATED\s+STATEMENT\s+OF\s+CASH\s+FLOWS?',
+        r'STATEMENT\s+OF\s+CASH\s+FLOWS?',
+        r'CASH\s+FLOWS?\s+STATEMENT'
+    ]
+}
+
 CURRENCY_PATTERNS = {
     "AUD": [r'\bAUD\b', r'Australian.*dollars?', r'A\$'],
     "USD": [r'\bUSD\b', r'US.*dollars?', r'United.*States.*dollars?'],
@@ -107,6 +162,54 @@ EXTRACTION_SETTINGS = {
     "enable_fallback_extraction": True,
     "require_metadata_validation": True,
     "min_extraction_confidence": 0.7,
+    "stream_sections": os.getenv("STREAM_SECTIONS", "true").lower() == "true",
+    # send statement pages as a label/note/year grid instead of joined words
+    "layout_grid": os.getenv("LAYOUT_GRID", "true").lower() == "true",
+    # crop sections from the heading to the end of the statement table
+    "crop_sections": os.getenv("CROP_SECTIONS", "true").lower() == "true",
+}
+
+PDF_PROCESSING = {
+    "page_engine": os.getenv("PDF_PAGE_ENGINE", "thread"),  # "thread" or "process"
+    "page_workers": int(os.getenv("PDF_PAGE_WORKERS", os.cpu_count() or 4)),
+    "pages_per_task": int(os.getenv("PDF_PAGES_PER_TASK", 8)),
+    "prefilter_pages": True,
+    "max_candidate_pages": int(os.getenv("PDF_MAX_CANDIDATE_PAGES", 10)),
+    "min_candidate_score": 2.0,
+    # per-document budget for resident page words; 0 keeps everything in memory
+    "memory_budget_mb": float(os.getenv("PDF_MEMORY_BUDGET_MB", 0)),
+    "spill_dir": str(DATA_DIR / "spill"),
+    # pages without a text layer are OCR'd until every statement is located
+    "ocr": {
+        "enabled": os.getenv("PDF_OCR_ENABLED", "true").lower() == "true",
+        "workers": int(os.getenv("PDF_OCR_WORKERS", 2)),
+        "dpi": int(os.getenv("PDF_OCR_DPI", 300)),
+        "lang": os.getenv("PDF_OCR_LANG", "eng"),
+        "min_words": 5,
+        "max_pages": int(os.getenv("PDF_OCR_MAX_PAGES", 40)),
+        "cache_dir": str(CACHE_DIR / "ocr"),
+        "cache_max_mb": int(os.getenv("PDF_OCR_CACHE_MAX_MB", 256)),
+    },
+}
+
+RESULT_CACHE = {
+    "enabled": os.getenv("RESULT_CACHE_ENABLED", "true").lower() == "true",
+    "dir": str(CACHE_DIR / "results"),
+    "max_size_mb": int(os.getenv("RESULT_CACHE_MAX_MB", 1024)),
+}
+
+PAGE_CACHE = {
+    "enabled": os.getenv("PAGE_CACHE_ENABLED", "true").lower() == "true",
+    "dir": str(CACHE_DIR / "pages"),
+    "max_size_mb": int(os.getenv("PAGE_CACHE_MAX_MB", 512)),
+}
+
+# models load on first use; names listed here are loaded at startup instead
+MODEL_LOADING = {
+    "preload": [name.strip() for name in os.getenv("MODELS_PRELOAD", "").split(",") if name.strip()],
+    # a failed load is retried after this long, doubling per failure up to the max
+    "retry_after_s": float(os.getenv("MODEL_RETRY_AFTER_S", 30)),
+    "max_retry_after_s": float(os.getenv("MODEL_MAX_RETRY_AFTER_S", 600)),
 }
 
 
@@ -160,6 +263,7 @@ def get_settings() -> Dict[str, Any]:
         "models_dir": str(MODELS_DIR),
         "upload_dir": str(UPLOAD_DIR),
         "output_dir": str(OUTPUT_DIR),
+        "cache_dir": str(CACHE_DIR),
         "mongodb_url": MONGODB_URL,
         "database_name": DATABASE_NAME,
         "collection_name": COLLECTION_NAME,
@@ -167,8 +271,14 @@ def get_settings() -> Dict[str, Any]:
         "financial_config": FINANCIAL_CONFIG,
         "rounding_patterns": ROUNDING_PATTERNS,
         "currency_patterns": CURRENCY_PATTERNS,
+        "section_patterns": SECTION_PATTERNS,
         "extraction_settings": EXTRACTION_SETTINGS,
         "extraction_logging": EXTRACTION_LOGGING,
+        "pdf_processing": PDF_PROCESSING,
+        "result_cache": RESULT_CACHE,
+        "page_cache": PAGE_CACHE,
+        "model_loading": MODEL_LOADING,
+        "prompt_version": PROMPT_VERSION,
         "max_file_size_mb": MAX_FILE_SIZE_MB,
         "allowed_extensions": list(ALLOWED_EXTENSIONS),
         "processing_timeout": PROCESSING_TIMEOUT,
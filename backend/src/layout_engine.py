@@ -0,0 +1,193 @@
+import re
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .page_model import WordColumns
+
+YEAR_RE = re.compile(r'^(?:19|20)\d{2}$')
+VALUE_RE = re.compile(r'^(?:\(?-?[$£€]?[\d,]*\d(?:\.\d+)?\)?%?|[-–—])$')
+NOTE_RE = re.compile(r'^\d{1,2}(?:\.\d{1,2})?(?:\s*[,&]\s*\d{1,2}(?:\.\d{1,2})?)*$')
+
+# word centres closer than this fraction of the smaller word height share a line
+LINE_TOLERANCE = 0.5
+# a horizontal gap wider than this many line heights starts a new cell
+CELL_GAP = 0.8
+
+# (text, x0, x1) for one cell
+Cell = Tuple[str, float, float]
+# (y0, y1, cells) for one line
+Row = Tuple[float, float, List[Cell]]
+
+
+def cluster_lines(bboxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns word indices in reading order and the line id of each of them."""
+    count = len(bboxes)
+    heights = np.maximum(bboxes[:, 3] - bboxes[:, 1], 1e-3)
+    centres = (bboxes[:, 1] + bboxes[:, 3]) / 2
+
+    by_y = np.argsort(centres, kind='stable')
+    sorted_centres = centres[by_y]
+    sorted_heights = heights[by_y]
+
+    breaks = np.empty(count, dtype=bool)
+    breaks[0] = True
+    breaks[1:] = np.diff(sorted_centres) > LINE_TOLERANCE * np.minimum(sorted_heights[1:], sorted_heights[:-1])
+
+    lines = np.empty(count, dtype=np.int64)
+    lines[by_y] = np.cumsum(breaks) - 1
+
+    order = np.lexsort((bboxes[:, 0], lines))
+    return order, lines[order]
+
+
+def split_cells(bboxes: np.ndarray, line_ids: np.ndarray) -> np.ndarray:
+    """Returns the positions (in reading order) where a new cell starts.
+
+    ``bboxes`` and ``line_ids`` must already be in reading order.
+    """
+    count = len(bboxes)
+    new_cell = np.empty(count, dtype=bool)
+    new_cell[0] = True
+    gaps = bboxes[1:, 0] - bboxes[:-1, 2]
+    heights = np.maximum(bboxes[1:, 3] - bboxes[1:, 1], 1e-3)
+    new_cell[1:] = (line_ids[1:] != line_ids[:-1]) | (gaps > CELL_GAP * heights)
+    return np.flatnonzero(new_cell)
+
+
+def layout_rows(words: WordColumns) -> List[Row]:
+    if not len(words):
+        return []
+
+    order, line_ids = cluster_lines(words.bboxes)
+    bboxes = words.bboxes[order]
+    starts = split_cells(bboxes, line_ids)
+    ends = np.append(starts[1:], len(order))
+
+    cell_x0 = bboxes[starts, 0]
+    cell_x1 = np.maximum.reduceat(bboxes[:, 2], starts)
+    cell_lines = line_ids[starts]
+
+    line_starts = np.flatnonzero(np.r_[True, line_ids[1:] != line_ids[:-1]])
+    line_y0 = np.minimum.reduceat(bboxes[:, 1], line_starts).tolist()
+    line_y1 = np.maximum.reduceat(bboxes[:, 3], line_starts).tolist()
+
+    texts = words.texts()
+    ordered = [texts[i] for i in order.tolist()]
+
+    rows: List[Row] = []
+    previous_line = -1
+    for start, end, x0, x1, line in zip(starts.tolist(), ends.tolist(), cell_x0.tolist(), cell_x1.tolist(), cell_lines.tolist()):
+        if line != previous_line:
+            rows.append((line_y0[len(rows)], line_y1[len(rows)], []))
+            previous_line = line
+        rows[-1][2].append((" ".join(ordered[start:end]), x0, x1))
+    return rows
+
+
+def layout_lines(words: WordColumns) -> List[List[Cell]]:
+    return [cells for _, _, cells in layout_rows(words)]
+
+
+def is_value_cell(text: str) -> bool:
+    return bool(VALUE_RE.match(text.replace(" ", "")))
+
+
+def split_spanning_cell(cell: Cell, pattern: re.Pattern) -> List[Cell]:
+    # figures printed close together can land in one cell; split the span evenly
+    text, x0, x1 = cell
+    tokens = text.split(" ")
+    if len(tokens) < 2 or not all(pattern.match(token) for token in tokens):
+        return [cell]
+    step = (x1 - x0) / len(tokens)
+    return [(token, x0 + i * step, x0 + (i + 1) * step) for i, token in enumerate(tokens)]
+
+
+def find_year_columns(lines: List[List[Cell]]) -> Tuple[Optional[int], List[Cell]]:
+    """Finds the first line carrying two or more year headings."""
+    for index, cells in enumerate(lines):
+        years = [
+            part for cell in cells for part in split_spanning_cell(cell, YEAR_RE)
+            if YEAR_RE.match(part[0])
+        ]
+        if len(years) >= 2:
+            return index, years
+    return None, []
+
+
+def compact_value(text: str) -> str:
+    # thousands separators carry no information once the figure sits in its column
+    return text.replace(" ", "").replace(",", "")
+
+
+def split_value_cells(cells: List[Cell]) -> List[Cell]:
+    # only a cell with a space can hold several figures
+    return [part for cell in cells for part in (split_spanning_cell(cell, VALUE_RE) if " " in cell[0] else (cell,))]
+
+
+def trim_row(row: List[str]) -> List[str]:
+    while len(row) > 1 and not row[-1]:
+        row.pop()
+    return row
+
+
+def page_grid(words: WordColumns) -> List[List[str]]:
+    """Compact grid for one statement page: [label, note, *year values].
+
+    The note column is only kept when the page has notes, and trailing
+    empty cells are dropped; empty cells between values stay so every
+    figure keeps its year column.
+    """
+    lines = layout_lines(words)
+    header_index, columns = find_year_columns(lines)
+    if header_index is None:
+        return [[text for text, _, _ in cells] for cells in lines]
+
+    first_column = min(x0 for _, x0, _ in columns)
+    width = max(x1 - x0 for _, x0, x1 in columns)
+    value_zone = first_column - width / 2
+    right_edges = np.array([x1 for _, _, x1 in columns], dtype=np.float32)
+
+    labels: List[str] = []
+    notes: List[str] = []
+    # (row, text, x1) of every figure on the page
+    figures: List[Tuple[int, str, float]] = []
+    for row, cells in enumerate(lines[header_index + 1:]):
+        label_parts, note_parts = [], []
+        for text, _, x1 in split_value_cells(cells):
+            if not is_value_cell(text):
+                label_parts.append(text)
+            elif x1 >= value_zone:
+                figures.append((row, compact_value(text), x1))
+            elif NOTE_RE.match(text):
+                note_parts.append(text)
+            else:
+                label_parts.append(text)
+        labels.append(" ".join(label_parts))
+        notes.append(",".join(note_parts))
+
+    # figures are usually right-aligned under their year heading; all of the
+    # page's figures are matched to the nearest heading in one pass
+    values = [[""] * len(columns) for _ in labels]
+    if figures:
+        x1s = np.fromiter((x1 for _, _, x1 in figures), dtype=np.float32, count=len(figures))
+        nearest = np.abs(x1s[:, None] - right_edges).argmin(axis=1).tolist()
+        for (row, text, _), column in zip(figures, nearest):
+            values[row][column] = text
+
+    with_notes = any(notes)
+    rows = [[" ".join(text for text, _, _ in cells)] for cells in lines[:header_index]]
+    rows.append([""] + (["Note"] if with_notes else []) + [text for text, _, _ in columns])
+    for label, note, row_values in zip(labels, notes, values):
+        rows.append(trim_row([label] + ([note] if with_notes else []) + row_values))
+    return rows
+
+
+def grid_text(pages: List[WordColumns]) -> str:
+    """Grid rows as tab-separated lines, one per text line."""
+    lines = []
+    for words in pages:
+        for row in page_grid(words):
+            if any(row):
+                lines.append("\t".join(row))
+    return "\n".join(lines)
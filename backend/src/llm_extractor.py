@@ -1,18 +1,23 @@
 import json
 import time
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import re
 from concurrent.futures import ThreadPoolExecutor
 import threading
 
 try:
-    from llama_cpp import Llama
+    from llama_cpp import Llama, __version__ as llama_cpp_version
 except ImportError:
     Llama = None
+    llama_cpp_version = None
 
-from .config import MODELS, FINANCIAL_CONFIG, ROUNDING_PATTERNS, CURRENCY_PATTERNS
+from .config import MODELS, FINANCIAL_CONFIG, EXTRACTION_SETTINGS, PROMPT_VERSION
+from .model_registry import get_model_registry
+from .layout_engine import grid_text
+from .prompt_cache import PrefixStateCache
+from .metadata_detector import detect_currency, detect_metadata, detect_rounding
 from .models import FinancialStatement, LineItem, ExtractionResult, DocumentMetadata
 from utils.logger import get_logger
 
@@ -35,10 +40,13 @@ class LLMExtractor:
             return
         try:
             self.llm = None 
+            self.prefix_cache = None
             self.model_loaded = False 
             self.mock_mode = Llama is None 
             self.model_lock = threading.Lock()
             self.thread_pool = ThreadPoolExecutor(max_workers=max_workers)
+            self.models = get_model_registry()
+            self.models.register("mistral", self.load_llm)
             self._initialized = True
             logger.info(f"LLM Extractor initialized (mock mode: {self.mock_mode})")
             
@@ -53,6 +61,7 @@ class LLMExtractor:
 
     def cleanup(self):
         self.thread_pool.shutdown(wait=True)
+        self.prefix_cache = None
         if self.llm:
             del self.llm
         logger.info("LLM Extractor cleaned.")
@@ -62,6 +71,9 @@ class LLMExtractor:
         return await loop.run_in_executor(self.thread_pool, self.load_model)
     
     def load_model(self) -> bool:
+        return self.models.load("mistral")
+
+    def load_llm(self) -> bool:
         with self.model_lock:
             if self.model_loaded:
                 return True 
@@ -88,6 +100,8 @@ class LLMExtractor:
                     verbose=False 
                 )
 
+                self.prefix_cache = self.create_prefix_cache(model_path)
+
                 load_time = time.time() - st
                 self.model_loaded = True 
                 logger.info(f"Model loaded successfully in {load_time:.2f}s.")
@@ -97,30 +111,24 @@ class LLMExtractor:
                 self.model_loaded = False 
                 return False
 
+    def create_prefix_cache(self, model_path: Path) -> Optional[PrefixStateCache]:
+        settings = MODELS["mistral"]["prefix_cache"]
+        if not settings["enabled"]:
+            return None
+        model_id = f"{model_path.name}|{MODELS['mistral']['n_ctx']}|{PROMPT_VERSION}|{llama_cpp_version}"
+        persist_dir = Path(settings["dir"]) if settings["persist"] else None
+        return PrefixStateCache(self.llm, model_id, persist_dir, settings["max_size_mb"] * 1024 * 1024)
+
     def extract_document_metadata(self, text: str) -> Dict[str, str]:
-        currency = self.detect_currency(text)
-        rounding = self.detect_rounding(text)
-        return {"currency": currency, "rounding": rounding}
+        metadata = detect_metadata(text)
+        return {"currency": metadata["currency"] or 'AUD', "rounding": metadata["rounding"] or 'units'}
 
     def detect_currency(self, text: str) -> str:
-        text_upper = text.upper()
-        for currency, patterns in CURRENCY_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, text_upper):
-                    return currency
-        
-        if '$' in text:
-            return 'AUD'
-        return 'AUD'
+        return detect_currency(text.upper()) or 'AUD'
 
     def detect_rounding(self, text: str) -> str:
-        text_lower = text.lower()
-        for rounding_type, patterns in ROUNDING_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    return rounding_type
-        return 'units'
-            
+        return detect_rounding(text.lower())[0] or 'units'
+
     async def extract_from_text_async(self, text: str, section_type: str = "profit_loss", pdf_metadata: Optional[Dict[str, str]] = None) -> Optional[FinancialStatement]:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
@@ -170,10 +178,14 @@ class LLMExtractor:
             return self.extract_basic_structure(text, section_type, metadata)
 
     def extract_line_by_line(self, text: str, section_type: str, metadata: Dict[str, str]) -> Optional[FinancialStatement]:
-        prompt = self.create_extraction_prompt(text, section_type, metadata)
+        prefix = self.extraction_prompt_prefix(section_type)
+        prompt = prefix + self.extraction_prompt_suffix(text, metadata)
 
         try:
             with self.model_lock:
+                # only the statement text is evaluated; the instructions come from the saved state
+                if self.prefix_cache is not None:
+                    self.prefix_cache.restore(prefix)
                 response = self.llm(
                     prompt,
                     max_tokens=3000,
@@ -301,6 +313,12 @@ class LLMExtractor:
         return sorted(years) if years else ["2024"]
 
     def create_extraction_prompt(self, text: str, section_type: str, metadata: Dict[str, str]) -> str:
+        return self.extraction_prompt_prefix(section_type) + self.extraction_prompt_suffix(text, metadata)
+
+    def extraction_prompt_prefix(self, section_type: str) -> str:
+        # Identical for every document of a statement type, so its llama.cpp
+        # state can be saved once and restored; anything per document goes
+        # in the suffix.
         if section_type == "cash_flow":
             section_name = "Cash Flow Statement"
             example_items = [
@@ -329,34 +347,39 @@ class LLMExtractor:
                 }
             ]
 
-        currency = metadata['currency']
-        rounding = metadata['rounding']
         example_json = json.dumps(example_items, indent=8)
         
-        prompt = f"""You are a financial document analyzer. Extract structured data from the following {section_name}.
+        return f"""You are a financial document analyzer. Extract structured data from the {section_name} given below.
                     IMPORTANT INSTRUCTIONS:
                     1. Extract ALL line items with their EXACT values as shown (do not scale or convert)
                     2. Include note references (e.g., "Note 3", "4", "3,4")
-                    3. Currency is {currency}, rounding scale is {rounding}
+                    3. Use the currency and rounding scale stated before the text
                     4. Handle negative values in parentheses: (27.6) means -27.6
                     5. Extract exact numbers as displayed: 233.3, 175.9, not rounded versions
                     6. Output ONLY valid JSON, no explanations
 
-                    Financial Statement Text:
-                    {text}
-
-                    Extract and return JSON in this EXACT format:
+                    Return JSON in this EXACT format:
                     {{
                         "statement_type": "{section_type}",
                         "company_name": "Company Name",
-                        "currency": "{currency}",
-                        "rounding": "{rounding}",
+                        "currency": "CURRENCY",
+                        "rounding": "ROUNDING",
                         "financial_years": ["2023", "2024"],
                         "line_items": {example_json}
                     }}
+"""
+
+    def extraction_prompt_suffix(self, text: str, metadata: Dict[str, str]) -> str:
+        currency = metadata['currency']
+        rounding = metadata['rounding']
+
+        return f"""
+                    Currency is {currency}, rounding scale is {rounding}
+
+                    Financial Statement Text:
+                    {text}
 
                     JSON Output:"""
-        return prompt
 
     def clean_json_response(self, text: str) -> str:
         text = re.sub(r'```json\s*', '', text)
@@ -501,10 +524,48 @@ class LLMExtractor:
             ]
         )
 
-    async def extract_from_doc_async(self, pdf_data: Dict[str, Any]) -> ExtractionResult:
+    def section_prompt_text(self, section_data: Dict[str, Any]) -> str:
+        if EXTRACTION_SETTINGS.get("layout_grid", True) and section_data.get('words'):
+            try:
+                text = grid_text(section_data['words'])
+                if text:
+                    return text
+            except Exception as e:
+                logger.warning(f"Layout grid failed, using raw section text: {str(e)}")
+
+        return section_data.get('text') or " ".join([
+            t['text'] for t in section_data['text_instances']
+        ])
+
+    async def extract_section_async(self, section_name: str, section_data: Dict[str, Any], pdf_metadata: Optional[Dict[str, str]] = None) -> Tuple[Optional[FinancialStatement], Optional[str]]:
+        try:
+            section_text = self.section_prompt_text(section_data)
+            
+            logger.info(f"Processing {section_name} section ({len(section_text)} chars)")
+            
+            statement = await self.extract_from_text_async(section_text, section_name, pdf_metadata)
+            if statement:
+                logger.info(f"Successfully extracted {section_name}")
+                return statement, None
+
+            logger.warning(f"Failed to extract {section_name}")
+            return None, f"Failed to extract {section_name}"
+                
+        except Exception as e:
+            error_msg = f"Error in {section_name}: {str(e)}"
+            logger.error(error_msg)
+            return None, error_msg
+
+    def apply_document_metadata(self, statement: FinancialStatement, metadata: Dict[str, str]) -> FinancialStatement:
+        # streamed sections were extracted before the whole document was read
+        update = {key: metadata[key] for key in ('currency', 'rounding') if metadata.get(key)}
+        return statement.model_copy(update=update)
+
+    async def extract_from_doc_async(self, pdf_data: Dict[str, Any], section_tasks: Optional[Dict[str, "asyncio.Task"]] = None) -> ExtractionResult:
         st = time.time()
         statements = []
         errors = []
+        section_tasks = section_tasks or {}
 
         sections_to_process = [
             ('profit_loss', pdf_data.get('sections', {}).get('profit_loss')),
@@ -523,29 +584,22 @@ class LLMExtractor:
             if statement:
                 statements.append(statement)
         else:
-            # Process each section individually
+            # Process each section individually; sections dispatched while the
+            # PDF was still being parsed are already running
+            pdf_metadata = pdf_data.get('document_metadata', {})
             for section_name, section_data in sections_to_process:
-                try:
-                    section_text = " ".join([
-                        t['text'] for t in section_data['text_instances']
-                    ])
-                    
-                    logger.info(f"Processing {section_name} section ({len(section_text)} chars)")
-                    
-                    pdf_metadata = pdf_data.get('document_metadata', {})
-                    # Fix: Use section_text instead of full_text, and correct section_name
-                    statement = await self.extract_from_text_async(section_text, section_name, pdf_metadata)
-                    if statement:
-                        statements.append(statement)
-                        logger.info(f"Successfully extracted {section_name}")
-                    else:
-                        errors.append(f"Failed to extract {section_name}")
-                        logger.warning(f"Failed to extract {section_name}")
-                        
-                except Exception as e:
-                    error_msg = f"Error in {section_name}: {str(e)}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
+                task = section_tasks.get(section_name)
+                if task is not None:
+                    statement, error = await task
+                    if statement and pdf_metadata:
+                        statement = self.apply_document_metadata(statement, pdf_metadata)
+                else:
+                    statement, error = await self.extract_section_async(section_name, section_data, pdf_metadata)
+
+                if statement:
+                    statements.append(statement)
+                if error:
+                    errors.append(error)
 
         processing_time = time.time() - st 
 
@@ -0,0 +1,165 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .config import CURRENCY_PATTERNS, ROUNDING_PATTERNS
+
+# ``.*`` in the configured patterns may scan (and backtrack over) a whole
+# page; a gap is bounded to the rest of the sentence instead. A full stop
+# before a digit is a decimal point ("rounded to $0.1 million"), not the
+# end of the sentence.
+SENTENCE_CHAR = r'(?:[^.\n]|\.(?=\d))'
+GAP = SENTENCE_CHAR + r'{0,120}?'
+
+ROUNDING_STATEMENTS = [
+    r'amounts.*rounded.*nearest.*hundred.*thousand.*dollars',
+    r'figures.*rounded.*nearest.*thousand.*dollars',
+    r'amounts.*expressed.*millions.*dollars',
+    r'figures.*expressed.*millions.*dollars',
+    r'amounts.*stated.*millions',
+    r'figures.*stated.*millions'
+]
+
+# Explicit declarations of the presentation scale or currency, as opposed
+# to incidental mentions such as "millions of dollars" in the narrative.
+# The scale word is captured; '000 column headers always mean thousands.
+ROUNDING_DECLARATIONS = [
+    r'\brounded\b' + SENTENCE_CHAR + r'{0,80}?\b(thousand|million)s?\b',
+    r'\b(?:amounts|figures)\b' + GAP + r'\b(?:in|presented|expressed|stated|shown|reported)\b'
+    + SENTENCE_CHAR + r'{0,40}?\b(thousand|million)s?\b',
+    r"\$\s*'000\b|\(\s*'000\s*\)",
+]
+
+CURRENCY_DECLARATIONS = [
+    r'\b(?:PRESENTED|EXPRESSED|REPORTED|STATED|DENOMINATED)\s+IN\b' + SENTENCE_CHAR + r'{0,60}',
+    r'\b(?:PRESENTATION|FUNCTIONAL|REPORTING)\s+CURRENCY\b' + SENTENCE_CHAR + r'{0,80}',
+]
+
+CONTEXT_CHARS = 50
+# a declared value seen on this many pages is final and no longer looked for
+CONFIRM_PAGES = 2
+
+
+def bounded(pattern: str) -> str:
+    return pattern.replace('.*', GAP)
+
+
+def compile_groups(groups: Dict[str, List[str]]) -> List[Tuple[str, re.Pattern]]:
+    # one alternation per label, kept in priority (config) order
+    return [
+        (label, re.compile("|".join(f"(?:{bounded(p)})" for p in patterns)))
+        for label, patterns in groups.items()
+        if patterns
+    ]
+
+
+def statement_label(pattern: str) -> str:
+    return 'millions' if 'million' in pattern else 'thousands'
+
+
+CURRENCY_RES = compile_groups(CURRENCY_PATTERNS)
+ROUNDING_RES = compile_groups(ROUNDING_PATTERNS)
+ROUNDING_STATEMENT_RES = [(statement_label(p), re.compile(bounded(p))) for p in ROUNDING_STATEMENTS]
+ROUNDING_DECLARATION_RES = [re.compile(p) for p in ROUNDING_DECLARATIONS]
+CURRENCY_DECLARATION_RES = [re.compile(p) for p in CURRENCY_DECLARATIONS]
+
+
+def detect_currency(text_upper: str) -> Optional[str]:
+    for currency, pattern in CURRENCY_RES:
+        if pattern.search(text_upper):
+            return currency
+    return None
+
+
+def declared_currency(text_upper: str) -> Optional[str]:
+    for pattern in CURRENCY_DECLARATION_RES:
+        for match in pattern.finditer(text_upper):
+            currency = detect_currency(match.group())
+            if currency:
+                return currency
+    return None
+
+
+def declared_rounding(text_lower: str) -> Tuple[Optional[str], Optional[str]]:
+    for pattern in ROUNDING_DECLARATION_RES:
+        match = pattern.search(text_lower)
+        if match:
+            scale = match.group(1) if pattern.groups else 'thousand'
+            return f"{scale}s", match.group().strip()
+    return None, None
+
+
+def detect_rounding(text_lower: str) -> Tuple[Optional[str], Optional[str]]:
+    """Returns the rounding scale and the text it was read from."""
+    rounding, note = declared_rounding(text_lower)
+    if rounding:
+        return rounding, note
+
+    for rounding, pattern in ROUNDING_RES:
+        match = pattern.search(text_lower)
+        if match:
+            start = max(0, match.start() - CONTEXT_CHARS)
+            end = min(len(text_lower), match.end() + CONTEXT_CHARS)
+            return rounding, text_lower[start:end].strip()
+
+    for rounding, pattern in ROUNDING_STATEMENT_RES:
+        match = pattern.search(text_lower)
+        if match:
+            return rounding, match.group()
+
+    return None, None
+
+
+def detect_metadata(text: str) -> Dict[str, Optional[str]]:
+    rounding, note = detect_rounding(text.lower())
+    return {"currency": detect_currency(text.upper()), "rounding": rounding, "rounding_note": note}
+
+
+class MetadataDetector:
+    """Document-level currency and rounding, fed one page at a time.
+
+    Explicit declarations ("rounded to the nearest thousand dollars",
+    "presented in AUD") take priority over incidental mentions such as
+    "millions of dollars" in the narrative: a mention is used only while no
+    declaration has been seen, and the latest page wins. Only declarations
+    confirm a value; once the same one has been declared on CONFIRM_PAGES
+    pages it is final and later pages are no longer scanned for it. When
+    both values are final, ``feed`` does nothing.
+    """
+
+    def __init__(self, metadata: Dict[str, Optional[str]]):
+        self.metadata = metadata
+        self.seen: Dict[Tuple[str, str], int] = {}
+        self.declared = set()
+        self.confirmed = set()
+
+    @property
+    def done(self) -> bool:
+        return len(self.confirmed) == 2
+
+    def _vote(self, field: str, value: str) -> None:
+        self.declared.add(field)
+        key = (field, value)
+        self.seen[key] = self.seen.get(key, 0) + 1
+        if self.seen[key] >= CONFIRM_PAGES:
+            self.confirmed.add(field)
+
+    def feed(self, text_upper: str, text_lower: str) -> None:
+        if 'currency' not in self.confirmed:
+            currency = declared_currency(text_upper)
+            if currency:
+                self._vote('currency', currency)
+            elif 'currency' not in self.declared:
+                currency = detect_currency(text_upper)
+            if currency:
+                self.metadata["currency"] = currency
+
+        if 'rounding' not in self.confirmed:
+            rounding, note = declared_rounding(text_lower)
+            if rounding:
+                self._vote('rounding', rounding)
+            elif 'rounding' not in self.declared:
+                rounding, note = detect_rounding(text_lower)
+            if rounding:
+                self.metadata["rounding"] = rounding
+                if note:
+                    self.metadata["rounding_note"] = note
@@ -0,0 +1,164 @@
+import os
+import resource
+import sys
+import threading
+import time
+from typing import Dict, List, Any, Callable, Iterable
+
+from .config import MODEL_LOADING
+from utils.logger import get_logger
+
+logger = get_logger("model_registry")
+
+UNLOADED = "unloaded"
+LOADING = "loading"
+LOADED = "loaded"
+FAILED = "failed"
+
+
+def process_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # peak RSS is the best portable fallback: kB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class LazyModel:
+    """One model that is loaded by its loader the first time it is needed.
+
+    Loaders follow the existing ``load_*`` convention and return True on
+    success. A failed load fails fast until ``retry_after`` seconds have
+    passed, then is tried again; the wait doubles with each consecutive
+    failure up to ``max_retry_after``. ``reset`` allows a retry right away.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], bool], retry_after: float = 30.0, max_retry_after: float = 600.0):
+        self.name = name
+        self.loader = loader
+        self.retry_after = retry_after
+        self.max_retry_after = max_retry_after
+        self.state = UNLOADED
+        self.load_time = None
+        self.memory_bytes = None
+        self.error = None
+        self.failures = 0
+        self.retry_at = 0.0
+        self.lock = threading.Lock()
+
+    def load(self) -> bool:
+        if self.state == LOADED:
+            return True
+
+        with self.lock:
+            if self.state == LOADED:
+                return True
+            if self.state == FAILED and time.monotonic() < self.retry_at:
+                return False
+
+            self.state = LOADING
+            rss_before = process_rss_bytes()
+            st = time.time()
+            try:
+                loaded = bool(self.loader())
+                self.error = None if loaded else "loader reported failure"
+            except Exception as e:
+                loaded = False
+                self.error = str(e)
+
+            self.load_time = time.time() - st
+            self.memory_bytes = max(0, process_rss_bytes() - rss_before)
+            self.state = LOADED if loaded else FAILED
+
+            if loaded:
+                self.failures = 0
+                logger.info(f"Model '{self.name}' loaded on first use in {self.load_time:.2f}s (~{self.memory_bytes / (1024 * 1024):.0f}MB).")
+            else:
+                self.failures += 1
+                backoff = min(self.retry_after * 2 ** (self.failures - 1), self.max_retry_after)
+                self.retry_at = time.monotonic() + backoff
+                logger.error(f"Model '{self.name}' failed to load: {self.error} (retry in {backoff:.0f}s)")
+            return loaded
+
+    def reset(self):
+        with self.lock:
+            self.state = UNLOADED
+            self.error = None
+            self.failures = 0
+            self.retry_at = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "load_time_s": round(self.load_time, 3) if self.load_time is not None else None,
+            "memory_mb": round(self.memory_bytes / (1024 * 1024), 1) if self.memory_bytes is not None else None,
+            "error": self.error,
+            "retry_in_s": round(max(0.0, self.retry_at - time.monotonic()), 1) if self.state == FAILED else None
+        }
+
+
+class ModelRegistry:
+    """Named lazily-loaded models shared by the pipeline components.
+
+    Memory is the process RSS growth measured around each load, so it is
+    approximate when two models load at the same time.
+    """
+
+    def __init__(self, retry_after: float = 30.0, max_retry_after: float = 600.0):
+        self.models: Dict[str, LazyModel] = {}
+        self.retry_after = retry_after
+        self.max_retry_after = max_retry_after
+        self.lock = threading.Lock()
+
+    def register(self, name: str, loader: Callable[[], bool]) -> LazyModel:
+        with self.lock:
+            if name not in self.models:
+                self.models[name] = LazyModel(name, loader, self.retry_after, self.max_retry_after)
+            return self.models[name]
+
+    def load(self, name: str) -> bool:
+        model = self.models.get(name)
+        if model is None:
+            logger.error(f"Model '{name}' is not registered.")
+            return False
+        return model.load()
+
+    def is_loaded(self, name: str) -> bool:
+        model = self.models.get(name)
+        return model is not None and model.state == LOADED
+
+    def preload(self, names: Iterable[str]) -> bool:
+        ok = True
+        for name in names:
+            if name in self.models:
+                ok = self.load(name) and ok
+            else:
+                logger.warning(f"Cannot preload unknown model '{name}'.")
+        return ok
+
+    def failed(self) -> List[str]:
+        return [name for name, model in self.models.items() if model.state == FAILED]
+
+    def ready(self) -> bool:
+        # models load on first use, so a registered model that has not
+        # failed counts as ready even before anything has loaded it
+        return bool(self.models) and not self.failed()
+
+    def health(self) -> Dict[str, Dict[str, Any]]:
+        """Model stats grouped into loaded, lazy (not loaded yet) and failed."""
+        groups = {"loaded": {}, "lazy": {}, "failed": {}}
+        for name, model in self.models.items():
+            group = {LOADED: "loaded", FAILED: "failed"}.get(model.state, "lazy")
+            groups[group][name] = model.stats()
+        return groups
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: model.stats() for name, model in self.models.items()}
+
+
+model_registry = ModelRegistry(MODEL_LOADING["retry_after_s"], MODEL_LOADING["max_retry_after_s"])
+
+def get_model_registry() -> ModelRegistry:
+    return model_registry
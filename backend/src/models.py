@@ -80,7 +80,9 @@ class FinancialStatement(BaseModel):
         line_items = values.get('line_items', [])
 
         for item in line_items:
-            for year, value in item.values.items():
+            # line items are dicts when the statement is parsed from JSON
+            item_values = item.get('values', {}) if isinstance(item, dict) else item.values
+            for year, value in item_values.items():
                 if value in [1000.0, 1200.0, 800.0, 900.0, 1500.0, 1800.0]:
                     logger.warning(f"Suspicious mock-like value detected: {value}")
 
@@ -140,6 +142,8 @@ class HealthResponse(BaseModel):
     models_loaded: bool
     pipeline_ready: bool 
     system_info: Dict[str, Any]
+    models: Dict[str, Dict[str, Any]] = {}
+    page_scheduler: Dict[str, Any] = {}
 
 class ErrorResponse(BaseModel):
     error: str 
@@ -0,0 +1,88 @@
+import re
+from typing import Dict, List, Any
+
+import numpy as np
+
+from .page_model import PageData
+
+# Patterns run against the page's original-case text so match offsets line
+# up with word offsets (upper() can change string length, e.g. ligatures).
+NOTE_REFERENCE_RE = re.compile(r'\bNOTES?\s+(\d{1,3}(?:\s*(?:,|&|AND)\s*\d{1,3})*)\b', re.IGNORECASE)
+NOTE_HEADING_RE = re.compile(r'(?:^|(?<=\s))(\d{1,3})\.\s+(?=[A-Z][a-z])')
+NOTE_NUMBER_RE = re.compile(r'\d+')
+
+
+def union_bbox(bboxes: np.ndarray) -> List[float]:
+    return [
+        float(bboxes[:, 0].min()),
+        float(bboxes[:, 1].min()),
+        float(bboxes[:, 2].max()),
+        float(bboxes[:, 3].max())
+    ]
+
+
+def line_starts(bboxes: np.ndarray) -> np.ndarray:
+    """Marks words that begin a text line: the first word, and every word
+    whose vertical middle falls outside the previous word's box."""
+    starts = np.ones(len(bboxes), dtype=bool)
+    middle = (bboxes[1:, 1] + bboxes[1:, 3]) / 2
+    starts[1:] = (middle > bboxes[:-1, 3]) | (middle < bboxes[:-1, 1])
+    return starts
+
+
+def heading_matches(page: PageData) -> List[re.Match]:
+    # "12. Revenue" is a heading only when it opens a line; mid-line it is
+    # the end of a sentence ("... see page 12. The ...")
+    found = list(NOTE_HEADING_RE.finditer(page.text))
+    if not found:
+        return []
+    # the pattern only matches at word starts, so each match opens one word
+    words = page.words
+    first = np.searchsorted(words.starts, [match.start(1) for match in found], side='right') - 1
+    opens_line = line_starts(words.bboxes)[first]
+    return [match for match, keep in zip(found, opens_line.tolist()) if keep]
+
+
+def index_page_notes(page: PageData) -> List[Dict[str, Any]]:
+    text = page.text
+    if not text:
+        return []
+
+    matches = []
+    for match in NOTE_REFERENCE_RE.finditer(text):
+        matches.append((match.start(), match.end(), 'reference', NOTE_NUMBER_RE.findall(match.group(1))))
+    for match in heading_matches(page):
+        matches.append((match.start(1), match.end(1) + 1, 'heading', [match.group(1)]))
+
+    if not matches:
+        return []
+
+    bboxes = page.words.bboxes
+    spans = page.words_at([m[0] for m in matches], [m[1] for m in matches])
+
+    references = []
+    for (start, end, kind, numbers), span in zip(matches, spans):
+        references.append({
+            'text': text[start:end],
+            'page': page['page_num'],
+            'bbox': union_bbox(bboxes[span.start:span.stop]),
+            'type': kind,
+            'note_numbers': numbers
+        })
+    return references
+
+
+def build_note_index(pages_data: List[PageData]) -> Dict[str, List[Dict[str, Any]]]:
+    index: Dict[str, List[Dict[str, Any]]] = {}
+    for page in pages_data:
+        if not page:
+            continue
+        for reference in index_page_notes(page):
+            for number in reference['note_numbers']:
+                index.setdefault(str(int(number)), []).append({
+                    'page': reference['page'],
+                    'bbox': reference['bbox'],
+                    'text': reference['text'],
+                    'type': reference['type']
+                })
+    return index
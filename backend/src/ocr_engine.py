@@ -0,0 +1,136 @@
+import hashlib
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .cache import DiskLRUCache
+from .layout_engine import layout_rows
+from .page_engine import to_page_bbox
+from .page_workers import PackedRaster, RenderSpec, ocr_raster, render_page_raster, worker_context
+from .page_model import PageData, WordColumns
+from .pdf_session import PDFDocumentSession
+from utils.logger import get_logger
+
+logger = get_logger("ocr_engine")
+
+# (word texts, (n, 4) bboxes in page points)
+OcrWords = Tuple[List[str], np.ndarray]
+
+
+def raster_hash(raster: PackedRaster) -> str:
+    samples, height, width, channels = raster
+    digest = hashlib.sha256(f"{height}x{width}x{channels}".encode())
+    digest.update(samples)
+    return digest.hexdigest()
+
+
+def ocr_blocks(words: WordColumns) -> List[Tuple[str, List[float]]]:
+    # OCR has no block structure; each laid-out line becomes one block
+    blocks = []
+    for y0, y1, cells in layout_rows(words):
+        text = " ".join(cell_text for cell_text, _, _ in cells)
+        blocks.append((text, [cells[0][1], y0, cells[-1][2], y1]))
+    return blocks
+
+
+class OcrEngine:
+    """OCR for pages without a text layer.
+
+    A page qualifies when it has fewer than ``min_words`` words and carries
+    at least one image. It is rendered in grayscale at ``dpi`` and read by
+    Tesseract in a bounded process pool; rendering itself runs on the
+    shared page ``scheduler``. Results are cached on disk by the
+    hash of the rendered image, so a re-uploaded scan is not OCR'd again.
+    Words come back in page points and replace the page's WordColumns.
+    """
+
+    def __init__(self, scheduler, max_workers: int, dpi: int, lang: str, min_words: int, cache_dir: Path, cache_max_bytes: int):
+        self.scheduler = scheduler
+        self.max_workers = max(1, max_workers)
+        self.spec: RenderSpec = (dpi / 72.0, None, True)
+        self.lang = lang
+        self.min_words = min_words
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=worker_context())
+        self.cache = DiskLRUCache(cache_dir, cache_max_bytes, suffix=".pkl")
+        self.lock = threading.Lock()
+        self.pages_ocred = 0
+        self.cache_hits = 0
+        logger.info(f"OCR engine started with {self.max_workers} workers at {dpi} dpi.")
+
+    def needs_ocr(self, session: PDFDocumentSession, page: PageData) -> bool:
+        if len(page.words) >= self.min_words:
+            return False
+        with session.lock:
+            return bool(session.page(page.page_num).get_images(full=False))
+
+    def cache_key(self, image_hash: str) -> str:
+        return f"{image_hash}_{self.lang}"
+
+    def render(self, session: PDFDocumentSession, page_num: int) -> PackedRaster:
+        with session.lock:
+            return render_page_raster(session.page(page_num), self.spec)
+
+    def submit(self, session: PDFDocumentSession, page_num: int) -> "Future[OcrWords]":
+        # rendered by a page worker, so OCR renders share the page worker budget
+        raster = self.scheduler.submit(session, self.render, session, page_num, front=True).result()
+
+        key = self.cache_key(raster_hash(raster))
+        cached = self.cache.get(key)
+        if cached is not None:
+            with self.lock:
+                self.cache_hits += 1
+            future = Future()
+            future.set_result(pickle.loads(cached))
+            return future
+
+        result = Future()
+
+        def finish(ocr_future: Future):
+            try:
+                texts, boxes = ocr_future.result()
+                bboxes = np.asarray([to_page_bbox(box, self.spec) for box in boxes], dtype=np.float32).reshape(-1, 4)
+                self.cache.put(key, pickle.dumps((texts, bboxes), protocol=pickle.HIGHEST_PROTOCOL))
+                with self.lock:
+                    self.pages_ocred += 1
+                result.set_result((texts, bboxes))
+            except Exception as e:
+                result.set_exception(e)
+
+        self.executor.submit(ocr_raster, raster, self.lang).add_done_callback(finish)
+        return result
+
+    def apply(self, page: PageData, future: "Future[OcrWords]") -> PageData:
+        try:
+            texts, bboxes = future.result()
+            page.words = WordColumns.from_texts(page.page_num, texts, bboxes)
+            logger.info(f"OCR read {len(texts)} words on page {page.page_num}")
+        except Exception as e:
+            logger.warning(f"OCR failed on page {page.page_num}: {str(e)}")
+        return page
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "workers": self.max_workers,
+                "pages_ocred": self.pages_ocred,
+                "cache_hits": self.cache_hits,
+                "cache": self.cache.stats()
+            }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+        logger.info("OCR engine stopped.")
+
+
+def tesseract_available() -> bool:
+    try:
+        import pytesseract
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception as e:
+        logger.warning(f"Tesseract is not available, scanned pages will not be OCR'd: {str(e)}")
+        return False
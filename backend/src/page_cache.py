@@ -0,0 +1,189 @@
+import hashlib
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .cache import DiskLRUCache
+from .config import MODELS, PAGE_CACHE
+from .page_engine import RenderSpec
+from .page_model import PageData, WordColumns
+from .pdf_session import PDFDocumentSession
+from utils.logger import get_logger
+
+logger = get_logger("page_cache")
+
+# bump when the cached page layout or the extraction it stores changes
+PAGE_CACHE_VERSION = "1"
+
+
+def font_digest(doc, font: tuple) -> bytes:
+    # names and types alone do not tell subset fonts apart; the embedded
+    # program and the ToUnicode map decide which text the glyphs become
+    digest = hashlib.sha256(repr(font[1:]).encode())
+    xref = font[0]
+    if xref > 0:
+        digest.update(doc.extract_font(xref)[-1] or b"")
+        kind, value = doc.xref_get_key(xref, "ToUnicode")
+        if kind == "xref":
+            digest.update(doc.xref_stream_raw(int(value.split()[0])) or b"")
+    return digest.digest()
+
+
+def page_content_hash(doc, page, fonts: Optional[Dict[int, bytes]] = None) -> str:
+    """Hash of everything that decides a page's words and pixels.
+
+    The content stream alone is not enough: scanned pages share the same
+    few drawing operators and differ only in their image streams, so the
+    raw streams of images and form XObjects are hashed too, along with
+    the fonts and page geometry. ``fonts`` memoizes font digests by xref,
+    since most pages of a document share their fonts.
+    """
+    fonts = {} if fonts is None else fonts
+    digest = hashlib.sha256(PAGE_CACHE_VERSION.encode())
+    digest.update(repr((tuple(page.rect), page.rotation)).encode())
+    digest.update(page.read_contents())
+    for image in page.get_images(full=True):
+        digest.update(doc.xref_stream_raw(image[0]) or b"")
+    for xobject in page.get_xobjects():
+        digest.update(doc.xref_stream_raw(xobject[0]) or b"")
+    for font in page.get_fonts(full=True):
+        if font[0] not in fonts:
+            fonts[font[0]] = font_digest(doc, font)
+        digest.update(fonts[font[0]])
+    return digest.hexdigest()
+
+
+class PageHashes:
+    """Content hashes of one document's pages, each computed on first use.
+
+    A page that cannot be hashed gets None and is neither read from nor
+    written to the cache; it is still extracted as usual.
+    """
+
+    def __init__(self, session: PDFDocumentSession):
+        self.session = session
+        self.hashes: Dict[int, Optional[str]] = {}
+        self.fonts: Dict[int, bytes] = {}
+
+    def get(self, page_num: int) -> Optional[str]:
+        with self.session.lock:
+            if page_num not in self.hashes:
+                try:
+                    self.hashes[page_num] = page_content_hash(self.session.doc, self.session.page(page_num), self.fonts)
+                except Exception as e:
+                    logger.warning(f"Not caching page {page_num} of '{self.session.file_path.name}': {str(e)}")
+                    self.hashes[page_num] = None
+            return self.hashes[page_num]
+
+
+def detector_id() -> str:
+    settings = MODELS["table_transformer"]
+    return f"{settings['name']}|{settings.get('backend', 'torch')}|{settings.get('threshold', 0.7)}"
+
+
+class PageCache:
+    """Caches per-page extraction results by page content.
+
+    Words, block classification and page size are stored under the page's
+    content hash. Detected tables are stored under the content hash, the
+    render spec and the detector id. The same page in a re-run, or in a
+    near-identical filing at a different position, is read from the cache
+    and skips extraction and table detection.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.store = DiskLRUCache(cache_dir, max_bytes, suffix=".pkl")
+        self.detector = detector_id()
+        self.lock = threading.Lock()
+        self.page_hits = 0
+        self.table_hits = 0
+
+    def page_hashes(self, session: PDFDocumentSession) -> PageHashes:
+        return PageHashes(session)
+
+    def page_key(self, content_hash: str) -> str:
+        return f"{content_hash}_page"
+
+    def tables_key(self, content_hash: str, spec: RenderSpec) -> str:
+        variant = hashlib.sha256(f"{spec!r}|{self.detector}".encode()).hexdigest()[:16]
+        return f"{content_hash}_tables_{variant}"
+
+    def get_page(self, content_hash: str, page_num: int) -> Optional[PageData]:
+        data = self.store.get(self.page_key(content_hash))
+        if data is None:
+            return None
+        try:
+            words, structured_text, width, height = pickle.loads(data)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable page cache entry {content_hash[:12]}: {str(e)}")
+            self.store.invalidate(self.page_key(content_hash))
+            return None
+
+        # the same page may sit at another position in a different filing
+        words.page_num = page_num
+        # the index forgets word counts on restart; relearn it from the read
+        self.store.set_meta(self.page_key(content_hash), len(words))
+        with self.lock:
+            self.page_hits += 1
+        return PageData(page_num, words, tables=[], structured_text=structured_text, width=width, height=height)
+
+    def put_page(self, content_hash: str, page: PageData) -> bool:
+        key = self.page_key(content_hash)
+        words = page.words
+        # pages served from the cache are not written back; an entry stored
+        # before OCR read its page is replaced once the page has words
+        cached_words = self.store.get_meta(key)
+        if key in self.store and (not len(words) or cached_words is None or cached_words):
+            return False
+        # spilled pages hold memory-mapped bboxes; store plain arrays
+        words = WordColumns(words.page_num, words.text, np.asarray(words.starts), np.asarray(words.ends), np.array(words.bboxes))
+        data = pickle.dumps((words, page.structured_text, page.width, page.height), protocol=pickle.HIGHEST_PROTOCOL)
+        return self.store.put(key, data, meta=len(words))
+
+    def get_tables(self, content_hash: str, spec: RenderSpec) -> Optional[List[Dict[str, Any]]]:
+        data = self.store.get(self.tables_key(content_hash, spec))
+        if data is None:
+            return None
+        try:
+            tables = pickle.loads(data)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable table cache entry {content_hash[:12]}: {str(e)}")
+            self.store.invalidate(self.tables_key(content_hash, spec))
+            return None
+
+        with self.lock:
+            self.table_hits += 1
+        return tables
+
+    def put_tables(self, content_hash: str, spec: RenderSpec, tables: List[Dict[str, Any]]) -> bool:
+        return self.store.put(self.tables_key(content_hash, spec), pickle.dumps(tables, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def load_page(self, page_hashes: PageHashes, page_num: int) -> Optional[PageData]:
+        content_hash = page_hashes.get(page_num)
+        if content_hash is None:
+            return None
+        return self.get_page(content_hash, page_num)
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            hits = {"page_hits": self.page_hits, "table_hits": self.table_hits}
+        return {**self.store.stats(), **hits, "detector": self.detector}
+
+
+page_cache = None
+page_cache_lock = threading.Lock()
+
+def get_page_cache() -> Optional[PageCache]:
+    global page_cache
+    if not PAGE_CACHE["enabled"]:
+        return None
+    with page_cache_lock:
+        if page_cache is None:
+            page_cache = PageCache(
+                Path(PAGE_CACHE["dir"]),
+                max_bytes=PAGE_CACHE["max_size_mb"] * 1024 * 1024
+            )
+        return page_cache
@@ -0,0 +1,136 @@
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Iterator, Optional, Tuple
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .page_workers import (
+    BLOCK_SEP, DEFAULT_RENDER_SPEC, PackedRaster, RenderSpec, extract_pages, render_page, render_page_raster,
+    worker_context
+)
+from utils.logger import get_logger
+
+logger = get_logger("page_engine")
+
+
+def render_scale(width: float, height: float, shortest_edge: int, longest_edge: int, max_scale: float) -> float:
+    # the scale at which the page already matches the detector's resize target
+    scale = min(shortest_edge / min(width, height), longest_edge / max(width, height))
+    return min(scale, max_scale)
+
+
+def content_clip(bboxes: np.ndarray, width: float, height: float, margin: float) -> Optional[Tuple[float, float, float, float]]:
+    if not len(bboxes):
+        return None
+    return (
+        max(0.0, float(bboxes[:, 0].min()) - margin),
+        max(0.0, float(bboxes[:, 1].min()) - margin),
+        min(width, float(bboxes[:, 2].max()) + margin),
+        min(height, float(bboxes[:, 3].max()) + margin)
+    )
+
+
+def to_page_bbox(bbox: List[float], spec: RenderSpec) -> List[float]:
+    scale, clip, _ = spec
+    x0, y0 = (clip[0], clip[1]) if clip else (0.0, 0.0)
+    return [x0 + bbox[0] / scale, y0 + bbox[1] / scale, x0 + bbox[2] / scale, y0 + bbox[3] / scale]
+
+
+def raster_to_array(raster: PackedRaster) -> np.ndarray:
+    samples, height, width, channels = raster
+    array = np.frombuffer(samples, dtype=np.uint8).reshape(height, width, channels)
+    if channels == 1:
+        # the detector expects RGB; a broadcast view avoids copying the plane
+        array = np.broadcast_to(array, (height, width, 3))
+    return array
+
+
+def render_page_array(page, spec: RenderSpec = DEFAULT_RENDER_SPEC) -> np.ndarray:
+    return raster_to_array(render_page_raster(page, spec))
+
+
+def unpack_blocks(blocks_text: str, blocks_bbox: bytes) -> List[Tuple[str, List[float]]]:
+    if not blocks_text:
+        return []
+    bboxes = np.frombuffer(blocks_bbox, dtype=np.float32).reshape(-1, 4).tolist()
+    return list(zip(blocks_text.split(BLOCK_SEP), bboxes))
+
+
+class ProcessPageEngine:
+
+    def __init__(self, max_workers: int, scheduler, pages_per_task: int = 8):
+        self.max_workers = max(1, max_workers)
+        self.pages_per_task = max(1, pages_per_task)
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=worker_context())
+        self.scheduler = scheduler
+        logger.info(f"Process page engine started with {self.max_workers} workers.")
+
+    def submit(self, doc_key: Any, fn, *args, front: bool = False) -> Future:
+        # tasks from concurrent documents reach the pool in the scheduler's
+        # round-robin order instead of the pool's FIFO order
+        return self.scheduler.submit(doc_key, self.run_in_pool, fn, *args, front=front)
+
+    def run_in_pool(self, fn, *args):
+        return self.executor.submit(fn, *args).result()
+
+    def page_ranges(self, page_count: int) -> List[Tuple[int, int]]:
+        per_worker = -(-page_count // self.max_workers)
+        step = max(1, min(self.pages_per_task, per_worker))
+        return [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+
+    def extract_range(self, file_path: str, start: int, end: int,
+                      lookup: Optional[Callable[[int], Any]] = None) -> List[Any]:
+        # runs on a scheduler thread: pages ``lookup`` returns are not sent to a worker
+        found = {}
+        if lookup is not None:
+            for page_num in range(start, end):
+                value = lookup(page_num)
+                if value is not None:
+                    found[page_num] = value
+        missing = [page_num for page_num in range(start, end) if page_num not in found]
+        if missing:
+            found.update((packed[0], packed) for packed in self.run_in_pool(extract_pages, file_path, missing))
+        return [found[page_num] for page_num in sorted(found)]
+
+    def iter_pages(self, file_path: Path, page_count: int, doc_key: Any = None,
+                   lookup: Optional[Callable[[int], Any]] = None) -> Iterator[Any]:
+        """Yields a PackedPage per page in page order, or whatever ``lookup``
+        returned for the page when that is not None."""
+        doc_key = doc_key if doc_key is not None else file_path
+        futures = [
+            self.scheduler.submit(doc_key, self.extract_range, str(file_path), start, end, lookup)
+            for start, end in self.page_ranges(page_count)
+        ]
+
+        # ranges are yielded in page order as soon as each one is ready
+        try:
+            for future in futures:
+                try:
+                    yield from future.result()
+                except Exception as e:
+                    logger.warning(f"Page range extraction failed: {str(e)}")
+        finally:
+            # a consumer that stops early leaves no ranges queued for nobody
+            for future in futures:
+                future.cancel()
+
+    def render_pages(self, file_path: Path, specs: Dict[int, RenderSpec], doc_key: Any = None) -> Iterator[Tuple[int, PackedRaster]]:
+        doc_key = doc_key if doc_key is not None else file_path
+        futures = [
+            # the document's thread waits on these, ahead of its queued page ranges
+            self.submit(doc_key, render_page, str(file_path), page_num, spec, front=True)
+            for page_num, spec in specs.items()
+        ]
+        try:
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    logger.warning(f"Page rendering failed: {str(e)}")
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+        logger.info("Process page engine stopped.")
@@ -0,0 +1,283 @@
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from .spatial_index import BBox, SpatialIndex
+
+
+class WordColumns:
+    """Words of one page stored column-wise.
+
+    ``text`` is the page's words joined by single spaces; word ``i`` is
+    ``text[starts[i]:ends[i]]``. Bounding boxes live in one float32 (n, 4)
+    array, so a page costs a string and three arrays instead of a dict and
+    a list per word.
+    """
+
+    __slots__ = ('page_num', 'text', 'starts', 'ends', 'bboxes')
+
+    def __init__(self, page_num: int, text: str, starts: np.ndarray, ends: np.ndarray, bboxes: np.ndarray):
+        self.page_num = page_num
+        self.text = text
+        self.starts = starts
+        self.ends = ends
+        self.bboxes = bboxes
+
+    @classmethod
+    def from_texts(cls, page_num: int, texts: List[str], bboxes: Any) -> 'WordColumns':
+        lengths = np.fromiter(map(len, texts), dtype=np.int32, count=len(texts))
+        ends = np.cumsum(lengths + 1, dtype=np.int32) - 1
+        starts = ends - lengths
+        bboxes = np.asarray(bboxes, dtype=np.float32).reshape(-1, 4)
+        return cls(page_num, " ".join(texts), starts, ends, bboxes)
+
+    @classmethod
+    def from_words(cls, page_num: int, words: List[tuple]) -> 'WordColumns':
+        # PyMuPDF "words" tuples: (x0, y0, x1, y1, text, block, line, word)
+        return cls.from_texts(page_num, [w[4] for w in words], [w[:4] for w in words])
+
+    @classmethod
+    def from_instances(cls, page_num: int, instances: Iterable[Dict[str, Any]]) -> 'WordColumns':
+        instances = list(instances)
+        return cls.from_texts(page_num, [t['text'] for t in instances], [t['bbox'] for t in instances])
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def word(self, index: int) -> str:
+        return self.text[self.starts[index]:self.ends[index]]
+
+    def texts(self) -> List[str]:
+        if not len(self):
+            return []
+        texts = self.text.split(" ")
+        if len(texts) != len(self):
+            # a word holding a space (OCR, instances) splits in two; slice by offsets instead
+            texts = [self.text[start:end] for start, end in zip(self.starts.tolist(), self.ends.tolist())]
+        return texts
+
+    def subset(self, indices: np.ndarray) -> 'WordColumns':
+        texts = self.texts()
+        return WordColumns.from_texts(self.page_num, [texts[i] for i in indices.tolist()], self.bboxes[indices])
+
+    def instance(self, index: int) -> Dict[str, Any]:
+        return {
+            'text': self.word(index),
+            'bbox': self.bboxes[index].tolist(),
+            'page': self.page_num,
+            'confidence': 1.0
+        }
+
+
+class TextInstances(Sequence):
+    """Read-only list-of-dicts view over one or more WordColumns.
+
+    Sections spanning a page break pass one WordColumns per page.
+    """
+
+    __slots__ = ('parts', 'ends')
+
+    def __init__(self, *parts: WordColumns):
+        self.parts = parts
+        self.ends = np.cumsum([len(part) for part in parts], dtype=np.int64)
+
+    @property
+    def words(self) -> WordColumns:
+        return self.parts[0]
+
+    def __len__(self) -> int:
+        return int(self.ends[-1]) if len(self.ends) else 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        part = int(np.searchsorted(self.ends, index, side='right'))
+        offset = int(self.ends[part - 1]) if part else 0
+        return self.parts[part].instance(index - offset)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for part in self.parts:
+            for index in range(len(part)):
+                yield part.instance(index)
+
+
+# rough per-block cost of the dict, its bbox list and the type string
+BLOCK_OVERHEAD = 400
+
+
+def structured_bytes(structured_text: Optional[Dict[str, Any]]) -> int:
+    if not structured_text:
+        return 0
+    return sum(len(block['text']) + BLOCK_OVERHEAD for blocks in structured_text.values() for block in blocks)
+
+
+class PageData(Mapping):
+    """Compact page record that still reads like the original page dict.
+
+    ``page['text_instances']`` returns a TextInstances view built from the
+    word columns; ``text``, ``text_upper`` and ``text_lower`` are shared by
+    every consumer and the case-folded views are built once on first use.
+
+    Under a memory budget a PageStore may spill the word columns and the
+    classified blocks to disk; they are read back transparently the next
+    time ``words`` or ``structured_text`` is used.
+    """
+
+    # __weakref__ because the PageStore tracks pages without keeping them alive
+    __slots__ = ('page_num', 'tables', 'width', 'height', '_words', '_structured_text',
+                 '_store', '_text_upper', '_text_lower', '_spatial_index', '__weakref__')
+
+    KEYS = ('page_num', 'text_instances', 'tables', 'structured_text', 'width', 'height')
+
+    def __init__(self, page_num: int, words: WordColumns, tables: Optional[List[Dict[str, Any]]] = None,
+                 structured_text: Optional[Dict[str, Any]] = None, width: float = 0.0, height: float = 0.0):
+        self.page_num = page_num
+        self._words = words
+        self._store = None
+        self.tables = tables if tables is not None else []
+        self._structured_text = structured_text if structured_text is not None else {}
+        self.width = width
+        self.height = height
+        self._text_upper = None
+        self._text_lower = None
+        self._spatial_index = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'text_instances':
+            return TextInstances(self.words)
+        if key in self.KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key == 'text_instances':
+            self.words = WordColumns.from_instances(self.page_num, value)
+        elif key in self.KEYS:
+            setattr(self, key, value)
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def __repr__(self) -> str:
+        return f"PageData(page_num={self.page_num}, words={len(self.words)}, tables={len(self.tables)})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # pickles carry the words themselves, never the spill store
+        return {
+            'page_num': self.page_num,
+            'words': self.words,
+            'tables': self.tables,
+            'structured_text': self.structured_text,
+            'width': self.width,
+            'height': self.height
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(state['page_num'], state['words'], state['tables'],
+                      state['structured_text'], state['width'], state['height'])
+
+    @property
+    def words(self) -> WordColumns:
+        words = self._words
+        if words is None:
+            words = self._store.load(self)
+        return words
+
+    @words.setter
+    def words(self, words: WordColumns):
+        self._words = words
+        self.clear_views()
+
+    @property
+    def structured_text(self) -> Dict[str, Any]:
+        if self._structured_text is None:
+            self._store.load(self)
+        return self._structured_text
+
+    @structured_text.setter
+    def structured_text(self, structured_text: Dict[str, Any]):
+        self._structured_text = structured_text
+
+    def clear_views(self):
+        self._text_upper = None
+        self._text_lower = None
+        self._spatial_index = None
+
+    def view_built(self):
+        if self._store is not None:
+            self._store.refresh(self)
+
+    def release(self):
+        """Drops the in-memory words and blocks; the store must be able to reload them."""
+        self._words = None
+        self._structured_text = None
+        self.clear_views()
+
+    @property
+    def resident_bytes(self) -> int:
+        words = self._words
+        if words is None:
+            return 0
+        size = len(words.text) + words.starts.nbytes + words.ends.nbytes + words.bboxes.nbytes
+        size += structured_bytes(self._structured_text)
+        for view in (self._text_upper, self._text_lower):
+            if view is not None:
+                size += len(view)
+        index = self._spatial_index
+        if index is not None:
+            size += index.cell_words.nbytes + index.cell_starts.nbytes
+        return size
+
+    @property
+    def text(self) -> str:
+        return self.words.text
+
+    @property
+    def text_upper(self) -> str:
+        if self._text_upper is None:
+            self._text_upper = self.words.text.upper()
+            self.view_built()
+        return self._text_upper
+
+    @property
+    def text_lower(self) -> str:
+        if self._text_lower is None:
+            self._text_lower = self.words.text.lower()
+            self.view_built()
+        return self._text_lower
+
+    @property
+    def word_offsets(self) -> np.ndarray:
+        return self.words.starts
+
+    def words_at(self, starts: List[int], ends: List[int]) -> List[range]:
+        offsets = self.words.starts
+        first = np.searchsorted(offsets, np.asarray(starts), side='right') - 1
+        last = np.searchsorted(offsets, np.asarray(ends) - 1, side='right') - 1
+        return [range(int(begin), int(end) + 1) for begin, end in zip(first, last)]
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        if self._spatial_index is None:
+            self._spatial_index = SpatialIndex(self.words.bboxes)
+            self.view_built()
+        return self._spatial_index
+
+    def words_in(self, bbox: BBox, min_overlap: float = 0.5) -> np.ndarray:
+        return self.spatial_index.words_in(bbox, min_overlap)
+
+    def nearest(self, bbox: BBox, k: int = 1) -> np.ndarray:
+        return self.spatial_index.nearest(bbox, k)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: (list(self[key]) if key == 'text_instances' else self[key]) for key in self.KEYS}
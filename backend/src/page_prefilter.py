@@ -0,0 +1,58 @@
+import re
+from typing import Dict, List
+
+from .config import SECTION_PATTERNS
+from .page_model import PageData
+
+STATEMENT_HEADING_RE = re.compile(
+    "|".join(f"(?:{pattern})" for patterns in SECTION_PATTERNS.values() for pattern in patterns)
+)
+NUMERIC_TOKEN_RE = re.compile(r'^\(?-?\$?[\d,]*\d(?:\.\d+)?\)?%?$')
+YEAR_TOKEN_RE = re.compile(r'^(?:19|20)\d{2}$')
+
+HEADING_SCORE = 10.0
+CONTINUATION_SCORE = 3.0
+NUMERIC_DENSITY_WEIGHT = 10.0
+MIN_NUMERIC_TOKENS = 10
+
+
+def score_page(page: PageData) -> float:
+    words = page.words.texts()
+    if not words:
+        return 0.0
+
+    score = 0.0
+    if STATEMENT_HEADING_RE.search(page.text_upper):
+        score += HEADING_SCORE
+
+    numeric_count = 0
+    year_count = 0
+    for word in words:
+        if NUMERIC_TOKEN_RE.match(word):
+            numeric_count += 1
+            if YEAR_TOKEN_RE.match(word):
+                year_count += 1
+
+    if numeric_count >= MIN_NUMERIC_TOKENS:
+        score += NUMERIC_DENSITY_WEIGHT * (numeric_count - year_count) / len(words)
+    if year_count >= 2:
+        score += 1.0
+
+    return score
+
+
+def score_pages(pages_data: List[PageData]) -> Dict[int, float]:
+    scores = {page['page_num']: score_page(page) for page in pages_data if page}
+
+    # statements often run onto the page after their heading
+    for page_num, score in list(scores.items()):
+        if score >= HEADING_SCORE and page_num + 1 in scores:
+            scores[page_num + 1] += CONTINUATION_SCORE
+
+    return scores
+
+
+def select_candidate_pages(scores: Dict[int, float], max_candidates: int, min_score: float) -> List[int]:
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    selected = [page_num for page_num, score in ranked[:max_candidates] if score >= min_score]
+    return sorted(selected)
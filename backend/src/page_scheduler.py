@@ -0,0 +1,136 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+from .config import PDF_PROCESSING
+from utils.logger import get_logger
+
+logger = get_logger("page_scheduler")
+
+# (future, fn, args, enqueued_at)
+PageTask = Tuple[Future, Callable[..., Any], tuple, float]
+
+
+class PageScheduler:
+    """Process-wide page worker pool shared by every in-flight document.
+
+    Each document gets its own queue, and workers take one task per document
+    in round-robin order. A large document therefore cannot starve a small
+    one that arrived after it, and the total number of page workers stays
+    at ``max_workers`` however many documents are open. A task submitted
+    with ``front=True`` jumps its own document's queue, for work the
+    document's thread is waiting on; other documents keep their turn.
+    """
+
+    def __init__(self, max_workers: int, wait_samples: int = 1024):
+        self.max_workers = max(1, max_workers)
+        self.condition = threading.Condition()
+        self.queues: "OrderedDict[Hashable, Deque[PageTask]]" = OrderedDict()
+        self.queue_depth = 0
+        self.busy = 0
+        self.completed = 0
+        self.waits: Deque[float] = deque(maxlen=wait_samples)
+        self._stopped = False
+        self._workers = [
+            threading.Thread(target=self._run, name=f"page-worker-{i}", daemon=True)
+            for i in range(self.max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+        logger.info(f"Page scheduler started with {self.max_workers} workers.")
+
+    def submit(self, doc_key: Hashable, fn: Callable[..., Any], *args, front: bool = False) -> Future:
+        future = Future()
+        with self.condition:
+            if self._stopped:
+                future.set_exception(RuntimeError("Page scheduler is stopped"))
+                return future
+            tasks = self.queues.setdefault(doc_key, deque())
+            task = (future, fn, args, time.monotonic())
+            if front:
+                tasks.appendleft(task)
+            else:
+                tasks.append(task)
+            self.queue_depth += 1
+            self.condition.notify()
+        return future
+
+    def _next_task(self) -> PageTask:
+        # the document at the front gives up one task and moves to the back
+        doc_key, tasks = next(iter(self.queues.items()))
+        task = tasks.popleft()
+        if tasks:
+            self.queues.move_to_end(doc_key)
+        else:
+            del self.queues[doc_key]
+        self.queue_depth -= 1
+        return task
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.queues and not self._stopped:
+                    self.condition.wait()
+                if not self.queues:
+                    return
+                future, fn, args, enqueued_at = self._next_task()
+                self.waits.append(time.monotonic() - enqueued_at)
+                self.busy += 1
+
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args))
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                with self.condition:
+                    self.busy -= 1
+                    self.completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self.condition:
+            waits = sorted(self.waits)
+            return {
+                "workers": self.max_workers,
+                "busy": self.busy,
+                "queue_depth": self.queue_depth,
+                "documents_queued": len(self.queues),
+                "completed": self.completed,
+                "avg_wait_ms": round(sum(waits) / len(waits) * 1000, 2) if waits else 0.0,
+                "p95_wait_ms": round(waits[int(0.95 * (len(waits) - 1))] * 1000, 2) if waits else 0.0,
+                "max_wait_ms": round(waits[-1] * 1000, 2) if waits else 0.0
+            }
+
+    def shutdown(self, wait: bool = True):
+        # queued tasks still run; new submissions are refused
+        with self.condition:
+            self._stopped = True
+            self.condition.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+        logger.info("Page scheduler stopped.")
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+
+page_scheduler = None
+page_scheduler_lock = threading.Lock()
+
+def get_page_scheduler() -> PageScheduler:
+    global page_scheduler
+    with page_scheduler_lock:
+        if page_scheduler is None or page_scheduler.stopped:
+            page_scheduler = PageScheduler(PDF_PROCESSING["page_workers"])
+        return page_scheduler
+
+
+def current_page_scheduler() -> Optional[PageScheduler]:
+    # the running scheduler, if any, without starting one
+    with page_scheduler_lock:
+        return page_scheduler
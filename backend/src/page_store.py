@@ -0,0 +1,131 @@
+import pickle
+import shutil
+import threading
+import uuid
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Tuple
+
+import numpy as np
+
+from .page_model import PageData, WordColumns
+from utils.logger import get_logger
+
+logger = get_logger("page_store")
+
+
+class PageStore:
+    """Keeps one document's word columns within a memory budget.
+
+    Pages are admitted as they are extracted. The budget covers each page's
+    word columns, the views built on them and its classified blocks. When
+    the resident total goes over budget, the least recently used pages are
+    written to a per-document directory and released. Text goes to a .txt
+    file, the arrays to .npy files and the blocks to a pickle. A released
+    page reads them back the next time a stage uses them, with bboxes
+    memory-mapped. The directory is removed once the store
+    and all of its pages are garbage collected.
+    """
+
+    def __init__(self, spill_dir: Path, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self.path = Path(spill_dir) / uuid.uuid4().hex
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.RLock()
+        self.resident: "OrderedDict[int, Tuple[weakref.ref, int]]" = OrderedDict()
+        self.resident_bytes = 0
+        self.peak_bytes = 0
+        self.on_disk = set()
+        # pages already reported as over budget on their own
+        self.oversized = set()
+        self.spills = 0
+        self.reloads = 0
+        weakref.finalize(self, shutil.rmtree, str(self.path), True)
+
+    def admit(self, page: PageData):
+        with self.lock:
+            page._store = self
+            self._track(page)
+            self._enforce(keep=page.page_num)
+
+    def load(self, page: PageData) -> WordColumns:
+        with self.lock:
+            words = page._words
+            if words is None:
+                words, page._structured_text = self._read(page.page_num)
+                page._words = words
+                self.reloads += 1
+            self._track(page)
+            self._enforce(keep=page.page_num)
+            return words
+
+    def _track(self, page: PageData):
+        previous = self.resident.pop(page.page_num, None)
+        if previous is not None:
+            self.resident_bytes -= previous[1]
+        size = page.resident_bytes
+        self.resident[page.page_num] = (weakref.ref(page), size)
+        self.resident_bytes += size
+        self.peak_bytes = max(self.peak_bytes, self.resident_bytes)
+
+    def _enforce(self, keep: int):
+        while self.resident_bytes > self.budget_bytes:
+            victim = next((num for num in self.resident if num != keep), None)
+            if victim is None:
+                if keep not in self.oversized:
+                    self.oversized.add(keep)
+                    logger.warning(f"Page {keep} alone exceeds the memory budget of {self.budget_bytes} bytes")
+                return
+            self._spill(victim)
+
+    def _spill(self, page_num: int):
+        ref, size = self.resident.pop(page_num)
+        self.resident_bytes -= size
+        page = ref()
+        if page is None or page._words is None:
+            return
+        if page_num not in self.on_disk:
+            self._write(page_num, page._words, page._structured_text)
+            self.on_disk.add(page_num)
+        page.release()
+        self.spills += 1
+
+    def _file(self, page_num: int, name: str) -> Path:
+        return self.path / f"p{page_num}_{name}"
+
+    def _write(self, page_num: int, words: WordColumns, structured_text: Dict[str, Any]):
+        self._file(page_num, "text.txt").write_text(words.text, encoding="utf-8")
+        self._file(page_num, "blocks.pkl").write_bytes(pickle.dumps(structured_text, protocol=pickle.HIGHEST_PROTOCOL))
+        np.save(self._file(page_num, "starts.npy"), words.starts)
+        np.save(self._file(page_num, "ends.npy"), words.ends)
+        np.save(self._file(page_num, "bboxes.npy"), words.bboxes)
+
+    def _read(self, page_num: int) -> Tuple[WordColumns, Dict[str, Any]]:
+        words = WordColumns(
+            page_num,
+            self._file(page_num, "text.txt").read_text(encoding="utf-8"),
+            np.load(self._file(page_num, "starts.npy")),
+            np.load(self._file(page_num, "ends.npy")),
+            np.load(self._file(page_num, "bboxes.npy"), mmap_mode='r')
+        )
+        return words, pickle.loads(self._file(page_num, "blocks.pkl").read_bytes())
+
+    def refresh(self, page: PageData):
+        """Re-measures a page after its derived views were built."""
+        with self.lock:
+            if page.page_num in self.resident:
+                self._track(page)
+                self._enforce(keep=page.page_num)
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "budget_mb": round(self.budget_bytes / (1024 * 1024), 2),
+                "resident_mb": round(self.resident_bytes / (1024 * 1024), 2),
+                "peak_mb": round(self.peak_bytes / (1024 * 1024), 2),
+                "resident_pages": len(self.resident),
+                "spilled_pages": len(self.on_disk),
+                "spills": self.spills,
+                "reloads": self.reloads
+            }
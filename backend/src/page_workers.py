@@ -0,0 +1,145 @@
+import multiprocessing
+import os
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+import fitz
+import numpy as np
+
+from .page_model import WordColumns
+from utils.logger import get_logger
+
+# Everything a page or OCR worker process runs lives here. Workers unpickle
+# their entry points by module path, so this module only imports fitz, numpy
+# and the page model: never the database, the pipeline or the ML models.
+
+logger = get_logger("page_workers")
+
+# Block text never contains control separators, so blocks travel as one
+# joined string per page; words already travel as WordColumns arrays.
+BLOCK_SEP = "\x1f"
+
+# Raw pixmap samples with their (height, width, channels) shape.
+PackedRaster = Tuple[bytes, int, int, int]
+
+# (scale, clip rect in page points or None, grayscale)
+RenderSpec = Tuple[float, Optional[Tuple[float, float, float, float]], bool]
+DEFAULT_RENDER_SPEC: RenderSpec = (2.0, None, False)
+
+# (page_num, width, height, words, blocks_text, blocks_bbox)
+PackedPage = Tuple[int, float, float, WordColumns, str, bytes]
+
+# open documents per worker process, most recently used last
+WORKER_OPEN_DOCUMENTS = 4
+_worker_docs: "OrderedDict[Tuple[str, int, int], Any]" = OrderedDict()
+
+
+def extract_text_blocks(page, textpage=None) -> List[Tuple[str, List[float]]]:
+    blocks = []
+    for block in page.get_text("dict", textpage=textpage).get("blocks", []):
+        if "lines" not in block:
+            continue
+
+        block_text = ""
+        for line in block["lines"]:
+            for span in line["spans"]:
+                text = span["text"].strip()
+                if text:
+                    block_text += text + " "
+
+        block_text = block_text.strip()
+        if block_text:
+            blocks.append((block_text, list(block["bbox"])))
+    return blocks
+
+
+def extract_page_text(page) -> Tuple[List[tuple], List[Tuple[str, List[float]]]]:
+    # One text layout per page: "words" and "dict" both read the same TextPage.
+    # Image blocks are never used, so the layout skips them.
+    textpage = page.get_textpage(flags=fitz.TEXTFLAGS_WORDS)
+    words = page.get_text("words", textpage=textpage)
+    blocks = extract_text_blocks(page, textpage=textpage)
+    return words, blocks
+
+
+def render_page_raster(page, spec: RenderSpec = DEFAULT_RENDER_SPEC) -> PackedRaster:
+    scale, clip, grayscale = spec
+    pix = page.get_pixmap(
+        matrix=fitz.Matrix(scale, scale),
+        colorspace=fitz.csGRAY if grayscale else fitz.csRGB,
+        alpha=False,
+        clip=fitz.Rect(clip) if clip else None
+    )
+    # The one deliberate copy out of the pixmap. samples_mv would avoid it,
+    # but it views memory the pixmap frees once it is collected, and a
+    # memoryview cannot be pickled back from a worker. The bytes are then
+    # pickled as-is or wrapped by np.frombuffer without another copy.
+    return pix.samples, pix.height, pix.width, pix.n
+
+
+def pack_page(page, page_num: int) -> PackedPage:
+    words, blocks = extract_page_text(page)
+
+    blocks_text = BLOCK_SEP.join(text for text, _ in blocks)
+    blocks_bbox = np.asarray([bbox for _, bbox in blocks], dtype=np.float32).reshape(-1, 4).tobytes()
+
+    return (page_num, page.rect.width, page.rect.height,
+            WordColumns.from_words(page_num, words), blocks_text, blocks_bbox)
+
+
+def worker_context():
+    # Workers are started after the page scheduler, batcher and thread pools,
+    # and a forked child can inherit one of their locks held (logging, fitz).
+    # Start them from a clean process instead.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _open_worker_document(file_path: str):
+    # the page scheduler interleaves documents, so each worker keeps a few open
+    stat = os.stat(file_path)
+    doc_key = (file_path, stat.st_mtime_ns, stat.st_size)
+    doc = _worker_docs.pop(doc_key, None)
+    if doc is None:
+        doc = fitz.open(file_path)
+        while len(_worker_docs) >= WORKER_OPEN_DOCUMENTS:
+            _, evicted = _worker_docs.popitem(last=False)
+            evicted.close()
+    _worker_docs[doc_key] = doc
+    return doc
+
+
+def extract_pages(file_path: str, page_nums: List[int]) -> List[PackedPage]:
+    doc = _open_worker_document(file_path)
+    results = []
+    for page_num in page_nums:
+        try:
+            results.append(pack_page(doc[page_num], page_num))
+        except Exception as e:
+            logger.warning(f"Worker failed to process page {page_num}: {str(e)}")
+    return results
+
+
+def render_page(file_path: str, page_num: int, spec: RenderSpec) -> Tuple[int, PackedRaster]:
+    doc = _open_worker_document(file_path)
+    return page_num, render_page_raster(doc[page_num], spec)
+
+
+def ocr_raster(raster: PackedRaster, lang: str) -> Tuple[List[str], List[List[float]]]:
+    # runs in an OCR worker process; boxes come back in render pixels
+    import pytesseract
+    from PIL import Image
+
+    samples, height, width, channels = raster
+    image = Image.frombytes("L" if channels == 1 else "RGB", (width, height), samples)
+    data = pytesseract.image_to_data(image, lang=lang, output_type=pytesseract.Output.DICT)
+
+    texts, boxes = [], []
+    for text, conf, left, top, w, h in zip(data["text"], data["conf"], data["left"], data["top"], data["width"], data["height"]):
+        text = text.strip()
+        if not text or float(conf) < 0:
+            continue
+        texts.append(text)
+        boxes.append([left, top, left + w, top + h])
+    return texts, boxes
@@ -1,25 +1,47 @@
 import warnings
 with warnings.catch_warnings():
     warnings.filterwarnings("ignore", message="Some weights of")
+import functools
 import time
 import asyncio
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Callable, Iterator, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
 import threading
-import re
-import fitz 
+from collections import deque
+import io
 from PIL import Image 
-import torch 
 from transformers import LayoutLMv3Processor, LayoutLMv3ForTokenClassification
 from transformers import AutoImageProcessor, AutoModelForObjectDetection
 import numpy as np 
 
-from .config import MODELS, MAX_FILE_SIZE_MB, FINANCIAL_CONFIG, ROUNDING_PATTERNS, CURRENCY_PATTERNS
+from .pdf_session import PDFDocumentSession
+from .table_batcher import TableDetectionBatcher
+from .page_scheduler import get_page_scheduler
+from .model_registry import get_model_registry
+from .table_backends import build_table_backend, detect_tables_with
+from . import block_classifier
+from .page_model import PageData, WordColumns
+from .page_store import PageStore
+from .ocr_engine import OcrEngine, ocr_blocks, tesseract_available
+from .page_cache import PageHashes, get_page_cache
+from .section_finder import SectionFinder
+from .pdf_result import PDFResult
+from .metadata_detector import MetadataDetector
+from .page_prefilter import score_pages, select_candidate_pages
+from .page_engine import (
+    ProcessPageEngine, RenderSpec, render_page_array, raster_to_array, unpack_blocks, render_scale, content_clip,
+    to_page_bbox
+)
+from .page_workers import extract_text_blocks, extract_page_text
+from .config import MODELS, PDF_PROCESSING
 from utils.logger import get_logger 
 
 logger = get_logger("pdf_processor")
 
+# (section_type, section); document metadata is only final once every page is read
+SectionCallback = Callable[[str, Dict[str, Any]], None]
+
 class PDFProcessor:
     
     _instance = None 
@@ -43,11 +65,31 @@ class PDFProcessor:
             self.layout_model = None 
             self.table_processor = None
             self.table_model = None 
+            self.table_backend = None
             self.device = MODELS["layoutlm"]["device"]
             self.models_loaded = False 
             self.model_lock = threading.Lock()
+            self.table_batcher = None
+
+            self.models = get_model_registry()
+            self.models.register("table_transformer", self.load_table_detector)
+            self.models.register("layoutlm", self.load_layout_model)
 
             self.thread_pool = ThreadPoolExecutor(max_workers=max_workers)
+
+            # one worker budget for the pages of every in-flight document
+            self.page_scheduler = get_page_scheduler()
+
+            self.page_engine = None
+            if PDF_PROCESSING["page_engine"] == "process":
+                self.page_engine = ProcessPageEngine(
+                    max_workers=PDF_PROCESSING["page_workers"],
+                    pages_per_task=PDF_PROCESSING["pages_per_task"],
+                    scheduler=self.page_scheduler
+                )
+
+            self.ocr_engine = self.create_ocr_engine()
+            self.page_cache = get_page_cache()
             
             self._initialized = True
             logger.info("PDF Processor initialized.")
@@ -62,38 +104,38 @@ class PDFProcessor:
     
     def cleanup(self):
         self.thread_pool.shutdown(wait=True)
+        if self.table_batcher is not None:
+            self.table_batcher.shutdown()
+        if self.page_engine is not None:
+            self.page_engine.shutdown()
+        if self.ocr_engine is not None:
+            self.ocr_engine.shutdown()
+        self.page_scheduler.shutdown()
         logger.info("PDF Processor cleaned.")
 
     def load_models(self) -> bool:
+        # Eager warm-up of what the PDF stage uses. Models otherwise load on
+        # first use, and LayoutLMv3 only loads through ensure_layout_model().
+        return self.ensure_table_model()
 
-        with self.model_lock:
-            if self.models_loaded:
-                return True 
-            
-            try:
-                st = time.time()
+    def ensure_table_model(self) -> bool:
+        return self.models.load("table_transformer")
 
-                futures = []
+    def ensure_layout_model(self) -> bool:
+        return self.models.load("layoutlm")
 
-                future1 = self.thread_pool.submit(self.load_layout_model)
-                futures.append(future1)
+    def load_table_detector(self) -> bool:
+        if not self.load_tableT_model():
+            return False
 
-                future2 = self.thread_pool.submit(self.load_tableT_model)
-                futures.append(future2)
-
-                for future in as_completed(futures):
-                    result = future.result()
-                    if not result:
-                        return False 
-                
-                load_time = time.time() - st 
-                self.models_loaded = True 
-                logger.info(f"All models loaded successfully in {load_time:.2f}s.")
-                return True 
-            except Exception as e:
-                logger.error(f"Error loading models: {str(e)}")
-                self.models_loaded = False 
-                return False
+        if MODELS["table_transformer"].get("batching", True):
+            self.table_batcher = TableDetectionBatcher(
+                self.detect_tables_batch,
+                max_batch_size=MODELS["table_transformer"]["max_batch_size"],
+                max_wait_ms=MODELS["table_transformer"]["max_wait_ms"]
+            )
+        self.models_loaded = True
+        return True
             
     def load_layout_model(self) -> bool:
         try:
@@ -128,197 +170,369 @@ class PDFProcessor:
             )
             self.table_model.to(self.device)
             self.table_model.eval()
-            logger.info("Table Transformer model loaded successfully.")
+            self.table_backend = build_table_backend(self.table_model, MODELS["table_transformer"])
+            logger.info(f"Table Transformer model loaded successfully ({self.table_backend.name} backend).")
             return True 
         except Exception as e:
             logger.error("Error loading the Table Transformer model.")
             return False 
         
-    async def process_pdf_async(self, file_path: Path) -> Dict[str, Any]:
+    async def process_pdf_async(self, file_path: Path, on_section: Optional[SectionCallback] = None) -> Dict[str, Any]:
         loop = asyncio.get_event_loop()
 
         result = await loop.run_in_executor(
             self.thread_pool,
             self.process_pdf_sync,
-            file_path
+            file_path,
+            on_section
         )
 
         return result
     
-    def process_pdf_sync(self, file_path: Path) -> Dict[str, Any]:
+    def process_pdf_sync(self, file_path: Path, on_section: Optional[SectionCallback] = None) -> Dict[str, Any]:
         try:
             st = time.time()
 
-            is_valid, message = self.validate_pdf(file_path)
-            if not is_valid:
-                raise ValueError(f"Invalid PDF: {message}")
+            with PDFDocumentSession(file_path) as session:
+                if not session.is_valid:
+                    raise ValueError(f"Invalid PDF: {session.message}")
 
-            pdf = fitz.open(file_path)
-            page_count = len(pdf)
+                pages_data = []
+                page_store = self.create_page_store()
+                document_metadata = self.default_financial_metadata()
+                metadata_detector = MetadataDetector(document_metadata)
 
-            with ThreadPoolExecutor(max_workers=min(4, page_count)) as executor:
-                
-                futures = []
-
-                for page_num in range(page_count):
-                    future = executor.submit(
-                        self.process_single_page,
-                        file_path,
-                        page_num
-                    )
-                    futures.append((page_num, future))
-
-                pages_data = [None] * page_count
-                for page_num, future in futures:
-                    try:
-                        page_data = future.result()
-                        pages_data[page_num] = page_data
-                    except Exception as e:
-                        logger.warning(f"Failed to process page {page_num}: {str(e)}")
-                        pages_data[page_num] = None 
-            
-            pdf.close()
+                page_hashes = self.page_cache.page_hashes(session) if self.page_cache is not None else None
 
-            pages_data = [p for p in pages_data if p is not None]
+                # a section is cropped to its detected table before it is handed out
+                detected_pages = set()
 
-            sections_future = self.thread_pool.submit(
-                self.find_financial_sections,
-                pages_data
-            )
+                def detect_section_tables(page: PageData):
+                    if page.page_num not in detected_pages:
+                        detected_pages.update(self.detect_page_tables(session, [page], page_hashes))
+
+                section_finder = SectionFinder(detect_tables=detect_section_tables)
+                pages = self.iter_pages(session, page_hashes)
+                if self.ocr_engine is not None:
+                    pages = self.ocr_pages(session, pages, wanted=lambda: not section_finder.complete())
+
+                for page in pages:
+                    pages_data.append(page)
+                    content_hash = page_hashes.get(page.page_num) if page_hashes is not None else None
+                    if content_hash:
+                        self.page_cache.put_page(content_hash, page)
+                    if page_store is not None:
+                        page_store.admit(page)
+                    self.update_financial_metadata(metadata_detector, page)
+
+                    for section_type, section in section_finder.feed(page):
+                        if on_section:
+                            on_section(section_type, section)
 
-            full_text = self.combine_text(pages_data)
+                for section_type, section in section_finder.flush():
+                    if on_section:
+                        on_section(section_type, section)
 
-            sections = sections_future.result()
+                fallback = section_finder.fallback()
+                if fallback and on_section:
+                    on_section('profit_loss', fallback)
 
-            document_metadata = self.extract_financial_metadata(pages_data)
+                prefilter = self.detect_candidate_tables(session, pages_data, page_hashes, detected_pages)
 
-            result = {
+            values = {
                 'filename': file_path.name,
                 'page_count': len(pages_data),
                 'pages': pages_data,
-                'sections': sections,
-                'full_text': full_text,
                 'document_metadata': document_metadata,
+                'prefilter': prefilter,
                 'processing_time': time.time() - st
             }
-            
-            logger.info(f"Processed PDF '{file_path.name}' | Pages: {len(pages_data)} | Sections: {len([s for s in sections.values() if s])} | Time: {result['processing_time']:.2f}s")
+            loaders = {
+                'sections': lambda: section_finder.finish(pages_data)[0],
+                'full_text': lambda: self.combine_text(pages_data)
+            }
+            if page_store is not None:
+                values['memory'] = page_store.stats()
+                logger.info(f"Page memory for '{file_path.name}': {values['memory']}")
+            result = PDFResult(values, loaders)
+
+            # The LLM stage reads these from async code, so build them here in
+            # the worker thread. Full text is only read when no statement was found.
+            result.materialize('sections')
+            if not section_finder.found():
+                result.materialize('full_text')
+
+            logger.info(f"Processed PDF '{file_path.name}' | Pages: {len(pages_data)} | Statements: {len(section_finder.found())} | Table pages: {len(prefilter['detected_pages'])} (skip rate {prefilter['skip_rate']:.0%}) | Time: {result['processing_time']:.2f}s")
             return result
         except Exception as e:
             logger.error(f"Error processing PDF: {str(e)}")
             raise
 
-    def validate_pdf(self, file_path: Path) -> Tuple[bool, str]:
-        try:
-            if not file_path.exists():
-                return False, "File not found"
-            
-            file_size_mb = file_path.stat().st_size / (1024 * 1024)
-            if file_size_mb > MAX_FILE_SIZE_MB:
-                return False, f"File too large: {file_size_mb:.1f}MB > {MAX_FILE_SIZE_MB}MB"
-            
-            try:
-                pdf = fitz.open(file_path)
-                page_count = len(pdf)
-                pdf.close()
+    def create_ocr_engine(self) -> Optional[OcrEngine]:
+        settings = PDF_PROCESSING["ocr"]
+        if not settings["enabled"] or not tesseract_available():
+            return None
+        return OcrEngine(
+            scheduler=self.page_scheduler,
+            max_workers=settings["workers"],
+            dpi=settings["dpi"],
+            lang=settings["lang"],
+            min_words=settings["min_words"],
+            cache_dir=Path(settings["cache_dir"]),
+            cache_max_bytes=settings["cache_max_mb"] * 1024 * 1024
+        )
 
-                if page_count == 0:
-                    return False, "PDF has no pages"
+    def ocr_pages(self, session: PDFDocumentSession, pages: Iterator[PageData], wanted: Callable[[], bool]) -> Iterator[PageData]:
+        # Pages keep their order. OCR runs ahead by at most one task per OCR
+        # worker, and stops once ``wanted`` reports that the text is no
+        # longer needed, so pages after the statements are not read.
+        window = deque()
+        submitted = 0
+        max_pages = PDF_PROCESSING["ocr"]["max_pages"]
+
+        for page in pages:
+            future = None
+            if submitted < max_pages and wanted() and self.ocr_engine.needs_ocr(session, page):
+                future = self.ocr_engine.submit(session, page.page_num)
+                submitted += 1
+            window.append((page, future))
+
+            while window and (window[0][1] is None or window[0][1].done() or len(window) > self.ocr_engine.max_workers):
+                yield self.finish_ocr(*window.popleft())
+
+        while window:
+            yield self.finish_ocr(*window.popleft())
+
+        if submitted:
+            logger.info(f"OCR'd {submitted} text-less pages of '{session.file_path.name}'")
+
+    def finish_ocr(self, page: PageData, future: Optional[Future]) -> PageData:
+        if future is None:
+            return page
+        page = self.ocr_engine.apply(page, future)
+        # the blocks came from the empty text layer; rebuild them from the OCR lines
+        page.structured_text = self.classify_text_blocks(ocr_blocks(page.words))
+        return page
+
+    def create_page_store(self) -> Optional[PageStore]:
+        budget_mb = PDF_PROCESSING.get("memory_budget_mb", 0)
+        if budget_mb <= 0:
+            return None
+        return PageStore(Path(PDF_PROCESSING["spill_dir"]), int(budget_mb * 1024 * 1024))
 
-                return True, "Valid"
-            
-            except Exception as e:
-                return False, f"Invalid PDF: {str(e)}"
-            
-        except Exception as e:
-            logger.error(f"Error in PDF validation: {str(e)}")
-            return False, f"Error in PDF validation: {str(e)}"
+    def validate_pdf(self, file_path: Path) -> Tuple[bool, str]:
+        with PDFDocumentSession(file_path) as session:
+            return session.is_valid, session.message
         
-    def process_single_page(self, file_path: Path, page_num: int) -> Dict[str, Any]:
-        pdf = fitz.open(file_path)
-        page = pdf[page_num] 
+    def process_single_page(self, session: PDFDocumentSession, page_num: int) -> PageData:
+        # only the PyMuPDF calls touch the shared document; building the
+        # columns and classifying blocks runs outside the lock
+        with session.lock:
+            page = session.page(page_num)
+            words, blocks = extract_page_text(page)
+            width, height = page.rect.width, page.rect.height
+
+        structured_text = self.classify_text_blocks(blocks)
+
+        return PageData(
+            page_num,
+            WordColumns.from_words(page_num, words),
+            tables=[],
+            structured_text=structured_text,
+            width=width,
+            height=height
+        )
+
+    def read_page(self, session: PDFDocumentSession, page_num: int, page_hashes: Optional[PageHashes] = None) -> PageData:
+        # hashed and looked up on the page worker, so the first page does not wait for the rest
+        if page_hashes is not None:
+            page = self.page_cache.load_page(page_hashes, page_num)
+            if page is not None:
+                return page
+        return self.process_single_page(session, page_num)
+
+    def iter_pages(self, session: PDFDocumentSession, page_hashes: Optional[PageHashes] = None) -> Iterator[PageData]:
+        if self.page_engine is not None:
+            return self.iter_pages_in_processes(session, page_hashes)
+        return self.iter_pages_in_threads(session, page_hashes)
+
+    def iter_pages_in_threads(self, session: PDFDocumentSession, page_hashes: Optional[PageHashes] = None) -> Iterator[PageData]:
+        futures = []
+
+        for page_num in range(session.page_count):
+            future = self.page_scheduler.submit(
+                session,
+                self.read_page,
+                session,
+                page_num,
+                page_hashes
+            )
+            futures.append((page_num, future))
 
         try:
-            text_instances = []
-            words = page.get_text("words")
-            
-            for word in words:
-                text_instances.append({
-                    'text': word[4],
-                    'bbox': [word[0], word[1], word[2], word[3]],
-                    'page': page_num,
-                    'confidence': 1.0
-                })
-
-            tables = []
-            if self.models_loaded and self.table_model:
-                mat = fitz.Matrix(2.0, 2.0)
-                pix = page.get_pixmap(matrix=mat)
-                img_data = pix.tobytes("png")
-                tables = self.detect_tables(img_data)
-
-            structured_text = self.extract_structured_text(page)
-
-            return {
-                'page_num': page_num,
-                'text_instances': text_instances,
-                'tables': tables,
-                'structured_text': structured_text,
-                'width': page.rect.width,
-                'height': page.rect.height
-            }
-        
+            for page_num, future in futures:
+                try:
+                    yield future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to process page {page_num}: {str(e)}")
         finally:
-            pdf.close()
+            # a consumer that stops early must not leave pages queued against a closed session
+            for _, future in futures:
+                future.cancel()
+
+    def iter_pages_in_processes(self, session: PDFDocumentSession, page_hashes: Optional[PageHashes] = None) -> Iterator[PageData]:
+        lookup = None
+        if page_hashes is not None:
+            lookup = functools.partial(self.page_cache.load_page, page_hashes)
+        packed_pages = self.page_engine.iter_pages(session.file_path, session.page_count, doc_key=session, lookup=lookup)
+
+        for packed in packed_pages:
+            if isinstance(packed, PageData):
+                yield packed
+                continue
+            page_num, width, height, words, blocks_text, blocks_bbox = packed
+            try:
+                yield PageData(
+                    page_num,
+                    words,
+                    tables=[],
+                    structured_text=self.classify_text_blocks(unpack_blocks(blocks_text, blocks_bbox)),
+                    width=width,
+                    height=height
+                )
+            except Exception as e:
+                logger.warning(f"Failed to process page {page_num}: {str(e)}")
+
+    def detect_candidate_tables(self, session: PDFDocumentSession, pages_data: List[Dict[str, Any]],
+                                page_hashes: Optional[PageHashes] = None,
+                                detected_pages: Optional[Set[int]] = None) -> Dict[str, Any]:
+        scores = score_pages(pages_data)
+
+        if PDF_PROCESSING.get("prefilter_pages", True):
+            candidates = select_candidate_pages(
+                scores,
+                max_candidates=PDF_PROCESSING["max_candidate_pages"],
+                min_score=PDF_PROCESSING["min_candidate_score"]
+            )
+        else:
+            candidates = sorted(scores)
+
+        pages_by_num = {page['page_num']: page for page in pages_data}
+        # pages a streamed section was cropped on were detected while reading
+        detected = set(detected_pages or ())
+        detected.update(self.detect_page_tables(
+            session, [pages_by_num[page_num] for page_num in candidates if page_num not in detected], page_hashes
+        ))
+
+        page_count = len(pages_data)
+        skipped = page_count - len(detected)
+        return {
+            'candidate_pages': candidates,
+            'detected_pages': sorted(detected),
+            'page_scores': {page_num: round(score, 2) for page_num, score in scores.items() if score > 0},
+            'skipped_pages': skipped,
+            'skip_rate': skipped / page_count if page_count else 0.0
+        }
+
+    def detect_page_tables(self, session: PDFDocumentSession, pages: List[PageData],
+                           page_hashes: Optional[PageHashes] = None) -> List[int]:
+        """Stores the tables of ``pages`` in ``page['tables']``, in page points,
+        and returns the page numbers that were detected."""
+        detected = []
+        pages_by_num = {page['page_num']: page for page in pages}
+        specs = {page_num: self.render_spec(page) for page_num, page in pages_by_num.items()}
+
+        if page_hashes is not None:
+            # pages seen before with the same render spec and detector skip rendering
+            for page_num in list(specs):
+                content_hash = page_hashes.get(page_num)
+                tables = self.page_cache.get_tables(content_hash, specs[page_num]) if content_hash else None
+                if tables is not None:
+                    pages_by_num[page_num]['tables'] = tables
+                    detected.append(page_num)
+                    del specs[page_num]
+
+        if specs and self.ensure_table_model():
+            table_futures = {}
+
+            if self.page_engine is not None:
+                for page_num, raster in self.page_engine.render_pages(session.file_path, specs, doc_key=session):
+                    table_futures[page_num] = self.submit_table_detection(raster_to_array(raster))
+            else:
+                # rendering counts against the shared page worker budget
+                render_futures = {
+                    self.page_scheduler.submit(session, self.render_page_image, session, page_num, spec, front=True): page_num
+                    for page_num, spec in specs.items()
+                }
+                for future in as_completed(render_futures):
+                    page_num = render_futures[future]
+                    try:
+                        table_futures[page_num] = self.submit_table_detection(future.result())
+                    except Exception as e:
+                        logger.warning(f"Error rendering page {page_num}: {str(e)}")
+
+            for page_num, future in table_futures.items():
+                try:
+                    page = pages_by_num[page_num]
+                    tables = []
+                    # detections come back in render pixels; store them in page points
+                    for table in future.result():
+                        bbox = to_page_bbox(table['bbox'], specs[page_num])
+                        tables.append({**table, 'bbox': bbox, 'word_indices': page.words_in(bbox).tolist()})
+                    page['tables'] = tables
+                    detected.append(page_num)
+                    content_hash = page_hashes.get(page_num) if page_hashes is not None else None
+                    if content_hash:
+                        self.page_cache.put_tables(content_hash, specs[page_num], tables)
+                except Exception as e:
+                    logger.warning(f"Error detecting tables on page {page_num}: {str(e)}")
+
+        return detected
+
+    def render_page_image(self, session: PDFDocumentSession, page_num: int, spec: RenderSpec) -> np.ndarray:
+        with session.lock:
+            return render_page_array(session.page(page_num), spec)
+
+    def render_spec(self, page: PageData) -> RenderSpec:
+        settings = MODELS["table_transformer"]["render"]
+        width, height = page['width'], page['height']
+
+        clip = None
+        if settings["clip_to_content"]:
+            clip = content_clip(page.words.bboxes, width, height, settings["clip_margin"])
+            if clip:
+                width, height = clip[2] - clip[0], clip[3] - clip[1]
+
+        # configured edges only, never the loaded processor's: a spec looked up in
+        # the cache before the model loads must match the one stored after it.
+        # The defaults are the Table Transformer processor's own target size.
+        scale = render_scale(width, height, settings["shortest_edge"], settings["longest_edge"], settings["max_scale"])
+        return scale, clip, settings["grayscale"]
 
     def extract_structured_text(self, page) -> Dict[str, Any]:
-        
-        blocks = page.get_text("dict")
+        return self.classify_text_blocks(extract_text_blocks(page))
+
+    def classify_text_blocks(self, blocks: List[Tuple[str, List[float]]]) -> Dict[str, Any]:
         
         headers = []
         tables = []
         paragraphs = []
         financial_data = []
+
+        buckets = {
+            block_classifier.HEADER: headers,
+            block_classifier.TABLE_ROW: tables,
+            block_classifier.FINANCIAL_DATA: financial_data,
+            block_classifier.PARAGRAPH: paragraphs
+        }
         
-        for block in blocks.get("blocks", []):
-            if "lines" in block:
-                block_text = ""
-                block_bbox = block["bbox"]
-                
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text = span["text"].strip()
-                        if text:
-                            block_text += text + " "
-                
-                block_text = block_text.strip()
-                if not block_text:
-                    continue
-                
-                if self.is_financial_header(block_text):
-                    headers.append({
-                        'text': block_text,
-                        'bbox': block_bbox,
-                        'type': 'header'
-                    })
-                elif self.is_financial_table_row(block_text):
-                    tables.append({
-                        'text': block_text,
-                        'bbox': block_bbox,
-                        'type': 'table_row'
-                    })
-                elif self.contains_financial_data(block_text):
-                    financial_data.append({
-                        'text': block_text,
-                        'bbox': block_bbox,
-                        'type': 'financial_data'
-                    })
-                else:
-                    paragraphs.append({
-                        'text': block_text,
-                        'bbox': block_bbox,
-                        'type': 'paragraph'
-                    })
+        for block_text, block_bbox in blocks:
+            block_type = block_classifier.classify_block(block_text)
+            buckets[block_type].append({
+                'text': block_text,
+                'bbox': block_bbox,
+                'type': block_type
+            })
         
         return {
             'headers': headers,
@@ -328,235 +542,82 @@ class PDFProcessor:
         }
 
     def is_financial_header(self, text: str) -> bool:
-        text_upper = text.upper()
-        header_patterns = [
-            'CONSOLIDATED STATEMENT OF COMPREHENSIVE INCOME',
-            'STATEMENT OF COMPREHENSIVE INCOME',
-            'STATEMENT OF PROFIT OR LOSS AND OTHER COMPREHENSIVE INCOME',
-            'STATEMENT OF PROFIT OR LOSS',
-            'CONSOLIDATED STATEMENT OF PROFIT OR LOSS',
-            'STATEMENT OF FINANCIAL POSITION',
-            'CONSOLIDATED STATEMENT OF FINANCIAL POSITION',
-            'STATEMENT OF CASH FLOWS',
-            'CONSOLIDATED STATEMENT OF CASH FLOWS',
-            'BALANCE SHEET',
-            'INCOME STATEMENT',
-            'NOTE', 'NOTES TO THE FINANCIAL STATEMENTS',
-            'NOTES TO THE CONSOLIDATED FINANCIAL STATEMENTS'
-        ]
-        
-        return any(pattern in text_upper for pattern in header_patterns)
+        return block_classifier.is_financial_header(text)
 
     def is_financial_table_row(self, text: str) -> bool:
-        pattern = r'^[A-Za-z\s&,().-]+\s+[\d,\(\)\-\s.]+[\d,\(\)\-\s.]*$'
-        return bool(re.match(pattern, text)) and any(char.isdigit() for char in text)
+        return block_classifier.is_financial_table_row(text)
 
     def contains_financial_data(self, text: str) -> bool:
-        financial_keywords = [
-            'revenue', 'income', 'expense', 'profit', 'loss', 'assets', 'liabilities',
-            'cash', 'dividend', 'interest', 'tax', 'total', 'net', 'gross'
-        ]
-        text_lower = text.lower()
-        has_keyword = any(keyword in text_lower for keyword in financial_keywords)
-        has_numbers = bool(re.search(r'\d+[,.]?\d*', text))
-        return has_keyword and has_numbers
-
-    def detect_tables(self, img_data: bytes) -> List[Dict[str, Any]]:
+        return block_classifier.contains_financial_data(text)
+
+    def detect_tables(self, image: np.ndarray) -> List[Dict[str, Any]]:
         try:
-            with self.model_lock:
-                if not self.models_loaded:
-                    return []
-                
-                import io
-                from PIL import Image
-                
-                img = Image.open(io.BytesIO(img_data))
+            if not self.ensure_table_model():
+                return []
 
-                inputs = self.table_processor(images=img, return_tensors="pt")
-                inputs = {k: v.to(self.device) for k, v in inputs.items()}
+            image = self.as_page_array(image)
 
-                with torch.no_grad():
-                    outputs = self.table_model(**inputs)
+            if self.table_batcher is not None:
+                return self.table_batcher.detect(image)
 
-                target_sizes = torch.tensor([img.size[::-1]])
-                results = self.table_processor.post_process_object_detection(
-                    outputs, 
-                    target_sizes=target_sizes, 
-                    threshold=0.7
-                )[0]
-                
-                tables = []
-                for score, label, box in zip(
-                    results["scores"], 
-                    results["labels"], 
-                    results["boxes"]
-                ):
-                    tables.append({
-                        "bbox": box.tolist(),
-                        "confidence": score.item(),
-                        "label": self.table_model.config.id2label[label.item()]
-                    })
-                
-                return tables
+            with self.model_lock:
+                return self.detect_tables_batch([image])[0]
             
         except Exception as e:
             logger.warning(f"Error detecting tables: {str(e)}")
             return []
 
+    def submit_table_detection(self, image: np.ndarray) -> Future:
+        if self.table_batcher is not None:
+            return self.table_batcher.submit(self.as_page_array(image))
+        # Run inline: the caller is itself a thread_pool task, and waiting on
+        # another task in the same pool deadlocks once every worker does so.
+        # Detection is serialized by model_lock either way.
+        future = Future()
+        future.set_result(self.detect_tables(image))
+        return future
+
+    def as_page_array(self, image: Any) -> np.ndarray:
+        # encoded images are still accepted, but rendered pages arrive as raw HxWx3 arrays
+        if isinstance(image, (bytes, bytearray)):
+            return np.asarray(Image.open(io.BytesIO(image)).convert("RGB"))
+        return image
+
+    def detect_tables_batch(self, images: List[np.ndarray]) -> List[List[Dict[str, Any]]]:
+        return detect_tables_with(
+            self.table_backend,
+            self.table_processor,
+            self.table_model.config.id2label,
+            images,
+            threshold=MODELS["table_transformer"].get("threshold", 0.7)
+        )
+
     def extract_financial_metadata(self, pages_data: List[Dict[str, Any]]) -> Dict[str, str]:
-        currency = "AUD"
-        rounding = "units"
-        rounding_note = None
-        
+        metadata = self.default_financial_metadata()
+        detector = MetadataDetector(metadata)
         for page in pages_data:
-            if not page:
-                continue
+            if detector.done:
+                break
+            self.update_financial_metadata(detector, page)
+        return metadata
 
-            page_text = " ".join([
-                t['text'] for t in page['text_instances']
-            ])
-            
-            detected_currency = self.detect_currency_from_page(page_text)
-            if detected_currency:
-                currency = detected_currency
-            
-            detected_rounding, note = self.detect_rounding_from_page(page_text)
-            if detected_rounding:
-                rounding = detected_rounding
-                if note:
-                    rounding_note = note
-        
+    def default_financial_metadata(self) -> Dict[str, Optional[str]]:
         return {
-            "currency": currency,
-            "rounding": rounding,
-            "rounding_note": rounding_note
+            "currency": "AUD",
+            "rounding": "units",
+            "rounding_note": None
         }
 
-    def detect_currency_from_page(self, text: str) -> Optional[str]:
-        text_upper = text.upper()
-        for currency, patterns in CURRENCY_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, text_upper):
-                    return currency
-        return None
-
-    def detect_rounding_from_page(self, text: str) -> Tuple[Optional[str], Optional[str]]:
-        text_lower = text.lower()
-        
-        for rounding_type, patterns in ROUNDING_PATTERNS.items():
-            for pattern in patterns:
-                match = re.search(pattern, text_lower)
-                if match:
-                    context_start = max(0, match.start() - 50)
-                    context_end = min(len(text_lower), match.end() + 50)
-                    context = text_lower[context_start:context_end].strip()
-                    return rounding_type, context
-        
-        rounding_statements = [
-            r'amounts.*rounded.*nearest.*hundred.*thousand.*dollars',
-            r'figures.*rounded.*nearest.*thousand.*dollars',
-            r'amounts.*expressed.*millions.*dollars',
-            r'figures.*expressed.*millions.*dollars',
-            r'amounts.*stated.*millions',
-            r'figures.*stated.*millions'
-        ]
-        
-        for pattern in rounding_statements:
-            match = re.search(pattern, text_lower)
-            if match:
-                if 'million' in match.group():
-                    return 'millions', match.group()
-                elif 'thousand' in match.group():
-                    return 'thousands', match.group()
-        
-        return None, None
+    def update_financial_metadata(self, detector: MetadataDetector, page: PageData):
+        if not page or detector.done:
+            return
+        detector.feed(page.text_upper, page.text_lower)
 
     def find_financial_sections(self, pages_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-
-        sections = {
-            'profit_loss': None,
-            'comprehensive_income': None,
-            'balance_sheet': None,
-            'cash_flow': None,
-            'notes': []
-        }
-        
-        section_patterns = {
-            'comprehensive_income': [
-                r'CONSOLIDATED\s+STATEMENT\s+OF\s+COMPREHENSIVE\s+INCOME',
-                r'STATEMENT\s+OF\s+COMPREHENSIVE\s+INCOME',
-                r'STATEMENT\s+OF\s+PROFIT\s+OR\s+LOSS\s+AND\s+OTHER\s+COMPREHENSIVE\s+INCOME'
-            ],
-            'profit_loss': [
-                r'CONSOLIDATED\s+STATEMENT\s+OF\s+PROFIT\s+(?:OR\s+LOSS|AND\s+LOSS)',
-                r'STATEMENT\s+OF\s+PROFIT\s+(?:OR\s+LOSS|AND\s+LOSS)',
-                r'INCOME\s+STATEMENT',
-                r'PROFIT\s+(?:OR\s+LOSS|AND\s+LOSS)\s+STATEMENT'
-            ],
-            'balance_sheet': [
-                r'CONSOLIDATED\s+STATEMENT\s+OF\s+FINANCIAL\s+POSITION',
-                r'STATEMENT\s+OF\s+FINANCIAL\s+POSITION',
-                r'BALANCE\s+SHEET',
-                r'STATEMENT\s+OF\s+ASSETS?\s+AND\s+LIABILITIES'
-            ],
-            'cash_flow': [
-                r'CONSOLIDATED\s+STATEMENT\s+OF\s+CASH\s+FLOWS?',
-                r'STATEMENT\s+OF\s+CASH\s+FLOWS?',
-                r'CASH\s+FLOWS?\s+STATEMENT'
-            ]
-        }
-
+        section_finder = SectionFinder()
         for page in pages_data:
-            if not page:
-                continue
-
-            page_text = " ".join([
-                t['text'] for t in page['text_instances']
-            ])
-            page_text_upper = page_text.upper()
-
-            for section_type, patterns in section_patterns.items():
-                if sections[section_type] is None:
-                    for pattern in patterns:
-                        if re.search(pattern, page_text_upper):
-                            section_text_instances = []
-                            
-                            section_text_instances.extend(page['text_instances'])
-                            
-                            structured_data = page.get('structured_text', {})
-                            
-                            sections[section_type] = {
-                                'page': page['page_num'],
-                                'text_instances': section_text_instances,
-                                'structured_data': structured_data,
-                                'pattern_matched': pattern
-                            }
-                            
-                            logger.info(f"Found {section_type} on page {page['page_num']} using pattern: {pattern}")
-                            break
-
-            for text_inst in page['text_instances']:
-                text = text_inst['text']
-                note_patterns = [
-                    r'^NOTE\s+(\d+)(?:\s|$)',
-                    r'^(\d+)\.\s+[A-Z]',
-                    r'\bNOTE\s+(\d+(?:,\s*\d+)*)\b'
-                ]
-                
-                for pattern in note_patterns:
-                    match = re.search(pattern, text.upper())
-                    if match:
-                        sections['notes'].append({
-                            'text': text,
-                            'page': page['page_num'],
-                            'bbox': text_inst['bbox'],
-                            'note_numbers': match.group(1) if match.group(1) else text
-                        })
-                        break
-        
-        if sections['comprehensive_income'] and not sections['profit_loss']:
-            sections['profit_loss'] = sections['comprehensive_income']
-        
+            section_finder.feed(page)
+        sections, _ = section_finder.finish(pages_data)
         return sections
 
     def combine_text(self, pages_data: List[Dict[str, Any]]) -> str:
@@ -579,8 +640,7 @@ class PDFProcessor:
                     for paragraph in structured['paragraphs']:
                         full_text_parts.append(paragraph['text'])
                 else:
-                    page_text = " ".join([t['text'] for t in page['text_instances']])
-                    full_text_parts.append(page_text)
+                    full_text_parts.append(page.text)
                 
                 full_text_parts.append("\n--- PAGE BREAK ---\n")
         
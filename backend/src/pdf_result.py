@@ -0,0 +1,64 @@
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator
+
+
+class PDFResult(Mapping):
+    """Processing result that reads like the original result dict.
+
+    Fields that are costly to derive (full text, sections) are given as
+    loaders and computed on first access. Each is built at most once. A
+    document whose statements were all found never reads ``full_text``
+    and so never builds it.
+
+    Pickling materializes every field.
+    """
+
+    def __init__(self, values: Dict[str, Any], loaders: Dict[str, Callable[[], Any]]):
+        self._values = dict(values)
+        self._loaders = dict(loaders)
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        if key not in self._loaders:
+            raise KeyError(key)
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = self._loaders.pop(key)()
+            return self._values[key]
+
+    def __setitem__(self, key: str, value: Any):
+        with self._lock:
+            self._loaders.pop(key, None)
+            self._values[key] = value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._values) + [key for key in self._loaders if key not in self._values])
+
+    def __len__(self) -> int:
+        return len(set(self._values) | set(self._loaders))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or key in self._loaders
+
+    def __repr__(self) -> str:
+        pending = ", ".join(sorted(self._loaders)) or "none"
+        return f"PDFResult(filename={self._values.get('filename')!r}, pending={pending})"
+
+    def is_computed(self, key: str) -> bool:
+        return key in self._values
+
+    def materialize(self, *keys: str):
+        """Builds the given fields now, e.g. on a worker thread before async code reads them."""
+        for key in keys:
+            self[key]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self._values = state
+        self._loaders = {}
+        self._lock = threading.RLock()
@@ -0,0 +1,78 @@
+import threading
+from pathlib import Path
+from typing import Tuple
+
+import fitz
+
+from .config import MAX_FILE_SIZE_MB
+from utils.logger import get_logger
+
+logger = get_logger("pdf_session")
+
+
+class PDFDocumentSession:
+    """Parses a PDF once and shares the parsed document with page workers.
+
+    PyMuPDF documents are not thread-safe, so page access goes through
+    ``lock``. Workers in other processes open their own copy from
+    ``file_path``.
+    """
+
+    def __init__(self, file_path: Path):
+        self.file_path = Path(file_path)
+        self.doc = None
+        self.page_count = 0
+        self.is_valid = False
+        self.message = "Not opened"
+        self.lock = threading.RLock()
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exec_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self) -> Tuple[bool, str]:
+        if self.doc is not None:
+            return self.is_valid, self.message
+
+        self.is_valid, self.message = self._open()
+        if not self.is_valid:
+            self.close()
+        return self.is_valid, self.message
+
+    def _open(self) -> Tuple[bool, str]:
+        try:
+            if not self.file_path.exists():
+                return False, "File not found"
+
+            file_size_mb = self.file_path.stat().st_size / (1024 * 1024)
+            if file_size_mb > MAX_FILE_SIZE_MB:
+                return False, f"File too large: {file_size_mb:.1f}MB > {MAX_FILE_SIZE_MB}MB"
+
+            try:
+                self.doc = fitz.open(str(self.file_path), filetype="pdf")
+                self.page_count = len(self.doc)
+            except Exception as e:
+                return False, f"Invalid PDF: {str(e)}"
+
+            if self.page_count == 0:
+                return False, "PDF has no pages"
+
+            return True, "Valid"
+
+        except Exception as e:
+            logger.error(f"Error in PDF validation: {str(e)}")
+            return False, f"Error in PDF validation: {str(e)}"
+
+    def page(self, page_num: int):
+        if self.doc is None:
+            raise RuntimeError(f"PDF session for '{self.file_path.name}' is not open")
+        return self.doc[page_num]
+
+    def close(self):
+        with self.lock:
+            if self.doc is not None:
+                self.doc.close()
+                self.doc = None
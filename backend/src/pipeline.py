@@ -10,12 +10,18 @@ import traceback
 from .pdf_processor import get_pdf_processor, PDFProcessor 
 from .llm_extractor import get_llm_extractor, LLMExtractor 
 from .database import db 
+from .cache import get_result_cache, file_sha256
+from .page_cache import get_page_cache
+from .model_registry import get_model_registry
+from .table_backends import configure_torch_threads
 from .models import ExtractionResult, ProcessingStatus, DocumentMetadata, FinancialStatement
 from utils.logger import get_logger 
-from .config import UPLOAD_DIR, OUTPUT_DIR, FINANCIAL_CONFIG, EXTRACTION_SETTINGS
+from .config import UPLOAD_DIR, OUTPUT_DIR, FINANCIAL_CONFIG, EXTRACTION_SETTINGS, MODEL_LOADING, MODELS
 
 logger = get_logger("extraction_pipeline")
 
+STATEMENT_SECTIONS = ('profit_loss', 'balance_sheet', 'cash_flow')
+
 class ExtractionPipeline:
 
     _instance = None 
@@ -36,6 +42,7 @@ class ExtractionPipeline:
 
             self.pdf_processor = None 
             self.llm_extractor = None 
+            self.result_cache = get_result_cache()
             self.processing_queue = asyncio.Queue()
             self.status_cache = {}
             self.lock = threading.Lock()
@@ -46,20 +53,17 @@ class ExtractionPipeline:
 
     async def initialize(self):
         try:
+            configure_torch_threads(MODELS["table_transformer"]["cpu_threads"])
             self.pdf_processor = get_pdf_processor()
             self.llm_extractor = get_llm_extractor()
 
-            tasks = [
-                asyncio.create_task(self.load_pdf_models()),
-                asyncio.create_task(self.load_llm_model())
-            ]
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for idx, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Error in component initialization {idx}: {str(result)}")
-                    return False 
+            # components register their models, which then load on first use;
+            # only the configured preloads are loaded here
+            preload = MODEL_LOADING["preload"]
+            if preload:
+                loop = asyncio.get_event_loop()
+                if not await loop.run_in_executor(None, get_model_registry().preload, preload):
+                    logger.error(f"Failed to preload models: {get_model_registry().failed()}")
             
             logger.info("Pipeline components initialized successfully.")
             return True 
@@ -67,13 +71,6 @@ class ExtractionPipeline:
             logger.error(f"Error in initializing pipeline components: {str(e)}")
             return False
 
-    async def load_pdf_models(self):
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.pdf_processor.load_models)
-        
-    async def load_llm_model(self):
-        return await self.llm_extractor.load_model_async()
-    
     async def process_doc(self, file_path: Path, doc_id: Optional[str] = None) -> Tuple[bool, ExtractionResult]:
         st = time.time()
 
@@ -83,30 +80,34 @@ class ExtractionPipeline:
         self.update_status(doc_id, "processing", 0, "Starting PDF processing") 
 
         try:
-            logger.info(f"Processing PDF: {file_path.name}")
-            pdf_data = await self.pdf_processor.process_pdf_async(file_path) 
-            
-            if FINANCIAL_CONFIG.get("debug_extraction", False):
-                logger.info(f"PDF metadata detected: {pdf_data.get('document_metadata', {})}")
-                logger.info(f"Sections found: {list(pdf_data.get('sections', {}).keys())}")
-            
-            self.update_status(doc_id, "processing", 30, "PDF processed, starting extraction")
+            file_hash = None
+            cached = None
+            if self.result_cache is not None:
+                loop = asyncio.get_event_loop()
+                file_hash = await loop.run_in_executor(None, file_sha256, file_path)
+                cached = await loop.run_in_executor(None, self.result_cache.get, file_hash)
+
+            if cached:
+                result = cached
+                logger.info(f"Using cached extraction for {file_path.name} (sha256 {file_hash[:12]})")
+                result = result.model_copy(update={
+                    'filename': file_path.name,
+                    'document_id': None,
+                    'upload_timestamp': datetime.utcnow(),
+                    'processing_time': time.time() - st
+                })
+            else:
+                pdf_data, result = await self.extract_doc(file_path, doc_id)
+
+                sections = pdf_data.get('sections', {})
+                sections_found = sum(1 for section_type in STATEMENT_SECTIONS if sections.get(section_type))
+                if self.result_cache is not None:
+                    if self.result_cache.cacheable(result, sections_found):
+                        loop = asyncio.get_event_loop()
+                        await loop.run_in_executor(None, self.result_cache.put, file_hash, result)
+                    else:
+                        logger.info(f"Not caching the extraction for {file_path.name}: incomplete or with errors")
 
-            logger.info(f"Extracting financial data from {file_path.name}")
-            result = await self.llm_extractor.extract_from_doc_async(pdf_data)
-            
-            if FINANCIAL_CONFIG.get("debug_extraction", False):
-                logger.info(f"Extracted {len(result.statements)} statements")
-                for stmt in result.statements:
-                    logger.info(f"Statement: {stmt.statement_type}, Currency: {stmt.currency}, Rounding: {stmt.rounding}, Items: {len(stmt.line_items)}")
-            
-            self.update_status(doc_id, "processing", 70, "Extraction completed, validating results")
-
-            validation_errors = self.validate_extraction_results(result, pdf_data.get('document_metadata', {}))
-            if validation_errors:
-                logger.warning(f"Validation warnings for {file_path.name}: {validation_errors}")
-                result.errors.extend(validation_errors)
-            
             self.update_status(doc_id, "processing", 80, "Validation completed, saving to database")
 
             logger.info(f"Saving extracted data to database")
@@ -140,6 +141,70 @@ class ExtractionPipeline:
 
             return False, error_result
 
+    async def extract_doc(self, file_path: Path, doc_id: str) -> Tuple[Dict[str, Any], ExtractionResult]:
+        logger.info(f"Processing PDF: {file_path.name}")
+        section_tasks = {}
+        on_section = None
+
+        if EXTRACTION_SETTINGS.get("stream_sections", False):
+            loop = asyncio.get_event_loop()
+
+            def start_section(section_type: str, section: Dict[str, Any]):
+                if section_type in STATEMENT_SECTIONS and section_type not in section_tasks:
+                    logger.info(f"Dispatching {section_type} extraction while PDF processing continues")
+                    # the rounding statement usually sits in the notes, after the
+                    # statements, so the section's own text decides for now and
+                    # the final document metadata is applied once the PDF is read
+                    section_tasks[section_type] = asyncio.ensure_future(
+                        self.llm_extractor.extract_section_async(section_type, section, None)
+                    )
+
+            def on_section(section_type: str, section: Dict[str, Any]):
+                loop.call_soon_threadsafe(start_section, section_type, section)
+
+        try:
+            pdf_data = await self.pdf_processor.process_pdf_async(file_path, on_section) 
+        except Exception:
+            for task in section_tasks.values():
+                task.cancel()
+            raise
+        
+        if FINANCIAL_CONFIG.get("debug_extraction", False):
+            logger.info(f"PDF metadata detected: {pdf_data.get('document_metadata', {})}")
+            logger.info(f"Sections found: {list(pdf_data.get('sections', {}).keys())}")
+        
+        self.update_status(doc_id, "processing", 30, "PDF processed, starting extraction")
+
+        logger.info(f"Extracting financial data from {file_path.name}")
+        result = await self.llm_extractor.extract_from_doc_async(pdf_data, section_tasks)
+        
+        if FINANCIAL_CONFIG.get("debug_extraction", False):
+            logger.info(f"Extracted {len(result.statements)} statements")
+            for stmt in result.statements:
+                logger.info(f"Statement: {stmt.statement_type}, Currency: {stmt.currency}, Rounding: {stmt.rounding}, Items: {len(stmt.line_items)}")
+        
+        self.update_status(doc_id, "processing", 70, "Extraction completed, validating results")
+
+        validation_errors = self.validate_extraction_results(result, pdf_data.get('document_metadata', {}))
+        if validation_errors:
+            logger.warning(f"Validation warnings for {file_path.name}: {validation_errors}")
+            result.errors.extend(validation_errors)
+
+        return pdf_data, result
+
+    def invalidate_cache(self, file_hash: Optional[str] = None) -> int:
+        count = 0
+        if self.result_cache is not None:
+            count = self.result_cache.invalidate(file_hash)
+            logger.info(f"Invalidated {count} cached extraction results")
+
+        # page entries are keyed by page content, so only a full clear reaches them
+        page_cache = get_page_cache()
+        if file_hash is None and page_cache is not None:
+            pages = page_cache.store.invalidate()
+            logger.info(f"Invalidated {pages} cached pages")
+        return count
+
     def validate_extraction_results(self, result: ExtractionResult, pdf_metadata: Dict[str, Any]) -> List[str]:
         errors = []
         
@@ -0,0 +1,105 @@
+import hashlib
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .cache import DiskLRUCache
+from utils.logger import get_logger
+
+logger = get_logger("prompt_cache")
+
+
+class PrefixStateCache:
+    """llama.cpp states saved right after a prompt prefix was evaluated.
+
+    ``restore`` loads the state for a prefix, evaluating and saving it the
+    first time. The next completion whose prompt starts with that prefix
+    then evaluates only the remaining tokens, because llama-cpp-python
+    reuses the longest common token prefix with the loaded state. States
+    are kept in memory and, when ``persist_dir`` is set, in a size-bounded
+    disk cache, so a restart does not pay for the prefixes again.
+
+    Callers must hold the lock that serializes use of ``llm``.
+    """
+
+    def __init__(self, llm, model_id: str, persist_dir: Optional[Path] = None, max_bytes: int = 0):
+        self.llm = llm
+        self.model_id = model_id
+        self.states: Dict[str, Any] = {}
+        self.store = DiskLRUCache(persist_dir, max_bytes, suffix=".state") if persist_dir else None
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.prefix_eval_ms = 0.0
+
+    def key_for(self, prefix: str) -> str:
+        return hashlib.sha256(f"{self.model_id}|{prefix}".encode("utf-8")).hexdigest()[:32]
+
+    def restore(self, prefix: str) -> bool:
+        key = self.key_for(prefix)
+        state = self.states.get(key)
+        if state is None:
+            state = self.load(key)
+        if state is None:
+            state = self.evaluate(key, prefix)
+        else:
+            with self.lock:
+                self.hits += 1
+
+        try:
+            self.llm.load_state(state)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not restore prompt prefix state {key}: {str(e)}")
+            self.states.pop(key, None)
+            return False
+
+    def load(self, key: str) -> Optional[Any]:
+        if self.store is None:
+            return None
+        data = self.store.get(key)
+        if data is None:
+            return None
+        try:
+            state = pickle.loads(data)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable prompt prefix state {key}: {str(e)}")
+            self.store.invalidate(key)
+            return None
+        self.states[key] = state
+        with self.lock:
+            self.disk_hits += 1
+        return state
+
+    def evaluate(self, key: str, prefix: str) -> Any:
+        st = time.time()
+        tokens = self.llm.tokenize(prefix.encode("utf-8"), add_bos=True)
+        self.llm.reset()
+        self.llm.eval(tokens)
+        state = self.llm.save_state()
+        elapsed_ms = (time.time() - st) * 1000
+
+        self.states[key] = state
+        if self.store is not None:
+            self.store.put(key, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        with self.lock:
+            self.misses += 1
+            self.prefix_eval_ms += elapsed_ms
+        logger.info(f"Saved prompt prefix state {key} ({len(tokens)} tokens, {elapsed_ms:.0f} ms)")
+        return state
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            stats = {
+                "prefixes": len(self.states),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "prefix_eval_ms": round(self.prefix_eval_ms, 2)
+            }
+        if self.store is not None:
+            stats["disk"] = self.store.stats()
+        return stats
@@ -0,0 +1,117 @@
+import re
+from typing import List, Optional, Tuple
+
+from .layout_engine import is_value_cell, layout_rows
+from .page_model import PageData, WordColumns
+from .page_prefilter import STATEMENT_HEADING_RE
+
+# lines that close a statement table: footers, auditor text, sign-off
+STOP_CUE_RE = re.compile(
+    r'ACCOMPANYING NOTES|NOTES ON PAGES|INTEGRAL PART OF THESE|INDEPENDENT AUDITOR|'
+    r'APPROVED BY THE BOARD|SIGNED ON BEHALF|ON BEHALF OF THE BOARD'
+)
+CONTINUED_RE = re.compile(r'\bCONTINUED\b')
+
+# this many lines without figures after the table has started ends it
+MAX_TEXT_LINES = 4
+# lines at the top of the next page inspected for a continuation
+CONTINUATION_LINES = 8
+HEADING_MARGIN = 2.0
+# statement rows carry a figure per year; a lone number is a page number or a note
+MIN_VALUE_CELLS = 2
+# share of the page height at the top and bottom where page numbers sit
+PAGE_MARGIN = 0.08
+# a table only runs onto the next page if its last figures reach this low
+OPEN_END_ZONE = 0.2
+
+# (page, y0, y1) of one cropped part of a section, in page points
+Region = Tuple[PageData, float, float]
+
+
+def heading_top(page: PageData, pattern: str) -> float:
+    # patterns are written for upper-cased text; match the original text so
+    # offsets line up with word offsets
+    match = re.search(pattern, page.text, re.IGNORECASE)
+    if not match:
+        return 0.0
+    span = page.words_at([match.start()], [match.end()])[0]
+    if not len(span):
+        return 0.0
+    return max(0.0, float(page.words.bboxes[span.start:span.stop, 1].min()) - HEADING_MARGIN)
+
+
+def words_below(page: PageData, top: float) -> WordColumns:
+    return page.words.subset(page.words_in((0.0, top, page['width'], page['height'])))
+
+
+def has_values(cells) -> bool:
+    return sum(1 for text, _, _ in cells if is_value_cell(text)) >= MIN_VALUE_CELLS
+
+
+def is_margin_line(page: PageData, y0: float, y1: float, cells) -> bool:
+    # single-cell lines in the top or bottom margin: page numbers, running footers
+    margin = page['height'] * PAGE_MARGIN
+    return len(cells) == 1 and (y1 <= margin or y0 >= page['height'] - margin)
+
+
+def table_bottom(page: PageData, top: float) -> Optional[float]:
+    bottoms = [table['bbox'][3] for table in page['tables'] if table['bbox'][3] > top]
+    return max(bottoms) if bottoms else None
+
+
+def layout_bottom(page: PageData, top: float) -> Tuple[float, bool]:
+    """Bottom of the statement table below ``top`` and whether it ran off the page."""
+    last_value_bottom = None
+    text_lines = 0
+
+    for y0, y1, cells in layout_rows(words_below(page, top)):
+        if is_margin_line(page, y0, y1, cells):
+            continue
+        if has_values(cells):
+            last_value_bottom = y1
+            text_lines = 0
+            continue
+        if last_value_bottom is None:
+            continue
+
+        line = " ".join(text for text, _, _ in cells).upper()
+        if STOP_CUE_RE.search(line) or STATEMENT_HEADING_RE.search(line):
+            return last_value_bottom, False
+        text_lines += 1
+        if text_lines >= MAX_TEXT_LINES:
+            return last_value_bottom, False
+
+    if last_value_bottom is None:
+        return page['height'], False
+    return last_value_bottom, last_value_bottom >= page['height'] * (1 - OPEN_END_ZONE)
+
+
+def crop_region(page: PageData, top: float) -> Tuple[Region, bool]:
+    bottom, open_end = layout_bottom(page, top)
+    detected = table_bottom(page, top)
+    if detected is not None:
+        bottom = max(bottom, detected)
+    return (page, top, bottom), open_end
+
+
+def is_continuation(page: PageData) -> bool:
+    rows = [row for row in layout_rows(page.words) if not is_margin_line(page, *row)][:CONTINUATION_LINES]
+    top_text = " ".join(text for _, _, cells in rows for text, _, _ in cells).upper()
+    if CONTINUED_RE.search(top_text):
+        return True
+    if STATEMENT_HEADING_RE.search(top_text):
+        return False
+    return sum(1 for _, _, cells in rows if has_values(cells)) >= 2
+
+
+def refine_region(region: Region) -> Region:
+    # tables are detected after the pages stream past; extend to their bottom
+    page, top, bottom = region
+    detected = table_bottom(page, top)
+    if detected is not None and detected > bottom:
+        bottom = detected
+    return page, top, bottom
+
+
+def crop_words(regions: List[Region]) -> List[WordColumns]:
+    return [page.words.subset(page.words_in((0.0, top, page['width'], bottom))) for page, top, bottom in regions]
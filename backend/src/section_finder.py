@@ -0,0 +1,149 @@
+import re
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+from .config import SECTION_PATTERNS, EXTRACTION_SETTINGS
+from .note_index import build_note_index
+from .page_model import PageData, TextInstances
+from .section_boundaries import Region, crop_region, crop_words, heading_top, is_continuation, refine_region
+from utils.logger import get_logger
+
+logger = get_logger("section_finder")
+
+COMPILED_SECTION_PATTERNS = {
+    section_type: [(pattern, re.compile(pattern)) for pattern in patterns]
+    for section_type, patterns in SECTION_PATTERNS.items()
+}
+
+
+class SectionFinder:
+    """Locates statement sections page by page, in page order.
+
+    ``feed`` reports each section once its extent is known: right away when
+    the table ends on the heading page, or one page later when it runs off
+    the bottom and may continue. ``flush`` reports sections still waiting
+    at the end of the document, and ``finish`` re-crops against detected
+    tables, adds the note index and the comprehensive-income fallback.
+
+    ``detect_tables`` fills ``page['tables']`` for a page a section is about
+    to be cropped on, so sections reported while streaming are already
+    cropped to the detected table.
+    """
+
+    def __init__(self, crop: Optional[bool] = None, detect_tables: Optional[Callable[[PageData], None]] = None):
+        self.crop = EXTRACTION_SETTINGS.get("crop_sections", True) if crop is None else crop
+        self.detect_tables = detect_tables
+        self.sections: Dict[str, Any] = {
+            'profit_loss': None,
+            'comprehensive_income': None,
+            'balance_sheet': None,
+            'cash_flow': None,
+            'notes': {}
+        }
+        self.regions: Dict[str, Tuple[List[Region], str]] = {}
+        self.pending: Dict[str, Tuple[List[Region], str]] = {}
+
+    def feed(self, page: PageData) -> List[Tuple[str, Dict[str, Any]]]:
+        found = []
+        if not page:
+            return found
+
+        for section_type, (regions, pattern) in self.pending.items():
+            if regions[-1][0]['page_num'] + 1 == page['page_num'] and is_continuation(page):
+                self.prepare(page)
+                region, _ = crop_region(page, 0.0)
+                regions.append(region)
+                logger.info(f"{section_type} continues on page {page['page_num']}")
+            found.append(self.emit(section_type, regions, pattern))
+        self.pending = {}
+
+        page_text_upper = page.text_upper
+
+        for section_type, patterns in COMPILED_SECTION_PATTERNS.items():
+            if self.sections[section_type] is not None:
+                continue
+            for pattern, compiled in patterns:
+                if compiled.search(page_text_upper):
+                    logger.info(f"Found {section_type} on page {page['page_num']} using pattern: {pattern}")
+                    regions, open_end = self.locate(page, pattern)
+                    if open_end:
+                        self.pending[section_type] = (regions, pattern)
+                    else:
+                        found.append(self.emit(section_type, regions, pattern))
+                    break
+
+        return found
+
+    def locate(self, page: PageData, pattern: str) -> Tuple[List[Region], bool]:
+        if not self.crop:
+            return [(page, 0.0, page['height'])], False
+        self.prepare(page)
+        region, open_end = crop_region(page, heading_top(page, pattern))
+        return [region], open_end
+
+    def prepare(self, page: PageData):
+        if self.detect_tables is None:
+            return
+        try:
+            self.detect_tables(page)
+        except Exception as e:
+            # the layout bottom still crops the section, and finish() re-crops
+            logger.warning(f"Table detection for page {page['page_num']} failed: {str(e)}")
+
+    def emit(self, section_type: str, regions: List[Region], pattern: str) -> Tuple[str, Dict[str, Any]]:
+        section = self.build_section(regions, pattern)
+        self.sections[section_type] = section
+        self.regions[section_type] = (regions, pattern)
+        return section_type, section
+
+    def flush(self) -> List[Tuple[str, Dict[str, Any]]]:
+        found = [self.emit(section_type, regions, pattern) for section_type, (regions, pattern) in self.pending.items()]
+        self.pending = {}
+        return found
+
+    def build_section(self, regions: List[Region], pattern: str) -> Dict[str, Any]:
+        # sections hold the cropped words of their pages rather than the
+        # whole page; 'text_instances' is a view over those word columns
+        first_page = regions[0][0]
+        words = crop_words(regions) if self.crop else [page.words for page, _, _ in regions]
+        return {
+            'page': first_page['page_num'],
+            'page_range': (first_page['page_num'], regions[-1][0]['page_num'] + 1),
+            'region': [(page['page_num'], top, bottom) for page, top, bottom in regions],
+            'text': "\n".join(part.text for part in words),
+            'text_instances': TextInstances(*words),
+            'words': words,
+            'structured_data': first_page.get('structured_text', {}),
+            'pattern_matched': pattern
+        }
+
+    def finish(self, pages_data: List[PageData]) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        self.flush()
+
+        if self.crop:
+            # new section objects, so sections already handed out stay unchanged
+            for section_type, (regions, pattern) in list(self.regions.items()):
+                refined = [refine_region(region) for region in regions]
+                if any(new[2] != old[2] for new, old in zip(refined, regions)):
+                    self.emit(section_type, refined, pattern)
+
+        self.sections['notes'] = build_note_index(pages_data)
+
+        fallback = self.fallback()
+        if fallback:
+            self.sections['profit_loss'] = fallback
+
+        return self.sections, fallback
+
+    def fallback(self) -> Optional[Dict[str, Any]]:
+        # comprehensive income stands in for a missing profit and loss
+        if self.sections['comprehensive_income'] and not self.sections['profit_loss']:
+            return self.sections['comprehensive_income']
+        return None
+
+    def complete(self) -> bool:
+        # every statement is located and none is waiting for its next page
+        income = self.sections['profit_loss'] or self.sections['comprehensive_income']
+        return bool(income and self.sections['balance_sheet'] and self.sections['cash_flow'] and not self.pending)
+
+    def found(self) -> List[str]:
+        return [section_type for section_type, section in self.sections.items() if section and section_type != 'notes']
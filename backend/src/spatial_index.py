@@ -0,0 +1,109 @@
+from typing import Sequence
+
+import numpy as np
+
+# (x0, y0, x1, y1) in page points
+BBox = Sequence[float]
+
+
+class SpatialIndex:
+    """Uniform grid over word bboxes for region and nearest-word queries.
+
+    Each word is bucketed by its centre, and buckets are stored row-major in
+    one CSR layout, so the buckets of one grid row form a single slice. A
+    query only widens its search box by the largest half word size, which
+    still finds every word that overlaps the box.
+    """
+
+    __slots__ = ('bboxes', 'origin', 'cell_size', 'cols', 'rows', 'cell_starts', 'cell_words', 'half_extent')
+
+    def __init__(self, bboxes: np.ndarray, words_per_cell: int = 4):
+        self.bboxes = bboxes
+        count = len(bboxes)
+        if count == 0:
+            self.origin = np.zeros(2, dtype=np.float32)
+            self.cell_size = 1.0
+            self.cols = self.rows = 1
+            self.cell_starts = np.zeros(2, dtype=np.int64)
+            self.cell_words = np.zeros(0, dtype=np.int64)
+            self.half_extent = (0.0, 0.0)
+            return
+
+        centres = np.column_stack(((bboxes[:, 0] + bboxes[:, 2]) / 2, (bboxes[:, 1] + bboxes[:, 3]) / 2))
+        self.origin = centres.min(axis=0)
+        span = np.maximum(centres.max(axis=0) - self.origin, 1.0)
+
+        cells = max(1, count // words_per_cell)
+        self.cell_size = float(max(np.sqrt(span[0] * span[1] / cells), 1.0))
+        self.cols = int(span[0] // self.cell_size) + 1
+        self.rows = int(span[1] // self.cell_size) + 1
+
+        cell_xy = ((centres - self.origin) // self.cell_size).astype(np.int64)
+        cell_ids = cell_xy[:, 1] * self.cols + cell_xy[:, 0]
+        self.cell_words = np.argsort(cell_ids, kind='stable')
+        self.cell_starts = np.zeros(self.cols * self.rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cell_ids, minlength=self.cols * self.rows), out=self.cell_starts[1:])
+
+        self.half_extent = (
+            float((bboxes[:, 2] - bboxes[:, 0]).max()) / 2,
+            float((bboxes[:, 3] - bboxes[:, 1]).max()) / 2
+        )
+
+    def candidates(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """Words whose centre falls in a grid cell touched by the box."""
+        ox, oy = self.origin
+        c0 = max(0, int((x0 - ox) // self.cell_size))
+        c1 = min(self.cols - 1, int((x1 - ox) // self.cell_size))
+        r0 = max(0, int((y0 - oy) // self.cell_size))
+        r1 = min(self.rows - 1, int((y1 - oy) // self.cell_size))
+        if c0 > c1 or r0 > r1:
+            return self.cell_words[:0]
+
+        starts = self.cell_starts
+        slices = [
+            self.cell_words[starts[row * self.cols + c0]:starts[row * self.cols + c1 + 1]]
+            for row in range(r0, r1 + 1)
+        ]
+        return np.concatenate(slices)
+
+    def words_in(self, bbox: BBox, min_overlap: float = 0.5) -> np.ndarray:
+        """Indices of words with at least ``min_overlap`` of their area inside ``bbox``."""
+        hx, hy = self.half_extent
+        found = self.candidates(bbox[0] - hx, bbox[1] - hy, bbox[2] + hx, bbox[3] + hy)
+        if not len(found):
+            return found
+
+        boxes = self.bboxes[found]
+        ix = np.clip(np.minimum(boxes[:, 2], bbox[2]) - np.maximum(boxes[:, 0], bbox[0]), 0, None)
+        iy = np.clip(np.minimum(boxes[:, 3], bbox[3]) - np.maximum(boxes[:, 1], bbox[1]), 0, None)
+        areas = np.maximum((boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1]), 1e-6)
+        inside = (ix * iy) / areas
+        keep = inside >= min_overlap if min_overlap > 0 else (ix > 0) & (iy > 0)
+        return np.sort(found[keep])
+
+    def distances(self, bbox: BBox, words: np.ndarray) -> np.ndarray:
+        boxes = self.bboxes[words]
+        dx = np.maximum(0, np.maximum(bbox[0] - boxes[:, 2], boxes[:, 0] - bbox[2]))
+        dy = np.maximum(0, np.maximum(bbox[1] - boxes[:, 3], boxes[:, 1] - bbox[3]))
+        return np.hypot(dx, dy)
+
+    def nearest(self, bbox: BBox, k: int = 1) -> np.ndarray:
+        """Indices of the ``k`` words closest to ``bbox`` (edge distance), nearest first."""
+        total = len(self.bboxes)
+        k = min(k, total)
+        if k == 0:
+            return self.cell_words[:0]
+
+        hx, hy = self.half_extent
+        radius = self.cell_size
+        while True:
+            found = self.candidates(bbox[0] - radius - hx, bbox[1] - radius - hy,
+                                    bbox[2] + radius + hx, bbox[3] + radius + hy)
+            if len(found) >= k or len(found) == total:
+                distances = self.distances(bbox, found)
+                order = np.argsort(distances, kind='stable')[:k]
+                # a word outside the searched box is at least ``radius`` away
+                if len(found) == total or distances[order[-1]] <= radius:
+                    return found[order]
+            radius *= 2
+
@@ -0,0 +1,222 @@
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List, Any, Optional
+
+import torch
+
+from utils.logger import get_logger
+
+logger = get_logger("table_backends")
+
+BACKENDS = ("torch", "int8", "onnx")
+
+
+class TorchTableBackend:
+    """fp32 eager PyTorch inference; the reference path for the other backends."""
+
+    name = "torch"
+
+    def __init__(self, model, device: str = "cpu"):
+        self.model = model
+        self.device = device
+
+    def __call__(self, inputs: Dict[str, torch.Tensor]):
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        with torch.no_grad():
+            return self.model(**inputs)
+
+
+class QuantizedTableBackend(TorchTableBackend):
+    """Dynamic int8 quantization of the model's Linear layers.
+
+    Weights are quantized once at load time and activations per call, which
+    covers the transformer encoder/decoder and the prediction heads. The
+    convolutional backbone stays fp32. The model is quantized in place so
+    only one copy of the weights is kept.
+    """
+
+    name = "int8"
+
+    def __init__(self, model):
+        quantized = torch.ao.quantization.quantize_dynamic(
+            model.to("cpu"), {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+        super().__init__(quantized, "cpu")
+
+
+def configure_torch_threads(num_threads: Optional[int]):
+    # process-wide for every torch user, so set once at startup rather than
+    # by whichever backend happens to be built
+    if num_threads:
+        torch.set_num_threads(num_threads)
+        logger.info(f"Torch intra-op threads set to {num_threads}.")
+
+
+class _DetectionOutputs(torch.nn.Module):
+    # torch.onnx.export needs plain tensor outputs rather than a ModelOutput
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def forward(self, pixel_values, pixel_mask):
+        outputs = self.model(pixel_values=pixel_values, pixel_mask=pixel_mask)
+        return outputs.logits, outputs.pred_boxes
+
+
+def export_onnx(model, onnx_path: Path, image_size: tuple = (800, 800), opset: int = 17) -> Path:
+    onnx_path = Path(onnx_path)
+    onnx_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = onnx_path.with_suffix(onnx_path.suffix + ".tmp")
+
+    pixel_values = torch.randn(1, 3, *image_size)
+    pixel_mask = torch.ones(1, *image_size, dtype=torch.long)
+
+    logger.info(f"Exporting Table Transformer to ONNX at {onnx_path}...")
+    with torch.no_grad():
+        torch.onnx.export(
+            _DetectionOutputs(model.to("cpu").eval()),
+            (pixel_values, pixel_mask),
+            str(tmp_path),
+            input_names=["pixel_values", "pixel_mask"],
+            output_names=["logits", "pred_boxes"],
+            dynamic_axes={
+                "pixel_values": {0: "batch", 2: "height", 3: "width"},
+                "pixel_mask": {0: "batch", 1: "height", 2: "width"},
+                "logits": {0: "batch"},
+                "pred_boxes": {0: "batch"}
+            },
+            opset_version=opset
+        )
+    os.replace(tmp_path, onnx_path)
+    return onnx_path
+
+
+class OnnxTableBackend:
+    """Runs an exported ONNX graph with ONNX Runtime on CPU.
+
+    The graph is exported on first use and reused from ``onnx_path`` after
+    that; outputs are wrapped so the HF post-processing works unchanged.
+    """
+
+    name = "onnx"
+
+    def __init__(self, model, onnx_path: Path, num_threads: Optional[int] = None):
+        import onnxruntime as ort
+
+        onnx_path = Path(onnx_path)
+        if not onnx_path.exists():
+            export_onnx(model, onnx_path)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+
+        self.session = ort.InferenceSession(str(onnx_path), options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+    def __call__(self, inputs: Dict[str, torch.Tensor]):
+        feeds = {k: v.cpu().numpy() for k, v in inputs.items() if k in self.input_names}
+        logits, pred_boxes = self.session.run(["logits", "pred_boxes"], feeds)
+        return SimpleNamespace(logits=torch.from_numpy(logits), pred_boxes=torch.from_numpy(pred_boxes))
+
+
+def build_table_backend(model, settings: Dict[str, Any]):
+    backend = settings.get("backend", "torch")
+    device = settings.get("device", "cpu")
+
+    if backend not in BACKENDS:
+        logger.warning(f"Unknown table backend '{backend}', using torch.")
+        backend = "torch"
+    if backend != "torch" and device != "cpu":
+        logger.warning(f"Table backend '{backend}' is CPU-only, using torch on {device}.")
+        backend = "torch"
+
+    try:
+        st = time.time()
+        if backend == "int8":
+            table_backend = QuantizedTableBackend(model)
+        elif backend == "onnx":
+            table_backend = OnnxTableBackend(model, settings["onnx_path"], settings.get("cpu_threads"))
+        else:
+            return TorchTableBackend(model, device)
+        logger.info(f"Table backend '{backend}' ready in {time.time() - st:.2f}s.")
+        return table_backend
+    except Exception as e:
+        logger.warning(f"Failed to set up table backend '{backend}', using torch: {str(e)}")
+        return TorchTableBackend(model, device)
+
+
+def detect_tables_with(backend, image_processor, id2label: Dict[int, str],
+                       images: List[Any], threshold: float) -> List[List[Dict[str, Any]]]:
+    inputs = image_processor(images=images, return_tensors="pt")
+    outputs = backend(inputs)
+
+    target_sizes = torch.tensor([img.shape[:2] for img in images])
+    batch_results = image_processor.post_process_object_detection(
+        outputs,
+        target_sizes=target_sizes,
+        threshold=threshold
+    )
+
+    all_tables = []
+    for results in batch_results:
+        tables = []
+        for score, label, box in zip(
+            results["scores"],
+            results["labels"],
+            results["boxes"]
+        ):
+            tables.append({
+                "bbox": box.tolist(),
+                "confidence": score.item(),
+                "label": id2label[label.item()]
+            })
+        all_tables.append(tables)
+
+    return all_tables
+
+
+def box_iou(a: List[float], b: List[float]) -> float:
+    ix = max(0.0, min(a[2], b[2]) - max(a[0], b[0]))
+    iy = max(0.0, min(a[3], b[3]) - max(a[1], b[1]))
+    inter = ix * iy
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def compare_detections(reference: List[Dict[str, Any]], candidate: List[Dict[str, Any]],
+                       iou_threshold: float = 0.9, score_tolerance: float = 0.05) -> Dict[str, Any]:
+    """Greedily matches candidate tables to the fp32 reference for one page."""
+    unmatched = list(range(len(candidate)))
+    matched = 0
+    min_iou = 1.0
+    max_score_delta = 0.0
+
+    for ref in sorted(reference, key=lambda t: t["confidence"], reverse=True):
+        best, best_iou = None, 0.0
+        for i in unmatched:
+            if candidate[i]["label"] != ref["label"]:
+                continue
+            iou = box_iou(ref["bbox"], candidate[i]["bbox"])
+            if iou > best_iou:
+                best, best_iou = i, iou
+        if best is None or best_iou < iou_threshold:
+            continue
+        unmatched.remove(best)
+        matched += 1
+        min_iou = min(min_iou, best_iou)
+        max_score_delta = max(max_score_delta, abs(ref["confidence"] - candidate[best]["confidence"]))
+
+    missing = len(reference) - matched
+    extra = len(unmatched)
+    return {
+        "matched": matched,
+        "missing": missing,
+        "extra": extra,
+        "min_iou": round(min_iou, 4) if matched else None,
+        "max_score_delta": round(max_score_delta, 4),
+        "parity": missing == 0 and extra == 0 and max_score_delta <= score_tolerance
+    }
@@ -0,0 +1,100 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List
+
+from utils.logger import get_logger
+
+logger = get_logger("table_batcher")
+
+DetectBatchFn = Callable[[List[Any]], List[List[Dict[str, Any]]]]
+
+
+class TableDetectionBatcher:
+    """Collects page images from concurrent callers and runs them as batches.
+
+    A single worker thread owns the model call, so callers never contend on
+    a lock; each caller waits on its own future instead.
+    """
+
+    def __init__(self, detect_batch: DetectBatchFn, max_batch_size: int = 8, max_wait_ms: float = 20.0):
+        self.detect_batch = detect_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.requests: "queue.Queue" = queue.Queue()
+        self.stats = {"batches": 0, "images": 0, "max_batch": 0}
+        self._stopped = threading.Event()
+        self._worker = threading.Thread(target=self._run, name="table-batcher", daemon=True)
+        self._worker.start()
+        logger.info(f"Table detection batcher started (batch size: {self.max_batch_size}, wait: {max_wait_ms}ms)")
+
+    def submit(self, image: Any) -> Future:
+        future = Future()
+        if self._stopped.is_set():
+            future.set_exception(RuntimeError("Table detection batcher is stopped"))
+            return future
+        self.requests.put((image, future))
+        return future
+
+    def detect(self, image: Any) -> List[Dict[str, Any]]:
+        return self.submit(image).result()
+
+    def _collect_batch(self) -> List[Any]:
+        first = self.requests.get()
+        if first is None:
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self.requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                self.requests.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while not self._stopped.is_set():
+            batch = self._collect_batch()
+            if not batch:
+                continue
+
+            batch = [(image, future) for image, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            try:
+                results = self.detect_batch([image for image, _ in batch])
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+            except Exception as e:
+                logger.warning(f"Batched table detection failed: {str(e)}")
+                for _, future in batch:
+                    future.set_exception(e)
+
+            self.stats["batches"] += 1
+            self.stats["images"] += len(batch)
+            self.stats["max_batch"] = max(self.stats["max_batch"], len(batch))
+
+    def shutdown(self):
+        self._stopped.set()
+        self.requests.put(None)
+        self._worker.join(timeout=5)
+
+        while True:
+            try:
+                item = self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[1].set_exception(RuntimeError("Table detection batcher is stopped"))
+
+        logger.info(f"Table detection batcher stopped after {self.stats['batches']} batches / {self.stats['images']} images.")
@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from scripts.benchmark_block_classifier import HEADINGS, LABELS, legacy_classify_block, make_blocks
+from src.block_classifier import classify_block
+from utils.logger import get_logger
+
+logger = get_logger("test_block_classifier")
+
+
+def test_matches_legacy_labels():
+    """the compiled classifier labels every block as the keyword scans did"""
+    blocks = make_blocks(20_000, seed=3)
+    blocks += HEADINGS + LABELS + ["", "2024", "NOTE 12", "ﬁnancial statements 1,234", "Total 1,234 (567)"]
+    mismatches = [(block, legacy_classify_block(block), classify_block(block))
+                  for block in blocks if legacy_classify_block(block) != classify_block(block)]
+    assert not mismatches, mismatches[:5]
+    logger.info(f"✅ {len(blocks)} blocks labelled identically")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_matches_legacy_labels()]
+    logger.info(f"{sum(results)}/{len(results)} block classifier tests passed")
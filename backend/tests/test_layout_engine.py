@@ -0,0 +1,88 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.layout_engine import grid_text, page_grid
+from src.page_model import WordColumns
+from utils.logger import get_logger
+
+logger = get_logger("test_layout_engine")
+
+CHAR_WIDTH = 5.0
+LINE_HEIGHT = 10.0
+COLUMNS = (400.0, 480.0)
+
+
+def statement_page(rows, with_notes: bool = True) -> WordColumns:
+    """``rows`` is a list of (label, note, [value per column]); values are right-aligned."""
+    texts, bboxes = [], []
+
+    def add(text: str, x0: float, y: float):
+        texts.append(text)
+        bboxes.append([x0, y, x0 + CHAR_WIDTH * len(text), y + LINE_HEIGHT])
+
+    for i, word in enumerate(["Statement", "of", "profit", "or", "loss"]):
+        add(word, 50.0 + 60 * i, 40.0)
+    if with_notes:
+        add("Note", 330.0, 60.0)
+    for year, column in zip(["2024", "2023"], COLUMNS):
+        add(year, column - CHAR_WIDTH * len(year), 60.0)
+
+    for row, (label, note, values) in enumerate(rows):
+        y = 80.0 + 15 * row
+        x = 50.0
+        for word in label.split():
+            add(word, x, y)
+            x += CHAR_WIDTH * (len(word) + 1)
+        if note:
+            add(note, 335.0, y)
+        for value, column in zip(values, COLUMNS):
+            if value:
+                add(value, column - CHAR_WIDTH * len(value), y)
+    return WordColumns.from_texts(0, texts, bboxes)
+
+
+ROWS = [
+    ("Revenue from contracts with customers", "3", ["315,400", "320,012"]),
+    ("Other income", "", ["", "(1,204)"]),
+    ("Employee benefits expense", "", ["(52,118)", "(49,870)"]),
+    ("Profit before income tax", "", ["12,345", ""]),
+]
+
+
+def test_rows_and_columns():
+    """labels, notes and figures land in their own cells under the right year"""
+    grid = page_grid(statement_page(ROWS))
+    assert grid[0] == ["Statement of profit or loss"]
+    assert grid[1] == ["", "Note", "2024", "2023"]
+    assert grid[2] == ["Revenue from contracts with customers", "3", "315400", "320012"]
+    assert grid[3] == ["Other income", "", "", "(1204)"]
+    assert grid[4] == ["Employee benefits expense", "", "(52118)", "(49870)"]
+    assert grid[5] == ["Profit before income tax", "", "12345"]
+    logger.info("✅ Rows and columns assigned")
+    return True
+
+
+def test_note_column_only_when_used():
+    """a page without note references gets no note column"""
+    rows = [(label, "", values) for label, _, values in ROWS]
+    grid = page_grid(statement_page(rows, with_notes=False))
+    assert grid[1] == ["", "2024", "2023"]
+    assert grid[3] == ["Other income", "", "(1204)"]
+    logger.info("✅ Empty note column dropped")
+    return True
+
+
+def test_grid_is_smaller_than_joined_words():
+    """the grid prompt is shorter than the plain word join it replaces"""
+    pages = [statement_page(ROWS * 10) for _ in range(5)]
+    text = grid_text(pages)
+    raw_chars = sum(len(page.text) + 1 for page in pages) - 1
+    assert len(text) < raw_chars, (len(text), raw_chars)
+    logger.info(f"✅ Grid text {len(text)} chars vs {raw_chars} joined")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_rows_and_columns(), test_note_column_only_when_used(), test_grid_is_smaller_than_joined_words()]
+    logger.info(f"{sum(results)}/{len(results)} layout engine tests passed")
@@ -0,0 +1,126 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.metadata_detector import CONFIRM_PAGES, MetadataDetector, detect_currency, detect_rounding
+from utils.logger import get_logger
+
+logger = get_logger("test_metadata_detector")
+
+NARRATIVE = "The directors present their report on the consolidated entity for the year."
+USD_MILLIONS = "Presented in USD. All amounts are in millions unless stated otherwise."
+AUD_THOUSANDS = "Presented in AUD. All amounts are in thousands unless stated otherwise."
+# narrative that mentions a scale and a currency without declaring either
+MENTIONS = "Revenue grew by millions of dollars as sales in US markets and euro markets rose."
+NOTES = "Amounts in the financial report have been rounded to the nearest thousand dollars. Presented in AUD."
+
+
+def new_detector() -> MetadataDetector:
+    return MetadataDetector({"currency": None, "rounding": None, "rounding_note": None})
+
+
+def feed(detector: MetadataDetector, *pages: str):
+    for text in pages:
+        detector.feed(text.upper(), text.lower())
+
+
+def test_found_on_later_pages():
+    """values that first appear deep in the document are still picked up"""
+    detector = new_detector()
+    feed(detector, *[NARRATIVE] * 20)
+    assert detector.metadata["currency"] is None and detector.metadata["rounding"] is None
+
+    feed(detector, USD_MILLIONS)
+    assert detector.metadata["currency"] == "USD"
+    assert detector.metadata["rounding"] == "millions"
+    assert "millions" in detector.metadata["rounding_note"]
+    assert not detector.done
+    logger.info("✅ Later-page metadata detected")
+    return True
+
+
+def test_conflicting_values():
+    """until a value is confirmed the latest page wins; a confirmed value is kept"""
+    detector = new_detector()
+    feed(detector, USD_MILLIONS, AUD_THOUSANDS)
+    assert detector.metadata["currency"] == "AUD" and detector.metadata["rounding"] == "thousands"
+    assert not detector.done
+
+    feed(detector, USD_MILLIONS)
+    assert detector.metadata["currency"] == "USD" and detector.metadata["rounding"] == "millions"
+    assert detector.done
+
+    feed(detector, AUD_THOUSANDS)
+    assert detector.metadata["currency"] == "USD" and detector.metadata["rounding"] == "millions"
+    logger.info("✅ Conflicts resolved by confirmation")
+    return True
+
+
+def test_stops_once_confirmed():
+    """after CONFIRM_PAGES agreeing pages the detector is done and ignores later pages"""
+    detector = new_detector()
+    feed(detector, *[AUD_THOUSANDS] * (CONFIRM_PAGES - 1))
+    assert not detector.done
+
+    feed(detector, AUD_THOUSANDS)
+    assert detector.done
+    seen = dict(detector.seen)
+
+    feed(detector, *[USD_MILLIONS] * 5)
+    assert detector.seen == seen
+    assert detector.metadata["currency"] == "AUD" and detector.metadata["rounding"] == "thousands"
+    logger.info("✅ Detection stops after confirmation")
+    return True
+
+
+def test_gaps_stay_within_a_sentence():
+    """a bounded gap does not join words from different sentences"""
+    text = "amounts receivable are shown net of allowances. the group raised equity in millions last year"
+    assert detect_rounding(text) == (None, None)
+    assert detect_rounding("all amounts are in millions")[0] == "millions"
+    logger.info("✅ Gaps bounded to one sentence")
+    return True
+
+
+def test_declarations_outrank_mentions():
+    """narrative mentions never confirm a value and give way to a later declaration"""
+    detector = new_detector()
+    feed(detector, *[MENTIONS] * (CONFIRM_PAGES + 1))
+    assert detector.metadata["rounding"] == "millions"
+    assert detector.confirmed == set()
+
+    feed(detector, NOTES)
+    assert detector.metadata["rounding"] == "thousands" and detector.metadata["currency"] == "AUD"
+    assert "nearest thousand" in detector.metadata["rounding_note"]
+
+    # once declared, a mention no longer overrides the value
+    feed(detector, MENTIONS)
+    assert detector.metadata["rounding"] == "thousands" and detector.metadata["currency"] == "AUD"
+    assert not detector.done
+
+    feed(detector, NOTES)
+    assert detector.done
+    logger.info("✅ Declarations outrank mentions")
+    return True
+
+
+def test_decimal_point_does_not_end_a_sentence():
+    """a scale given with a decimal amount is still read"""
+    assert detect_rounding("amounts have been rounded to $0.1 million unless otherwise stated")[0] == "millions"
+    assert detect_rounding("all figures are in $0.1 millions")[0] == "millions"
+    assert detect_rounding("revenue ($'000)")[0] == "thousands"
+    assert detect_currency("AMOUNTS ARE PRESENTED IN USD.") == "USD"
+    logger.info("✅ Decimal points kept inside a sentence")
+    return True
+
+
+if __name__ == "__main__":
+    results = [
+        test_found_on_later_pages(),
+        test_conflicting_values(),
+        test_stops_once_confirmed(),
+        test_gaps_stay_within_a_sentence(),
+        test_declarations_outrank_mentions(),
+        test_decimal_point_does_not_end_a_sentence()
+    ]
+    logger.info(f"{sum(results)}/{len(results)} metadata detector tests passed")
@@ -0,0 +1,114 @@
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.model_registry import FAILED, LOADED, UNLOADED, ModelRegistry
+from utils.logger import get_logger
+
+logger = get_logger("test_model_registry")
+
+
+class StubLoader:
+    """Counts calls and fails until told otherwise."""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = 0
+
+    def __call__(self) -> bool:
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def test_loads_once_on_first_use():
+    """registering does not load; the first load does, later loads reuse it"""
+    registry = ModelRegistry()
+    loader = StubLoader([True])
+    model = registry.register("detector", loader)
+
+    assert model.state == UNLOADED and loader.calls == 0
+    assert not registry.is_loaded("detector")
+
+    assert registry.load("detector") and registry.load("detector")
+    assert loader.calls == 1
+    assert model.state == LOADED and registry.is_loaded("detector")
+    assert registry.stats()["detector"]["load_time_s"] is not None
+
+    # registering again keeps the existing model
+    assert registry.register("detector", StubLoader([False])) is model
+    assert not registry.load("unknown")
+    logger.info("✅ Models load once, on first use")
+    return True
+
+
+def test_failure_backs_off_then_retries():
+    """a failed load fails fast, is retried after the backoff, and the backoff doubles"""
+    registry = ModelRegistry(retry_after=0.05, max_retry_after=0.08)
+    loader = StubLoader([RuntimeError("out of memory"), False, True])
+    model = registry.register("detector", loader)
+
+    assert not registry.load("detector")
+    assert model.state == FAILED and model.error == "out of memory"
+    assert registry.failed() == ["detector"]
+    assert registry.stats()["detector"]["retry_in_s"] is not None
+
+    assert not registry.load("detector")
+    assert loader.calls == 1
+
+    time.sleep(0.06)
+    assert not registry.load("detector")
+    assert loader.calls == 2 and model.failures == 2
+    # the second wait is capped at max_retry_after
+    assert model.retry_at - time.monotonic() <= 0.08
+
+    time.sleep(0.09)
+    assert registry.load("detector")
+    assert loader.calls == 3 and model.state == LOADED and model.failures == 0
+    assert registry.failed() == []
+    logger.info("✅ Failed loads are retried after a backoff")
+    return True
+
+
+def test_reset_allows_immediate_retry():
+    """reset clears a failure without waiting for the backoff"""
+    registry = ModelRegistry(retry_after=60.0)
+    loader = StubLoader([False, True])
+    model = registry.register("detector", loader)
+
+    assert not registry.load("detector")
+    model.reset()
+    assert model.state == UNLOADED and model.error is None
+    assert registry.load("detector") and loader.calls == 2
+    logger.info("✅ Reset allows a retry right away")
+    return True
+
+
+def test_cold_start_is_ready():
+    """a freshly started server reports ready with every model still lazy"""
+    registry = ModelRegistry()
+    assert not registry.ready()
+
+    registry.register("mistral", StubLoader([True]))
+    registry.register("table_transformer", StubLoader([False]))
+    assert registry.ready()
+    health = registry.health()
+    assert health["loaded"] == {} and health["failed"] == {}
+    assert set(health["lazy"]) == {"mistral", "table_transformer"}
+
+    registry.load("mistral")
+    registry.load("table_transformer")
+    health = registry.health()
+    assert list(health["loaded"]) == ["mistral"] and list(health["failed"]) == ["table_transformer"]
+    assert not registry.ready()
+    logger.info("✅ Cold start reports ready with lazy models")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_loads_once_on_first_use(), test_failure_backs_off_then_retries(), test_reset_allows_immediate_retry(),
+               test_cold_start_is_ready()]
+    logger.info(f"{sum(results)}/{len(results)} model registry tests passed")
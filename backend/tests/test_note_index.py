@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.note_index import build_note_index
+from src.page_model import PageData, WordColumns
+from utils.logger import get_logger
+
+logger = get_logger("test_note_index")
+
+CHAR_WIDTH = 5.0
+LINE_HEIGHT = 10.0
+
+
+def make_page(page_num: int, lines) -> PageData:
+    """``lines`` is a list of texts, one per line, each starting at the left margin."""
+    texts, bboxes = [], []
+    for row, line in enumerate(lines):
+        x0, y0 = 50.0, 40.0 + 14 * row
+        for word in line.split():
+            texts.append(word)
+            bboxes.append([x0, y0, x0 + CHAR_WIDTH * len(word), y0 + LINE_HEIGHT])
+            x0 += CHAR_WIDTH * (len(word) + 1)
+    return PageData(page_num, WordColumns.from_texts(page_num, texts, bboxes), width=600.0, height=800.0)
+
+
+def test_numbered_sentences_are_not_headings():
+    """a sentence ending in a number is prose, not a note heading"""
+    pages = [make_page(n, [f"Narrative page {n}. See the directors' report for details."]) for n in range(30)]
+    assert build_note_index(pages) == {}
+    logger.info("✅ Numbered sentences ignored")
+    return True
+
+
+def test_headings_open_a_line():
+    """a number opening its own line is a heading; references are found anywhere"""
+    page = make_page(7, [
+        "12. Revenue",
+        "Revenue is recognised as set out on page 4. The group sells goods.",
+        "Trade receivables are described in Note 14 and Notes 15 and 16."
+    ])
+    index = build_note_index([page])
+
+    assert [entry['type'] for entry in index['12']] == ['heading']
+    assert index['12'][0]['page'] == 7
+    assert '4' not in index
+    assert all(index[number][0]['type'] == 'reference' for number in ('14', '15', '16'))
+    logger.info("✅ Headings anchored to line starts")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_numbered_sentences_are_not_headings(), test_headings_open_a_line()]
+    logger.info(f"{sum(results)}/{len(results)} note index tests passed")
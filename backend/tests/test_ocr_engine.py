@@ -0,0 +1,188 @@
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import fitz
+
+from src import ocr_engine
+from src.ocr_engine import OcrEngine
+from src.page_model import PageData, WordColumns
+from src.page_scheduler import PageScheduler
+from src.pdf_processor import PDFProcessor
+from src.pdf_session import PDFDocumentSession
+from utils.logger import get_logger
+
+logger = get_logger("test_ocr_engine")
+
+# pixel boxes at 72 dpi, so they are page points as well
+OCR_TEXTS = ["Revenue", "1,234"]
+OCR_BOXES = [[72.0, 60.0, 120.0, 74.0], [300.0, 60.0, 330.0, 74.0]]
+
+
+class StubTesseract:
+    """Stands in for the OCR worker and counts the rasters it is sent."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, raster, lang):
+        self.calls += 1
+        return list(OCR_TEXTS), [list(box) for box in OCR_BOXES]
+
+
+class OcrPages:
+    """Just the OCR steps of PDFProcessor, without loading its models."""
+
+    ocr_pages = PDFProcessor.ocr_pages
+    finish_ocr = PDFProcessor.finish_ocr
+    classify_text_blocks = PDFProcessor.classify_text_blocks
+
+    def __init__(self, engine: OcrEngine):
+        self.ocr_engine = engine
+
+
+class StubFinder:
+    def __init__(self):
+        self.done = False
+
+    def complete(self) -> bool:
+        return self.done
+
+
+def scan(color) -> fitz.Pixmap:
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 40, 40), False)
+    pix.set_rect(pix.irect, color)
+    return pix
+
+
+def write_pdf(path: Path):
+    """text page, scanned page, blank page, scanned page, scan with a text layer"""
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Statement of financial position 2024 2023")
+    doc.new_page().insert_image(fitz.Rect(72, 72, 472, 472), pixmap=scan((200, 10, 10)))
+    doc.new_page()
+    doc.new_page().insert_image(fitz.Rect(72, 72, 472, 472), pixmap=scan((10, 10, 200)))
+    page = doc.new_page()
+    page.insert_image(fitz.Rect(72, 72, 472, 472), pixmap=scan((10, 200, 10)))
+    page.insert_text((72, 500), "Notes to the financial statements continued here")
+    doc.save(str(path))
+    doc.close()
+
+
+def read_pages(session: PDFDocumentSession):
+    pages = []
+    for page_num in range(session.page_count):
+        words = session.page(page_num).get_text("words")
+        columns = WordColumns.from_texts(page_num, [w[4] for w in words], [list(w[:4]) for w in words])
+        pages.append(PageData(page_num, columns, width=612.0, height=792.0))
+    return pages
+
+
+def ocr_setup(tmp: Path):
+    write_pdf(tmp / "scan.pdf")
+    scheduler = PageScheduler(max_workers=2)
+    engine = OcrEngine(scheduler, max_workers=1, dpi=72, lang="eng", min_words=5,
+                       cache_dir=tmp / "ocr", cache_max_bytes=16 * 1024 * 1024)
+    # Tesseract runs in a thread here, so the stub below is the one called
+    engine.executor.shutdown()
+    engine.executor = ThreadPoolExecutor(max_workers=1)
+    return scheduler, engine
+
+
+def with_stub_tesseract(test):
+    def run():
+        stub = StubTesseract()
+        original = ocr_engine.ocr_raster
+        ocr_engine.ocr_raster = stub
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                return test(Path(tmp), stub)
+        finally:
+            ocr_engine.ocr_raster = original
+    run.__name__ = test.__name__
+    run.__doc__ = test.__doc__
+    return run
+
+
+@with_stub_tesseract
+def test_only_image_only_pages_are_ocred(tmp: Path, stub: StubTesseract):
+    """pages with a text layer or without images are passed through untouched"""
+    scheduler, engine = ocr_setup(tmp)
+    try:
+        with PDFDocumentSession(tmp / "scan.pdf") as session:
+            pages = read_pages(session)
+            assert [engine.needs_ocr(session, page) for page in pages] == [False, True, False, True, False]
+
+            done = list(OcrPages(engine).ocr_pages(session, iter(pages), wanted=lambda: True))
+    finally:
+        engine.shutdown()
+        scheduler.shutdown()
+
+    assert [page.page_num for page in done] == [0, 1, 2, 3, 4]
+    assert stub.calls == 2
+    assert done[1].text.split() == OCR_TEXTS and done[3].text.split() == OCR_TEXTS
+    assert done[1].words.bboxes.tolist() == OCR_BOXES
+    assert len(done[2].words) == 0 and "Statement" in done[0].text
+    logger.info("✅ Only image-only pages OCR'd")
+    return True
+
+
+@with_stub_tesseract
+def test_results_are_cached_by_raster(tmp: Path, stub: StubTesseract):
+    """the same rendered image is read once, also by a restarted engine"""
+    scheduler, engine = ocr_setup(tmp)
+    try:
+        with PDFDocumentSession(tmp / "scan.pdf") as session:
+            first, _ = engine.submit(session, 1).result()
+            again, _ = engine.submit(session, 1).result()
+            assert first == again == OCR_TEXTS
+            assert stub.calls == 1 and engine.stats()["cache_hits"] == 1
+
+            engine.submit(session, 3).result()
+            assert stub.calls == 2
+
+            restarted = OcrEngine(scheduler, max_workers=1, dpi=72, lang="eng", min_words=5,
+                                  cache_dir=tmp / "ocr", cache_max_bytes=16 * 1024 * 1024)
+            restarted.submit(session, 1).result()
+            restarted.shutdown()
+            assert stub.calls == 2
+    finally:
+        engine.shutdown()
+        scheduler.shutdown()
+    logger.info("✅ OCR results cached by raster hash")
+    return True
+
+
+@with_stub_tesseract
+def test_ocr_stops_once_sections_are_complete(tmp: Path, stub: StubTesseract):
+    """pages arriving after the section finder is complete are not OCR'd"""
+    scheduler, engine = ocr_setup(tmp)
+    finder = StubFinder()
+    try:
+        with PDFDocumentSession(tmp / "scan.pdf") as session:
+            pages = read_pages(session)
+
+            def stream():
+                for page in pages:
+                    yield page
+                    # every statement has been found by the time page 1 is through
+                    finder.done = page.page_num >= 1
+
+            done = list(OcrPages(engine).ocr_pages(session, stream(), wanted=lambda: not finder.complete()))
+    finally:
+        engine.shutdown()
+        scheduler.shutdown()
+
+    assert stub.calls == 1
+    assert done[1].text.split() == OCR_TEXTS
+    assert len(done[3].words) == 0
+    logger.info("✅ OCR stops once the sections are complete")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_only_image_only_pages_are_ocred(), test_results_are_cached_by_raster(),
+               test_ocr_stops_once_sections_are_complete()]
+    logger.info(f"{sum(results)}/{len(results)} OCR engine tests passed")
@@ -0,0 +1,144 @@
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import fitz
+
+from src.page_cache import PageCache
+from src.page_model import PageData, WordColumns
+from src.pdf_session import PDFDocumentSession
+from utils.logger import get_logger
+
+logger = get_logger("test_page_cache")
+
+
+def write_pdf(path: Path, lines):
+    doc = fitz.open()
+    page = doc.new_page()
+    for i, text in enumerate(lines):
+        page.insert_text((72, 72 + 14 * i), text)
+    doc.save(str(path))
+    doc.close()
+
+
+def extracted_page(page_num: int) -> PageData:
+    words = WordColumns.from_texts(page_num, ["Revenue", "1,234"], [[72.0, 62.0, 120.0, 74.0], [300.0, 62.0, 330.0, 74.0]])
+    return PageData(page_num, words, structured_text={'paragraphs': []}, width=612.0, height=792.0)
+
+
+def test_hit_on_same_content_miss_on_changed():
+    """a page is found again by content, whatever the file, and changed content misses"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        cache = PageCache(tmp / "cache", 16 * 1024 * 1024)
+        write_pdf(tmp / "first.pdf", ["Revenue 1,234"])
+        write_pdf(tmp / "copy.pdf", ["Revenue 1,234"])
+        write_pdf(tmp / "changed.pdf", ["Revenue 4,321"])
+
+        with PDFDocumentSession(tmp / "first.pdf") as session:
+            hashes = cache.page_hashes(session)
+            assert cache.load_page(hashes, 0) is None
+            assert cache.put_page(hashes.get(0), extracted_page(0))
+
+        with PDFDocumentSession(tmp / "copy.pdf") as session:
+            page = cache.load_page(cache.page_hashes(session), 0)
+            assert page is not None and page.text == extracted_page(0).text
+
+        with PDFDocumentSession(tmp / "changed.pdf") as session:
+            assert cache.load_page(cache.page_hashes(session), 0) is None
+
+        assert cache.stats()["page_hits"] == 1
+    logger.info("✅ Page cache hits only on identical content")
+    return True
+
+
+def test_tables_keyed_by_render_spec():
+    """detected tables are reused only for the same content, render spec and detector"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PageCache(Path(tmp) / "cache", 16 * 1024 * 1024)
+        spec = (1.5, None, False)
+        tables = [{'label': 'table', 'score': 0.98, 'bbox': [40.0, 60.0, 560.0, 700.0], 'word_indices': [0, 1]}]
+
+        assert cache.get_tables("f" * 64, spec) is None
+        cache.put_tables("f" * 64, spec, tables)
+        assert cache.get_tables("f" * 64, spec) == tables
+        assert cache.get_tables("f" * 64, (2.0, None, False)) is None
+        assert cache.get_tables("e" * 64, spec) is None
+
+        cache.detector = "another-detector"
+        assert cache.get_tables("f" * 64, spec) is None
+        assert cache.stats()["table_hits"] == 1
+    logger.info("✅ Tables keyed by content, spec and detector")
+    return True
+
+
+def test_ocr_words_replace_an_empty_entry():
+    """a page cached without words is overwritten once OCR fills it, but never emptied again"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PageCache(Path(tmp) / "cache", 16 * 1024 * 1024)
+        scanned = PageData(0, WordColumns.from_texts(0, [], []), width=612.0, height=792.0)
+
+        assert cache.put_page("f" * 64, scanned)
+        assert cache.put_page("f" * 64, extracted_page(0))
+        assert not cache.put_page("f" * 64, scanned)
+        assert cache.get_page("f" * 64, 0).text == extracted_page(0).text
+    logger.info("✅ OCR'd words replace an empty cache entry")
+    return True
+
+
+def test_cached_page_is_not_written_back():
+    """a page read from the cache, even after a restart, is not stored again"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PageCache(Path(tmp) / "cache", 16 * 1024 * 1024)
+        assert cache.put_page("f" * 64, extracted_page(0))
+        assert cache.store.get_meta(cache.page_key("f" * 64)) == len(extracted_page(0).words)
+
+        restarted = PageCache(Path(tmp) / "cache", 16 * 1024 * 1024)
+        page = restarted.get_page("f" * 64, 3)
+        writes = []
+        restarted.store.put = lambda *args, **kwargs: writes.append(args)
+        assert not restarted.put_page("f" * 64, page)
+        assert writes == []
+    logger.info("✅ Cached pages are not written back")
+    return True
+
+
+def test_unreadable_tables_entry_is_a_miss():
+    """a corrupt tables entry is dropped and reported as a miss instead of raising"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PageCache(Path(tmp) / "cache", 16 * 1024 * 1024)
+        spec = (1.5, None, False)
+        cache.store.put(cache.tables_key("f" * 64, spec), b"not a pickle")
+
+        assert cache.get_tables("f" * 64, spec) is None
+        assert cache.tables_key("f" * 64, spec) not in cache.store
+        assert cache.stats()["table_hits"] == 0
+    logger.info("✅ Unreadable tables entry discarded")
+    return True
+
+
+def test_unhashable_page_is_not_cached():
+    """a page whose content cannot be read is skipped, not fatal"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        cache = PageCache(tmp / "cache", 16 * 1024 * 1024)
+        write_pdf(tmp / "doc.pdf", ["Revenue 1,234"])
+
+        with PDFDocumentSession(tmp / "doc.pdf") as session:
+            def broken_page(page_num: int):
+                raise RuntimeError("damaged content stream")
+
+            session.page = broken_page
+            hashes = cache.page_hashes(session)
+            assert hashes.get(0) is None
+            assert cache.load_page(hashes, 0) is None
+    logger.info("✅ Unhashable pages skip the cache")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_hit_on_same_content_miss_on_changed(), test_tables_keyed_by_render_spec(),
+               test_ocr_words_replace_an_empty_entry(), test_cached_page_is_not_written_back(),
+               test_unreadable_tables_entry_is_a_miss(), test_unhashable_page_is_not_cached()]
+    logger.info(f"{sum(results)}/{len(results)} page cache tests passed")
@@ -0,0 +1,82 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import fitz
+import numpy as np
+import pytest
+
+from src.page_engine import raster_to_array, render_page_array, render_scale, to_page_bbox
+from utils.logger import get_logger
+
+logger = get_logger("test_page_engine")
+
+# a filled box on an A4 page, in page points
+BOX = (100.0, 200.0, 300.0, 260.0)
+
+
+def box_page():
+    doc = fitz.open()
+    page = doc.new_page(width=595.0, height=842.0)
+    page.draw_rect(fitz.Rect(BOX), color=(0, 0, 0), fill=(0, 0, 0))
+    return doc, page
+
+
+SCALE_CASES = [
+    # A4 portrait: the shortest edge decides
+    (595.0, 842.0, 800, 1333, 4.0, 800 / 595.0),
+    # a long strip: the longest edge decides
+    (200.0, 1400.0, 800, 1333, 4.0, 1333 / 1400.0),
+    # a small clip would be blown up past max_scale
+    (80.0, 60.0, 800, 1333, 4.0, 4.0),
+]
+
+
+@pytest.mark.parametrize("width,height,shortest_edge,longest_edge,max_scale,expected", SCALE_CASES)
+def test_render_scale(width, height, shortest_edge, longest_edge, max_scale, expected):
+    assert render_scale(width, height, shortest_edge, longest_edge, max_scale) == pytest.approx(expected)
+
+
+def test_to_page_bbox_adds_the_clip_offset():
+    """render pixels divide by the scale and shift by the clip's origin"""
+    assert to_page_bbox([20.0, 40.0, 200.0, 100.0], (2.0, None, False)) == [10.0, 20.0, 100.0, 50.0]
+    assert to_page_bbox([20.0, 40.0, 200.0, 100.0], (2.0, (50.0, 70.0, 400.0, 500.0), True)) == [60.0, 90.0, 150.0, 120.0]
+    logger.info("✅ Pixel boxes mapped to page points")
+    return True
+
+
+def test_raster_to_array():
+    """RGB samples reshape in place; a gray plane is broadcast to three channels without a copy"""
+    rgb = raster_to_array((bytes(range(12)), 2, 2, 3))
+    assert rgb.shape == (2, 2, 3) and rgb[1, 1].tolist() == [9, 10, 11]
+
+    gray = raster_to_array((bytes([0, 64, 128, 255]), 2, 2, 1))
+    assert gray.shape == (2, 2, 3) and gray[0, 1].tolist() == [64, 64, 64]
+    assert gray.strides[2] == 0
+    logger.info("✅ Rasters become detector arrays")
+    return True
+
+
+@pytest.mark.parametrize("spec", [(1.5, None, False), (2.0, (50.0, 150.0, 400.0, 400.0), True)])
+def test_pixel_to_point_round_trip(spec):
+    """the box found in the rendered pixels maps back onto the box drawn in points"""
+    doc, page = box_page()
+    try:
+        array = render_page_array(page, spec)
+    finally:
+        doc.close()
+
+    rows, cols = np.nonzero(array[:, :, 0] < 128)
+    pixel_bbox = [cols.min(), rows.min(), cols.max() + 1, rows.max() + 1]
+    scale = spec[0]
+    assert to_page_bbox(pixel_bbox, spec) == pytest.approx(list(BOX), abs=1.0 / scale + 0.5)
+
+
+if __name__ == "__main__":
+    for case in SCALE_CASES:
+        test_render_scale(*case)
+    test_to_page_bbox_adds_the_clip_offset()
+    test_raster_to_array()
+    for spec in [(1.5, None, False), (2.0, (50.0, 150.0, 400.0, 400.0), True)]:
+        test_pixel_to_point_round_trip(spec)
+    logger.info(f"{len(SCALE_CASES) + 4} page engine tests passed")
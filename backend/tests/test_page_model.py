@@ -0,0 +1,33 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from src.page_model import PageData, WordColumns
+from utils.logger import get_logger
+
+logger = get_logger("test_page_model")
+
+
+def test_words_with_spaces_keep_their_bboxes():
+    """a word holding a space stays one word, lined up with its own bbox"""
+    texts = ["Cash", "and cash equivalents", "1,234"]
+    bboxes = [[10.0, 10.0, 40.0, 20.0], [50.0, 10.0, 200.0, 20.0], [300.0, 10.0, 330.0, 20.0]]
+    words = WordColumns.from_texts(0, texts, bboxes)
+
+    assert words.texts() == texts
+    subset = words.subset(np.array([1, 2]))
+    assert subset.texts() == texts[1:]
+    assert subset.bboxes.tolist() == bboxes[1:]
+
+    page = PageData(0, WordColumns.from_texts(0, [], []))
+    page['text_instances'] = [{'text': text, 'bbox': bbox} for text, bbox in zip(texts, bboxes)]
+    assert [instance['text'] for instance in page['text_instances']] == texts
+    logger.info("✅ Words with spaces stay aligned")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_words_with_spaces_keep_their_bboxes()]
+    logger.info(f"{sum(results)}/{len(results)} page model tests passed")
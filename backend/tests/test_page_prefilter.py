@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.page_model import PageData, WordColumns
+from src.page_prefilter import CONTINUATION_SCORE, HEADING_SCORE, score_page, score_pages, select_candidate_pages
+from utils.logger import get_logger
+
+logger = get_logger("test_page_prefilter")
+
+
+def make_page(page_num: int, text: str) -> PageData:
+    texts = text.split()
+    bboxes = [[10.0 * i, 10.0, 10.0 * i + 8, 20.0] for i in range(len(texts))]
+    return PageData(page_num, WordColumns.from_texts(page_num, texts, bboxes), width=600.0, height=800.0)
+
+
+FIGURES = "2024 2023 " + "1,234 " * 10 + "Revenue " * 8
+
+SCORE_CASES = [
+    ("", 0.0),
+    ("Consolidated statement of financial position", HEADING_SCORE),
+    # 10 figures and 2 years out of 20 words: density of the non-year figures, plus 1 for the years
+    (FIGURES, 10.0 * 10 / 20 + 1.0),
+    ("Statement of cash flows " + FIGURES, HEADING_SCORE + 10.0 * 10 / 24 + 1.0),
+    # too few figures to count as a table, but two years
+    ("Comparison of 2024 with 2023", 1.0),
+    ("Note 12 describes the accounting policies of the group", 0.0),
+]
+
+
+@pytest.mark.parametrize("text,expected", SCORE_CASES)
+def test_score_page(text, expected):
+    assert score_page(make_page(0, text)) == pytest.approx(expected)
+
+
+def test_heading_lifts_the_next_page():
+    """the page after a statement heading is scored as a possible continuation"""
+    pages = [make_page(0, "Directors report"), make_page(1, "Statement of profit or loss"), make_page(2, "Revenue")]
+    assert score_pages(pages) == {0: 0.0, 1: HEADING_SCORE, 2: CONTINUATION_SCORE}
+    logger.info("✅ Continuation page scored")
+    return True
+
+
+SELECT_CASES = [
+    (2, 2.0, [1, 3]),
+    (10, 2.0, [1, 2, 3]),
+    (10, 5.0, [1, 3]),
+    (10, 20.0, []),
+]
+
+
+@pytest.mark.parametrize("max_candidates,min_score,expected", SELECT_CASES)
+def test_select_candidate_pages(max_candidates, min_score, expected):
+    scores = {0: 0.5, 1: 10.0, 2: 3.0, 3: 6.0}
+    assert select_candidate_pages(scores, max_candidates=max_candidates, min_score=min_score) == expected
+
+
+if __name__ == "__main__":
+    for text, expected in SCORE_CASES:
+        test_score_page(text, expected)
+    for case in SELECT_CASES:
+        test_select_candidate_pages(*case)
+    test_heading_lifts_the_next_page()
+    logger.info(f"{len(SCORE_CASES) + len(SELECT_CASES) + 1} page prefilter tests passed")
@@ -0,0 +1,93 @@
+import sys
+import threading
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.page_scheduler import PageScheduler
+from utils.logger import get_logger
+
+logger = get_logger("test_page_scheduler")
+
+
+def gated_scheduler():
+    """A one-worker scheduler whose worker is held by a task until the gate opens."""
+    scheduler = PageScheduler(max_workers=1)
+    started, gate = threading.Event(), threading.Event()
+
+    def hold():
+        started.set()
+        gate.wait(timeout=5)
+
+    held = scheduler.submit("gate", hold)
+    assert started.wait(timeout=5)
+    return scheduler, gate, held
+
+
+def test_round_robin_across_documents():
+    """a document queued later is not starved by one with more pages queued first"""
+    scheduler, gate, held = gated_scheduler()
+    order = []
+    try:
+        futures = [scheduler.submit("big", order.append, f"big-{i}") for i in range(3)]
+        futures += [scheduler.submit("small", order.append, f"small-{i}") for i in range(2)]
+        gate.set()
+        held.result(timeout=5)
+        for future in futures:
+            future.result(timeout=5)
+    finally:
+        scheduler.shutdown()
+
+    assert order == ["big-0", "small-0", "big-1", "small-1", "big-2"]
+    logger.info("✅ Documents take turns")
+    return True
+
+
+def test_front_jumps_only_its_own_document():
+    """a front task runs before its document's queue, not before other documents"""
+    scheduler, gate, held = gated_scheduler()
+    order = []
+    try:
+        futures = [scheduler.submit("a", order.append, f"a-{i}") for i in range(2)]
+        futures.append(scheduler.submit("b", order.append, "b-0"))
+        futures.append(scheduler.submit("a", order.append, "a-render", front=True))
+        gate.set()
+        for future in [held] + futures:
+            future.result(timeout=5)
+    finally:
+        scheduler.shutdown()
+
+    assert order == ["a-render", "b-0", "a-0", "a-1"]
+    logger.info("✅ Front tasks stay within their document's turn")
+    return True
+
+
+def test_stats_counts():
+    """queue depth, documents queued, busy workers and completions are reported"""
+    scheduler, gate, held = gated_scheduler()
+    try:
+        futures = [scheduler.submit(doc, abs, -i) for doc in ("a", "b") for i in range(2)]
+        stats = scheduler.stats()
+        assert stats["workers"] == 1
+        assert stats["busy"] == 1
+        assert stats["queue_depth"] == 4
+        assert stats["documents_queued"] == 2
+
+        gate.set()
+        held.result(timeout=5)
+        assert [future.result(timeout=5) for future in futures] == [0, 1, 0, 1]
+    finally:
+        scheduler.shutdown()
+
+    stats = scheduler.stats()
+    assert stats["completed"] == 5
+    assert stats["busy"] == 0 and stats["queue_depth"] == 0 and stats["documents_queued"] == 0
+    assert stats["max_wait_ms"] >= stats["avg_wait_ms"] >= 0.0
+
+    assert scheduler.submit("a", abs, -1).exception(timeout=1) is not None
+    logger.info("✅ Scheduler stats count tasks")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_round_robin_across_documents(), test_front_jumps_only_its_own_document(), test_stats_counts()]
+    logger.info(f"{sum(results)}/{len(results)} page scheduler tests passed")
@@ -0,0 +1,101 @@
+import sys
+import gc
+import logging
+import pickle
+import tempfile
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.page_model import PageData, WordColumns
+from src.page_store import PageStore
+from utils.logger import get_logger
+
+logger = get_logger("test_page_store")
+
+
+def make_page(page_num: int, words: int = 200) -> PageData:
+    texts = [f"word{page_num}_{i}" for i in range(words)]
+    bboxes = [[10.0 * (i % 50), 12.0 * (i // 50), 10.0 * (i % 50) + 8, 12.0 * (i // 50) + 10] for i in range(words)]
+    structured_text = {
+        'headers': [],
+        'tables': [],
+        'paragraphs': [{'text': " ".join(texts[:50]), 'bbox': [0.0, 0.0, 500.0, 48.0], 'type': 'paragraph'}],
+        'financial_data': []
+    }
+    return PageData(page_num, WordColumns.from_texts(page_num, texts, bboxes),
+                    structured_text=structured_text, width=600.0, height=800.0)
+
+
+def test_admit_spills_over_budget():
+    """pages past the budget are written out and read back unchanged"""
+    with tempfile.TemporaryDirectory() as spill_dir:
+        one_page = make_page(0).resident_bytes
+        store = PageStore(Path(spill_dir), budget_bytes=int(one_page * 3.5))
+
+        pages = [make_page(n) for n in range(10)]
+        expected = [(page.text, page.words.bboxes.copy(), page.structured_text) for page in pages]
+        for page in pages:
+            store.admit(page)
+
+        stats = store.stats()
+        assert stats["spills"] >= 6, stats
+        assert stats["resident_pages"] <= 3, stats
+        assert store.resident_bytes <= store.budget_bytes
+        assert pages[0]._words is None and pages[0]._structured_text is None
+
+        for page, (text, bboxes, structured_text) in zip(pages, expected):
+            assert page.text == text
+            assert (page.words.bboxes == bboxes).all()
+            assert page['structured_text'] == structured_text
+        assert store.stats()["reloads"] >= 6
+        assert store.resident_bytes <= store.budget_bytes
+
+        # pickles carry the words, never the store
+        restored = pickle.loads(pickle.dumps(pages[0]))
+        assert restored.text == expected[0][0] and restored._store is None
+
+        del store, pages, page, restored
+        gc.collect()
+
+    logger.info("✅ Pages spill and reload within the budget")
+    return True
+
+
+def test_budget_counts_blocks():
+    """classified blocks count toward the resident size"""
+    page = make_page(0)
+    with_blocks = page.resident_bytes
+    page.structured_text = {}
+    assert with_blocks > page.resident_bytes
+    logger.info("✅ Blocks are part of the resident size")
+    return True
+
+
+def test_oversized_page_warned_once():
+    """a page larger than the whole budget is reported once, not on every use"""
+    with tempfile.TemporaryDirectory() as spill_dir:
+        store = PageStore(Path(spill_dir), budget_bytes=1)
+        page = make_page(0)
+        warnings = []
+        handler = logging.Handler()
+        handler.emit = lambda record: warnings.append(record.getMessage())
+        store_logger = logging.getLogger("page_store")
+        store_logger.addHandler(handler)
+        try:
+            for _ in range(3):
+                store.admit(page)
+            store.refresh(page)
+            store.admit(make_page(1))
+        finally:
+            store_logger.removeHandler(handler)
+
+        oversized = [message for message in warnings if "alone exceeds" in message]
+        assert [message.split()[1] for message in oversized] == ["0", "1"]
+        assert store.oversized == {0, 1}
+    logger.info("✅ Oversized pages warned about once")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_admit_spills_over_budget(), test_budget_counts_blocks(), test_oversized_page_warned_once()]
+    logger.info(f"{sum(results)}/{len(results)} page store tests passed")
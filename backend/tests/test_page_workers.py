@@ -0,0 +1,42 @@
+import subprocess
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.logger import get_logger
+
+logger = get_logger("test_page_workers")
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+
+def imported_after(module: str) -> set:
+    # a fresh interpreter, as a forkserver or spawn worker would start
+    code = f"import sys; import {module}; print(' '.join(sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True)
+    return set(out.stdout.split())
+
+
+def test_worker_module_stays_light():
+    """page and OCR workers import neither torch, transformers nor the database"""
+    modules = imported_after("src.page_workers")
+    assert "src.page_workers" in modules
+    assert "src.ocr_engine" not in modules
+    for heavy in ("torch", "transformers", "src.database", "src.pipeline", "pymongo"):
+        assert heavy not in modules, heavy
+    logger.info("✅ Worker module imports no models and no database")
+    return True
+
+
+def test_page_engine_stays_light():
+    """the page engine pickles worker functions without pulling in the models"""
+    modules = imported_after("src.page_engine")
+    assert "torch" not in modules
+    assert "src.database" not in modules
+    logger.info("✅ Page engine imports no models and no database")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_worker_module_stays_light(), test_page_engine_stays_light()]
+    logger.info(f"{sum(results)}/{len(results)} page worker tests passed")
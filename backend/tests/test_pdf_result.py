@@ -0,0 +1,71 @@
+import sys
+import pickle
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.pdf_result import PDFResult
+from utils.logger import get_logger
+
+logger = get_logger("test_pdf_result")
+
+
+class CountingLoader:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def make_result():
+    full_text = CountingLoader("Revenue 1,234\n--- PAGE BREAK ---\n")
+    sections = CountingLoader({'profit_loss': {'page': 3}})
+    result = PDFResult({'filename': "report.pdf", 'page_count': 12}, {'full_text': full_text, 'sections': sections})
+    return result, full_text, sections
+
+
+def test_fields_are_built_on_first_access():
+    """derived fields stay unbuilt until read, and are built only once"""
+    result, full_text, sections = make_result()
+
+    assert set(result) == {'filename', 'page_count', 'full_text', 'sections'}
+    assert len(result) == 4 and 'full_text' in result
+    assert result.get('filename') == "report.pdf"
+    assert not result.is_computed('full_text') and full_text.calls == 0
+
+    result.materialize('sections')
+    assert sections.calls == 1 and full_text.calls == 0
+
+    assert result['full_text'].startswith("Revenue")
+    assert result['full_text'] and full_text.calls == 1
+    assert result.get('missing') is None
+    logger.info("✅ Derived fields built lazily, once")
+    return True
+
+
+def test_assignment_replaces_a_loader():
+    """a field set directly is never built by its loader"""
+    result, full_text, _ = make_result()
+    result['full_text'] = "override"
+    assert result['full_text'] == "override" and full_text.calls == 0
+    logger.info("✅ Assignment replaces the loader")
+    return True
+
+
+def test_pickles_with_every_field():
+    """pickling builds the pending fields and the copy needs no loaders"""
+    result, full_text, sections = make_result()
+    restored = pickle.loads(pickle.dumps(result))
+
+    assert full_text.calls == 1 and sections.calls == 1
+    assert restored.is_computed('full_text') and restored.is_computed('sections')
+    assert dict(restored) == dict(result)
+    logger.info("✅ Pickling materializes every field")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_fields_are_built_on_first_access(), test_assignment_replaces_a_loader(), test_pickles_with_every_field()]
+    logger.info(f"{sum(results)}/{len(results)} PDF result tests passed")
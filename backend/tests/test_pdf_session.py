@@ -0,0 +1,129 @@
+import sys
+import tempfile
+import threading
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import fitz
+import pytest
+
+from src import pdf_session
+from src.pdf_session import PDFDocumentSession
+from utils.logger import get_logger
+
+logger = get_logger("test_pdf_session")
+
+# a well-formed PDF whose page tree is empty
+EMPTY_PDF = b"""%PDF-1.4
+1 0 obj <</Type /Catalog /Pages 2 0 R>> endobj
+2 0 obj <</Type /Pages /Kids [] /Count 0>> endobj
+trailer <</Root 1 0 R>>
+%%EOF
+"""
+
+
+def write_pdf(path: Path, pages: int = 2):
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"Page {i + 1} revenue 1,234")
+    doc.save(str(path))
+    doc.close()
+
+
+def open_session(path: Path):
+    session = PDFDocumentSession(path)
+    return session, session.open()
+
+
+def test_missing_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        session, result = open_session(Path(tmp) / "missing.pdf")
+    assert result == (False, "File not found")
+    assert session.doc is None and not session.is_valid
+    logger.info("✅ Missing file rejected")
+    return True
+
+
+def test_file_too_large():
+    """the size limit is checked before the file is parsed"""
+    original = pdf_session.MAX_FILE_SIZE_MB
+    pdf_session.MAX_FILE_SIZE_MB = 1
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "large.pdf"
+            with open(path, "wb") as f:
+                f.truncate(2 * 1024 * 1024)
+            session, result = open_session(path)
+    finally:
+        pdf_session.MAX_FILE_SIZE_MB = original
+    assert result == (False, "File too large: 2.0MB > 1MB")
+    assert session.doc is None
+    logger.info("✅ Oversized file rejected")
+    return True
+
+
+def test_pdf_without_pages():
+    """a document that parses but has no pages is rejected and closed"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "empty.pdf"
+        path.write_bytes(EMPTY_PDF)
+        session, result = open_session(path)
+    assert result == (False, "PDF has no pages")
+    assert session.doc is None
+    logger.info("✅ Page-less PDF rejected")
+    return True
+
+
+def test_corrupt_pdf():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "corrupt.pdf"
+        path.write_bytes(b"this is not a pdf")
+        session, (valid, message) = open_session(path)
+    assert not valid and message.startswith("Invalid PDF: ")
+    assert session.doc is None
+    logger.info("✅ Corrupt PDF rejected")
+    return True
+
+
+def test_valid_pdf_is_opened_once():
+    """a valid document is parsed once, shared until close, and unusable after it"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "report.pdf"
+        write_pdf(path, pages=2)
+
+        with PDFDocumentSession(path) as session:
+            assert (session.is_valid, session.message, session.page_count) == (True, "Valid", 2)
+            doc = session.doc
+            assert session.open() == (True, "Valid") and session.doc is doc
+            assert "Page 2" in session.page(1).get_text()
+
+        assert session.doc is None
+        with pytest.raises(RuntimeError, match="is not open"):
+            session.page(0)
+    logger.info("✅ Valid PDF opened once")
+    return True
+
+
+def test_lock_serializes_page_access():
+    """the lock is re-entrant for its holder and excludes other threads"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "report.pdf"
+        write_pdf(path, pages=1)
+
+        with PDFDocumentSession(path) as session:
+            acquired = []
+            with session.lock:
+                with session.lock:
+                    session.page(0)
+                other = threading.Thread(target=lambda: acquired.append(session.lock.acquire(blocking=False)))
+                other.start()
+                other.join()
+            assert acquired == [False]
+    logger.info("✅ Lock serializes page access")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_missing_file(), test_file_too_large(), test_pdf_without_pages(), test_corrupt_pdf(),
+               test_valid_pdf_is_opened_once(), test_lock_serializes_page_access()]
+    logger.info(f"{sum(results)}/{len(results)} PDF session tests passed")
@@ -0,0 +1,111 @@
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.prompt_cache import PrefixStateCache
+from utils.logger import get_logger
+
+logger = get_logger("test_prompt_cache")
+
+MAX_BYTES = 16 * 1024 * 1024
+
+
+class RecordingLlama:
+    """Stands in for llama_cpp.Llama: a state is the tuple of evaluated tokens."""
+
+    def __init__(self):
+        self.tokens = ()
+        self.evaluated = []
+        self.loaded = []
+
+    def tokenize(self, text: bytes, add_bos: bool = True):
+        return [1] + list(text) if add_bos else list(text)
+
+    def reset(self):
+        self.tokens = ()
+
+    def eval(self, tokens):
+        self.evaluated.append(list(tokens))
+        self.tokens += tuple(tokens)
+
+    def save_state(self):
+        return ("state", self.tokens)
+
+    def load_state(self, state):
+        self.loaded.append(state)
+        self.tokens = state[1]
+
+
+def test_prefix_evaluated_once():
+    """the first restore evaluates the prefix; later ones load the saved state"""
+    llm = RecordingLlama()
+    cache = PrefixStateCache(llm, "mistral-7b-q4")
+
+    assert cache.restore("Extract the balance sheet.")
+    assert cache.restore("Extract the balance sheet.")
+    assert len(llm.evaluated) == 1
+    assert llm.loaded[0] == llm.loaded[1] == ("state", tuple(llm.tokenize(b"Extract the balance sheet.")))
+
+    assert cache.restore("Extract the cash flow statement.")
+    assert len(llm.evaluated) == 2
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+    logger.info("✅ Each prefix evaluated once")
+    return True
+
+
+def test_keys_include_model():
+    """the same prefix under another model is a different state"""
+    llm = RecordingLlama()
+    first = PrefixStateCache(llm, "mistral-7b-q4")
+    second = PrefixStateCache(llm, "mistral-7b-q8")
+    assert first.key_for("prefix") != second.key_for("prefix")
+    assert first.key_for("prefix") != first.key_for("prefix ")
+    logger.info("✅ Keys depend on model and prefix")
+    return True
+
+
+def test_states_persist_per_model():
+    """saved states survive a restart, but only for the model that made them"""
+    with tempfile.TemporaryDirectory() as state_dir:
+        first = PrefixStateCache(RecordingLlama(), "mistral-7b-q4", Path(state_dir), MAX_BYTES)
+        first.restore("Extract the income statement.")
+
+        llm = RecordingLlama()
+        restarted = PrefixStateCache(llm, "mistral-7b-q4", Path(state_dir), MAX_BYTES)
+        assert restarted.restore("Extract the income statement.")
+        assert llm.evaluated == []
+        assert restarted.stats()["disk_hits"] == 1
+
+        other_llm = RecordingLlama()
+        other_model = PrefixStateCache(other_llm, "mistral-7b-q8", Path(state_dir), MAX_BYTES)
+        other_model.restore("Extract the income statement.")
+        assert len(other_llm.evaluated) == 1
+    logger.info("✅ States persist per model")
+    return True
+
+
+def test_failed_load_drops_state():
+    """a state the model rejects is forgotten so the next restore evaluates again"""
+    llm = RecordingLlama()
+    cache = PrefixStateCache(llm, "mistral-7b-q4")
+    cache.restore("prefix")
+
+    def reject(state):
+        raise ValueError("state from another context size")
+
+    llm.load_state = reject
+    assert not cache.restore("prefix")
+    assert cache.key_for("prefix") not in cache.states
+    logger.info("✅ Rejected states dropped")
+    return True
+
+
+if __name__ == "__main__":
+    results = [
+        test_prefix_evaluated_once(),
+        test_keys_include_model(),
+        test_states_persist_per_model(),
+        test_failed_load_drops_state()
+    ]
+    logger.info(f"{sum(results)}/{len(results)} prompt cache tests passed")
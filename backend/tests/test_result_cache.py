@@ -0,0 +1,114 @@
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.cache import ResultCache
+from src.config import EXTRACTION_SETTINGS
+from src.models import ExtractionResult, FinancialStatement, LineItem
+from utils.logger import get_logger
+
+logger = get_logger("test_result_cache")
+
+MAX_BYTES = 16 * 1024 * 1024
+
+
+def extraction_result(filename: str = "report.pdf") -> ExtractionResult:
+    return ExtractionResult(
+        filename=filename,
+        processing_time=1.5,
+        statements=[
+            FinancialStatement(
+                statement_type="profit_loss",
+                company_name="Test Company Ltd",
+                currency="AUD",
+                rounding="thousands",
+                financial_years=["2023", "2024"],
+                line_items=[LineItem(label="Revenue", values={"2023": 315.4, "2024": 320.0}, note_references=["3"])]
+            )
+        ]
+    )
+
+
+def test_round_trip():
+    """a stored result comes back equal"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ResultCache(Path(cache_dir), MAX_BYTES)
+        result = extraction_result()
+        assert cache.get("a" * 64) is None
+        assert cache.put("a" * 64, result)
+
+        cached = cache.get("a" * 64)
+        assert cached == result
+        assert cache.stats()["hits"] == 1
+    logger.info("✅ Results round-trip")
+    return True
+
+
+def test_settings_change_the_key():
+    """entries written under other extraction settings are not returned"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        ResultCache(Path(cache_dir), MAX_BYTES).put("a" * 64, extraction_result())
+
+        original = EXTRACTION_SETTINGS.get("layout_grid", False)
+        EXTRACTION_SETTINGS["layout_grid"] = not original
+        try:
+            changed = ResultCache(Path(cache_dir), MAX_BYTES)
+            assert changed.get("a" * 64) is None
+        finally:
+            EXTRACTION_SETTINGS["layout_grid"] = original
+
+        assert ResultCache(Path(cache_dir), MAX_BYTES).get("a" * 64) is not None
+        assert changed.version != ResultCache.pipeline_version()
+    logger.info("✅ Settings are part of the key")
+    return True
+
+
+def test_invalidation():
+    """invalidating one file drops all of its versions and nothing else"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ResultCache(Path(cache_dir), MAX_BYTES)
+        cache.put("a" * 64, extraction_result("a.pdf"))
+        cache.put("b" * 64, extraction_result("b.pdf"))
+        # an entry written by an older pipeline version
+        cache.store.put(f"{'a' * 64}_oldversion", b"{}")
+
+        assert cache.invalidate("a" * 64) == 2
+        assert cache.get("a" * 64) is None
+        assert cache.get("b" * 64).filename == "b.pdf"
+
+        assert cache.invalidate() == 1
+        assert cache.get("b" * 64) is None
+    logger.info("✅ Invalidation by file and in full")
+    return True
+
+
+def test_unreadable_entry_is_dropped():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ResultCache(Path(cache_dir), MAX_BYTES)
+        cache.store.put(cache.key_for("c" * 64), b"not json")
+        assert cache.get("c" * 64) is None
+        assert cache.key_for("c" * 64) not in cache.store
+    logger.info("✅ Unreadable entries discarded")
+    return True
+
+
+def test_only_complete_results_are_cacheable():
+    """results with errors, or fewer statements than sections found, are not cached"""
+    result = extraction_result()
+    assert ResultCache.cacheable(result, sections_found=1)
+    # full-text fallback: no sections, one statement
+    assert ResultCache.cacheable(result, sections_found=0)
+
+    assert not ResultCache.cacheable(result, sections_found=3)
+    assert not ResultCache.cacheable(result.model_copy(update={'errors': ["Error in cash_flow: timeout"]}), sections_found=1)
+    assert not ResultCache.cacheable(result.model_copy(update={'status': "failed"}), sections_found=1)
+    assert not ResultCache.cacheable(result.model_copy(update={'statements': []}), sections_found=0)
+    logger.info("✅ Only complete results are cacheable")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_round_trip(), test_settings_change_the_key(), test_invalidation(), test_unreadable_entry_is_dropped(),
+               test_only_complete_results_are_cacheable()]
+    logger.info(f"{sum(results)}/{len(results)} result cache tests passed")
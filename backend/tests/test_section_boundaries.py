@@ -0,0 +1,68 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.page_model import PageData, WordColumns
+from src.section_boundaries import crop_region, is_continuation
+from utils.logger import get_logger
+
+logger = get_logger("test_section_boundaries")
+
+CHAR_WIDTH = 5.0
+LINE_HEIGHT = 10.0
+PAGE_HEIGHT = 800.0
+
+
+def make_page(page_num: int, lines) -> PageData:
+    """``lines`` is a list of (y, [(text, x0), ...]); each text becomes one or more words."""
+    texts, bboxes = [], []
+    for y, cells in lines:
+        for text, x0 in cells:
+            for word in text.split():
+                texts.append(word)
+                bboxes.append([x0, y, x0 + CHAR_WIDTH * len(word), y + LINE_HEIGHT])
+                x0 += CHAR_WIDTH * (len(word) + 1)
+    return PageData(page_num, WordColumns.from_texts(page_num, texts, bboxes), width=600.0, height=PAGE_HEIGHT)
+
+
+def statement_page(page_num: int) -> PageData:
+    lines = [(40.0, [("Consolidated statement of cash flows", 50)])]
+    for i, label in enumerate(["Receipts from customers", "Payments to suppliers", "Net cash from operating activities"]):
+        lines.append((80.0 + 20 * i, [(label, 50), ("1,234", 400), ("(987)", 480)]))
+    lines.append((PAGE_HEIGHT - 30, [("12", 295)]))
+    return make_page(page_num, lines)
+
+
+def declaration_page(page_num: int) -> PageData:
+    lines = [
+        (40.0, [("Directors' declaration", 50)]),
+        (70.0, [("In the directors' opinion the financial statements and notes set out on pages", 50)]),
+        (90.0, [("12", 50)]),
+        (110.0, [("to 40 comply with the Corporations Act 2001", 50)]),
+        (130.0, [("2024", 50)]),
+    ]
+    return make_page(page_num, lines)
+
+
+def test_page_number_does_not_open_the_table():
+    """a page-number footer is not a figure row, so the table ends on its page"""
+    (_, _, bottom), open_end = crop_region(statement_page(3), 30.0)
+    assert not open_end
+    assert bottom < PAGE_HEIGHT - 60
+    logger.info("✅ Footer page number ignored")
+    return True
+
+
+def test_lone_numbers_are_not_a_continuation():
+    """lines holding a single number do not make the next page a continuation"""
+    assert not is_continuation(declaration_page(4))
+
+    continued = make_page(5, [(40.0 + 20 * i, [(f"Line item {i}", 50), ("1,234", 400), ("987", 480)]) for i in range(3)])
+    assert is_continuation(continued)
+    logger.info("✅ Continuations need figure rows")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_page_number_does_not_open_the_table(), test_lone_numbers_are_not_a_continuation()]
+    logger.info(f"{sum(results)}/{len(results)} section boundary tests passed")
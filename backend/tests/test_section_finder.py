@@ -0,0 +1,159 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.page_model import PageData, WordColumns
+from src.section_finder import SectionFinder
+from utils.logger import get_logger
+
+logger = get_logger("test_section_finder")
+
+CHAR_WIDTH = 5.0
+LINE_HEIGHT = 10.0
+PAGE_HEIGHT = 800.0
+# the detector finds the table running further down than its last figure row
+TABLE_BOTTOM = 300.0
+
+
+def make_page(page_num: int, lines) -> PageData:
+    """``lines`` is a list of (y, [(text, x0), ...]); each text becomes one or more words."""
+    texts, bboxes = [], []
+    for y, cells in lines:
+        for text, x0 in cells:
+            for word in text.split():
+                texts.append(word)
+                bboxes.append([x0, y, x0 + CHAR_WIDTH * len(word), y + LINE_HEIGHT])
+                x0 += CHAR_WIDTH * (len(word) + 1)
+    return PageData(page_num, WordColumns.from_texts(page_num, texts, bboxes), width=600.0, height=PAGE_HEIGHT)
+
+
+def cash_flow_page(page_num: int) -> PageData:
+    lines = [(40.0, [("Consolidated statement of cash flows", 50)])]
+    for i, label in enumerate(["Receipts from customers", "Payments to suppliers", "Net cash from operating activities"]):
+        lines.append((80.0 + 20 * i, [(label, 50), ("1,234", 400), ("(987)", 480)]))
+    return make_page(page_num, lines)
+
+
+def balance_sheet_page(page_num: int, rows: int) -> PageData:
+    lines = [(40.0, [("Consolidated statement of financial position", 50)])]
+    for i in range(rows):
+        lines.append((80.0 + 20 * i, [(f"Asset line {i}", 50), ("1,234", 400), ("(987)", 480)]))
+    return make_page(page_num, lines)
+
+
+def continuation_page(page_num: int) -> PageData:
+    return make_page(page_num, [(40.0 + 20 * i, [(f"Liability line {i}", 50), ("1,234", 400), ("987", 480)]) for i in range(3)])
+
+
+def notes_page(page_num: int) -> PageData:
+    return make_page(page_num, [(40.0, [("Notes to the financial statements", 50)])])
+
+
+def detect_table(page: PageData):
+    page['tables'] = [{'label': 'table', 'score': 0.99, 'bbox': [40.0, 30.0, 560.0, TABLE_BOTTOM]}]
+
+
+def test_streamed_section_is_cropped_to_detected_table():
+    """with the default crop, a section handed out by feed already reaches the table's bottom"""
+    detected = []
+
+    def detect_tables(page: PageData):
+        detected.append(page['page_num'])
+        detect_table(page)
+
+    finder = SectionFinder(detect_tables=detect_tables)
+    found = finder.feed(cash_flow_page(2))
+
+    assert [section_type for section_type, _ in found] == ['cash_flow']
+    (page_num, _, bottom), = found[0][1]['region']
+    assert page_num == 2 and bottom == TABLE_BOTTOM
+    assert detected == [2]
+
+    # nothing left for finish() to re-crop, so the streamed section is final
+    sections, _ = finder.finish([])
+    assert sections['cash_flow'] is found[0][1]
+    logger.info("✅ Streamed section cropped to the detected table")
+    return True
+
+
+def test_failed_detection_falls_back_to_layout():
+    """a detector error leaves the layout crop in place instead of losing the section"""
+    def detect_tables(page: PageData):
+        raise RuntimeError("detector crashed")
+
+    found = SectionFinder(crop=True, detect_tables=detect_tables).feed(cash_flow_page(2))
+    (_, _, bottom), = found[0][1]['region']
+    assert bottom < TABLE_BOTTOM
+    logger.info("✅ Layout crop kept when detection fails")
+    return True
+
+
+def test_feed_reports_a_closed_section_on_its_page():
+    """a table that ends on its heading page is reported by that page's feed"""
+    finder = SectionFinder(crop=True)
+    assert finder.feed(notes_page(0)) == []
+
+    found = finder.feed(balance_sheet_page(1, rows=3))
+    assert [section_type for section_type, _ in found] == ['balance_sheet']
+    section = found[0][1]
+    assert section['page'] == 1 and section['page_range'] == (1, 2)
+    assert "Asset line 2" in section['text'] and "Consolidated" in section['text']
+    assert not finder.complete()
+    logger.info("✅ Closed section streamed from its own page")
+    return True
+
+
+def test_section_continues_onto_next_page():
+    """a table running off the page is held back and reported with its continuation"""
+    finder = SectionFinder(crop=True)
+    # figure rows down to the bottom of the page leave the table open
+    assert finder.feed(balance_sheet_page(3, rows=32)) == []
+    assert 'balance_sheet' in finder.pending
+
+    found = finder.feed(continuation_page(4))
+    assert [section_type for section_type, _ in found] == ['balance_sheet']
+    section = found[0][1]
+    assert section['page_range'] == (3, 5)
+    assert [page_num for page_num, _, _ in section['region']] == [3, 4]
+    assert "Liability line 2" in section['text']
+    assert len(section['text_instances']) == sum(len(words) for words in section['words'])
+    assert finder.pending == {}
+    logger.info("✅ Section continued onto the next page")
+    return True
+
+
+def test_open_section_is_flushed_at_the_end():
+    """a section still waiting when the pages run out is reported by flush"""
+    finder = SectionFinder(crop=True)
+    assert finder.feed(balance_sheet_page(3, rows=32)) == []
+    found = finder.flush()
+    assert [section_type for section_type, _ in found] == ['balance_sheet']
+    assert found[0][1]['page_range'] == (3, 4)
+    logger.info("✅ Open section flushed")
+    return True
+
+
+def test_finish_re_emits_sections_recropped_to_tables():
+    """finish replaces a section whose table reaches further, leaving the streamed one untouched"""
+    finder = SectionFinder(crop=True)
+    page = cash_flow_page(2)
+    (_, streamed), = finder.feed(page)
+    (_, _, streamed_bottom), = streamed['region']
+    assert streamed_bottom < TABLE_BOTTOM
+
+    detect_table(page)
+    sections, fallback = finder.finish([page])
+    final = sections['cash_flow']
+    assert final is not streamed
+    assert final['region'] == [(2, streamed['region'][0][1], TABLE_BOTTOM)]
+    assert streamed['region'][0][2] == streamed_bottom
+    assert fallback is None
+    logger.info("✅ Finish re-emits re-cropped sections")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_streamed_section_is_cropped_to_detected_table(), test_failed_detection_falls_back_to_layout(),
+               test_feed_reports_a_closed_section_on_its_page(), test_section_continues_onto_next_page(),
+               test_open_section_is_flushed_at_the_end(), test_finish_re_emits_sections_recropped_to_tables()]
+    logger.info(f"{sum(results)}/{len(results)} section finder tests passed")
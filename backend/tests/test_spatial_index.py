@@ -0,0 +1,85 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from src.spatial_index import SpatialIndex
+from utils.logger import get_logger
+
+logger = get_logger("test_spatial_index")
+
+
+def random_words(rng: np.random.Generator, count: int) -> np.ndarray:
+    x0 = rng.uniform(0, 560, count)
+    y0 = rng.uniform(0, 780, count)
+    widths = rng.uniform(5, 60, count)
+    heights = rng.uniform(6, 14, count)
+    return np.column_stack((x0, y0, x0 + widths, y0 + heights)).astype(np.float32)
+
+
+def brute_words_in(bboxes: np.ndarray, bbox, min_overlap: float) -> np.ndarray:
+    ix = np.clip(np.minimum(bboxes[:, 2], bbox[2]) - np.maximum(bboxes[:, 0], bbox[0]), 0, None)
+    iy = np.clip(np.minimum(bboxes[:, 3], bbox[3]) - np.maximum(bboxes[:, 1], bbox[1]), 0, None)
+    areas = np.maximum((bboxes[:, 2] - bboxes[:, 0]) * (bboxes[:, 3] - bboxes[:, 1]), 1e-6)
+    keep = (ix * iy) / areas >= min_overlap if min_overlap > 0 else (ix > 0) & (iy > 0)
+    return np.flatnonzero(keep)
+
+
+def brute_distances(bboxes: np.ndarray, bbox) -> np.ndarray:
+    dx = np.maximum(0, np.maximum(bbox[0] - bboxes[:, 2], bboxes[:, 0] - bbox[2]))
+    dy = np.maximum(0, np.maximum(bbox[1] - bboxes[:, 3], bboxes[:, 1] - bbox[3]))
+    return np.hypot(dx, dy)
+
+
+def random_queries(rng: np.random.Generator, count: int):
+    for _ in range(count):
+        x0, y0 = rng.uniform(-50, 600), rng.uniform(-50, 820)
+        yield [x0, y0, x0 + rng.uniform(1, 300), y0 + rng.uniform(1, 200)]
+
+
+def test_words_in_matches_brute_force():
+    """region queries return exactly the words a full scan finds"""
+    rng = np.random.default_rng(11)
+    bboxes = random_words(rng, 2000)
+    index = SpatialIndex(bboxes)
+    for bbox in random_queries(rng, 300):
+        for min_overlap in (0.0, 0.5, 1.0):
+            expected = brute_words_in(bboxes, bbox, min_overlap)
+            assert np.array_equal(index.words_in(bbox, min_overlap), expected), (bbox, min_overlap)
+    logger.info("✅ words_in matches brute force")
+    return True
+
+
+def test_nearest_matches_brute_force():
+    """nearest words are as close as the k closest of a full scan"""
+    rng = np.random.default_rng(12)
+    bboxes = random_words(rng, 1500)
+    index = SpatialIndex(bboxes)
+    for bbox in random_queries(rng, 200):
+        for k in (1, 5, 25):
+            found = index.nearest(bbox, k)
+            expected = np.sort(brute_distances(bboxes, bbox))[:k]
+            assert len(found) == k
+            assert np.allclose(index.distances(bbox, found), expected), (bbox, k)
+    logger.info("✅ nearest matches brute force")
+    return True
+
+
+def test_edge_cases():
+    """empty pages, queries off the page and k beyond the word count"""
+    empty = SpatialIndex(np.zeros((0, 4), dtype=np.float32))
+    assert len(empty.words_in([0, 0, 100, 100])) == 0
+    assert len(empty.nearest([0, 0, 10, 10], 3)) == 0
+
+    bboxes = random_words(np.random.default_rng(13), 10)
+    index = SpatialIndex(bboxes)
+    assert len(index.words_in([5000, 5000, 5100, 5100])) == 0
+    assert sorted(index.nearest([5000, 5000, 5100, 5100], 50).tolist()) == list(range(10))
+    logger.info("✅ Edge cases handled")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_words_in_matches_brute_force(), test_nearest_matches_brute_force(), test_edge_cases()]
+    logger.info(f"{sum(results)}/{len(results)} spatial index tests passed")
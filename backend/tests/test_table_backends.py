@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.table_backends import box_iou, compare_detections
+from utils.logger import get_logger
+
+logger = get_logger("test_table_backends")
+
+
+def table(bbox, confidence: float = 0.95, label: str = "table"):
+    return {"bbox": bbox, "confidence": confidence, "label": label}
+
+
+REFERENCE = [table([50.0, 100.0, 550.0, 700.0], 0.98), table([50.0, 720.0, 550.0, 780.0], 0.81)]
+
+
+def test_box_iou():
+    assert box_iou([0.0, 0.0, 10.0, 10.0], [0.0, 0.0, 10.0, 10.0]) == 1.0
+    assert box_iou([0.0, 0.0, 10.0, 10.0], [20.0, 20.0, 30.0, 30.0]) == 0.0
+    assert abs(box_iou([0.0, 0.0, 10.0, 10.0], [5.0, 0.0, 15.0, 10.0]) - 1 / 3) < 1e-9
+    logger.info("✅ Box IoU")
+    return True
+
+
+def test_identical_detections_are_at_parity():
+    """the same tables in another order match one to one"""
+    report = compare_detections(REFERENCE, list(reversed(REFERENCE)))
+    assert report == {"matched": 2, "missing": 0, "extra": 0, "min_iou": 1.0, "max_score_delta": 0.0, "parity": True}
+    logger.info("✅ Identical detections at parity")
+    return True
+
+
+def test_small_drift_stays_at_parity():
+    """boxes a little off and scores within the tolerance still match"""
+    candidate = [table([51.0, 101.0, 549.0, 701.0], 0.96), table([50.0, 721.0, 550.0, 780.0], 0.84)]
+    report = compare_detections(REFERENCE, candidate)
+    assert report["matched"] == 2 and report["parity"]
+    assert 0.9 <= report["min_iou"] < 1.0
+    assert report["max_score_delta"] == 0.03
+    logger.info("✅ Small drift tolerated")
+    return True
+
+
+def test_mismatches_break_parity():
+    """missing, extra, mislabelled, shifted or rescored tables are reported"""
+    only_first = compare_detections(REFERENCE, REFERENCE[:1])
+    assert only_first["missing"] == 1 and not only_first["parity"]
+
+    extra = compare_detections(REFERENCE[:1], REFERENCE)
+    assert extra["extra"] == 1 and not extra["parity"]
+
+    relabelled = compare_detections(REFERENCE[:1], [table(REFERENCE[0]["bbox"], 0.98, "table rotated")])
+    assert relabelled["matched"] == 0 and relabelled["min_iou"] is None and not relabelled["parity"]
+
+    shifted = compare_detections(REFERENCE[:1], [table([50.0, 200.0, 550.0, 800.0], 0.98)])
+    assert shifted["missing"] == 1 and shifted["extra"] == 1
+
+    rescored = compare_detections(REFERENCE[:1], [table(REFERENCE[0]["bbox"], 0.80)])
+    assert rescored["matched"] == 1 and not rescored["parity"]
+    assert compare_detections(REFERENCE[:1], [table(REFERENCE[0]["bbox"], 0.80)], score_tolerance=0.2)["parity"]
+
+    assert compare_detections([], [])["parity"]
+    logger.info("✅ Mismatches break parity")
+    return True
+
+
+if __name__ == "__main__":
+    results = [test_box_iou(), test_identical_detections_are_at_parity(), test_small_drift_stays_at_parity(),
+               test_mismatches_break_parity()]
+    logger.info(f"{sum(results)}/{len(results)} table backend tests passed")
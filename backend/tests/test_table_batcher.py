@@ -0,0 +1,96 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.table_batcher import TableDetectionBatcher
+from utils.logger import get_logger
+
+logger = get_logger("test_table_batcher")
+
+
+class RecordingDetector:
+    """Stands in for the model call: one table per image, tagged with the image."""
+
+    def __init__(self, fail: bool = False):
+        self.batches = []
+        self.fail = fail
+        self.lock = threading.Lock()
+
+    def __call__(self, images):
+        with self.lock:
+            self.batches.append(list(images))
+        if self.fail:
+            raise RuntimeError("detector crashed")
+        return [[{'label': 'table', 'image': image}] for image in images]
+
+
+def test_batches_concurrent_submissions():
+    """images submitted together share batches and each future gets its own image's result"""
+    detector = RecordingDetector()
+    batcher = TableDetectionBatcher(detector, max_batch_size=4, max_wait_ms=100)
+    try:
+        futures = [batcher.submit(image) for image in range(10)]
+        results = [future.result(timeout=5) for future in futures]
+    finally:
+        batcher.shutdown()
+
+    assert [result[0]['image'] for result in results] == list(range(10))
+    assert all(len(batch) <= 4 for batch in detector.batches)
+    assert len(detector.batches) < 10
+    assert batcher.stats['images'] == 10 and batcher.stats['max_batch'] > 1
+    logger.info(f"✅ 10 images in {len(detector.batches)} batches")
+    return True
+
+
+def test_failure_reaches_every_caller():
+    """a failed batch fails each of its futures instead of leaving them pending"""
+    batcher = TableDetectionBatcher(RecordingDetector(fail=True), max_batch_size=4, max_wait_ms=50)
+    try:
+        futures = [batcher.submit(image) for image in range(3)]
+        for future in futures:
+            assert isinstance(future.exception(timeout=5), RuntimeError)
+    finally:
+        batcher.shutdown()
+    logger.info("✅ Batch failures propagate")
+    return True
+
+
+def test_submit_after_shutdown_fails():
+    batcher = TableDetectionBatcher(RecordingDetector(), max_batch_size=4, max_wait_ms=10)
+    batcher.shutdown()
+    assert isinstance(batcher.submit(0).exception(timeout=1), RuntimeError)
+    logger.info("✅ Stopped batcher rejects work")
+    return True
+
+
+def test_unbatched_detection_runs_inline():
+    """with batching off, detection from a busy pool worker completes instead of queueing behind it"""
+    from src.pdf_processor import PDFProcessor
+
+    processor = object.__new__(PDFProcessor)
+    processor.table_batcher = None
+    processor.model_lock = threading.Lock()
+    processor.ensure_table_model = lambda: True
+    processor.as_page_array = lambda image: image
+    processor.detect_tables_batch = RecordingDetector()
+
+    # every worker of the pool is busy waiting on its own detection
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(lambda image=image: processor.submit_table_detection(image).result(timeout=5)) for image in range(4)]
+        results = [future.result(timeout=10) for future in futures]
+
+    assert [result[0]['image'] for result in results] == list(range(4))
+    logger.info("✅ Unbatched detection does not deadlock")
+    return True
+
+
+if __name__ == "__main__":
+    results = [
+        test_batches_concurrent_submissions(),
+        test_failure_reaches_every_caller(),
+        test_submit_after_shutdown_fails(),
+        test_unbatched_detection_runs_inline()
+    ]
+    logger.info(f"{sum(results)}/{len(results)} table batcher tests passed")